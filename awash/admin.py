@@ -1,6 +1,14 @@
 from django.contrib import admin
-from .models import Employee
+from .models import Employee, Position
 # Register your models here.
 
 
 admin.site.register(Employee)
+
+
+@admin.register(Position)
+class PositionAdmin(admin.ModelAdmin):
+    list_display = ("title", "grade", "is_active")
+    list_filter = ("is_active", "grade")
+    search_fields = ("title",)
+    readonly_fields = ("grade",)
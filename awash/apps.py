@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AwashConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'awash'
+
+    def ready(self):
+        from awash import signals  # noqa: F401 — registers the signal handlers
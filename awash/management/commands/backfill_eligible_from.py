@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+
+from awash.models import PROMOTION_COOLDOWN, Employee, Promotion
+
+
+class Command(BaseCommand):
+    help = "Recompute Employee.last_promotion_date and eligible_from from the Promotion history"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report how many rows would change")
+        parser.add_argument("--batch-size", type=int, default=2000, help="Rows per bulk update")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        latest = dict(
+            Promotion.objects.values("employee_id")
+            .annotate(latest=Max("promoted_at"))
+            .values_list("employee_id", "latest")
+        )
+
+        changed = []
+        employees = Employee.objects.only("id", "last_promotion_date", "eligible_from")
+        for employee in employees.iterator(chunk_size=batch_size):
+            # Employees without promotion records keep a manually entered date
+            last = latest.get(employee.id, employee.last_promotion_date)
+            eligible_from = last + PROMOTION_COOLDOWN if last else None
+            if employee.last_promotion_date != last or employee.eligible_from != eligible_from:
+                employee.last_promotion_date = last
+                employee.eligible_from = eligible_from
+                changed.append(employee)
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Dry run — {len(changed)} employees would be updated."))
+            return
+
+        with transaction.atomic():
+            Employee.objects.bulk_update(changed, ["last_promotion_date", "eligible_from"], batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"Updated eligibility for {len(changed)} employees."))
@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+from awash.utils import metrics
+from awash.utils.benchmark import (
+    DEFAULT_SCALES,
+    DEFAULT_THRESHOLD,
+    ViewBenchmark,
+    compare,
+    load_report,
+    save_report,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed throwaway databases of increasing size, drive the main views with the test client "
+        "and report latency percentiles, throughput, query counts and peak memory as JSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scales",
+            default=",".join(str(scale) for scale in DEFAULT_SCALES),
+            help="Comma-separated fractions of the production volumes (see seed_data)",
+        )
+        parser.add_argument("--requests", type=int, default=30, help="Measured requests per view and scale")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--output",
+            default=os.path.join(tempfile.gettempdir(), "awash-benchmark.json"),
+            help="Where to write the JSON report (default: %(default)s)",
+        )
+        parser.add_argument("--baseline", help="Earlier report to compare against")
+        parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed p95 growth (0.25 = 25%%)")
+        parser.add_argument("--fail-on-regression", action="store_true", help="Exit with an error on any regression")
+
+    def handle(self, *args, **options):
+        try:
+            scales = [float(scale) for scale in options["scales"].split(",") if scale.strip()]
+        except ValueError:
+            raise CommandError("--scales must be comma-separated numbers, e.g. 0.001,0.01")
+        baseline = load_report(options["baseline"]) if options["baseline"] else None
+
+        # A file-backed test database, so the numbers reflect disk I/O like production does
+        workdir = tempfile.mkdtemp(prefix="awash-bench-")
+        connection.settings_dict.setdefault("TEST", {})["NAME"] = os.path.join(workdir, "bench.sqlite3")
+        # The benchmark's requests must not land in the deployment's /metrics
+        metrics_setting = override_settings(METRICS_DIR=os.path.join(workdir, "metrics"))
+        metrics_setting.enable()
+        metrics.reset_store()
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            benchmark = ViewBenchmark(requests=options["requests"], seed=options["seed"], log=self.stdout.write)
+            report = benchmark.run(scales)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+            metrics.reset_store()
+            metrics_setting.disable()
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        save_report(report, options["output"])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+
+        if baseline is None:
+            return
+        lines, regressions = compare(report, baseline, options["threshold"])
+        self.stdout.write(f"\nCompared with {options['baseline']}:")
+        for line in lines:
+            style = self.style.ERROR if line in regressions else (lambda text: text)
+            self.stdout.write(style(line))
+        if regressions:
+            message = f"{len(regressions)} view/scale pairs regressed."
+            if options["fail_on_regression"]:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS("No regressions."))
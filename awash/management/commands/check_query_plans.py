@@ -0,0 +1,124 @@
+import re
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from awash.models import Application, Employee, Job
+from awash.utils import queries
+from awash.utils.employee_lookup import lookup_query
+from awash.utils.pagination import keyset_older
+from awash.utils.sweeper import expired_job_ids
+
+# "SCAN awash_job" reads the whole table, and "SCAN awash_job USING [COVERING] INDEX ..."
+# reads all of it in index order; only a SEARCH is bounded by the index
+FULL_SCAN_RE = re.compile(r"^SCAN (\w+)")
+
+# Sorting rows that came out of a full scan; harmless after a bounded index search
+TEMP_SORT = "USE TEMP B-TREE FOR ORDER BY"
+
+PAGE = 26  # DEFAULT_PAGE_SIZE + 1, as keyset_paginate reads
+
+# applicants page filters, each checked for its page and its per-job totals
+APPLICANT_FILTER_CASES = [
+    ("one job", {"job": "1"}),
+    ("date range", {"date_from": "2024-01-01", "date_to": "2024-12-31"}),
+    ("vacancy type", {"vacancy_type": "internal"}),
+    ("employee ID prefix", {"employee_id": "AIB/0001"}),
+]
+
+
+def hot_queries():
+    """
+    The queries behind the busiest pages, with representative parameters.
+
+    Built from the same helpers the views use (awash/utils/queries.py and
+    friends), so a change to a view's query changes the plan checked here.
+    """
+    today = date.today()
+    employee, job = Employee(id=1), Job(id=1)
+    applications = Application.objects.all()
+    newest = (timezone.now(), 1)
+    checks = [
+        ("all_jobs: first page", keyset_older(queries.job_list(), "posted_date")[:PAGE]),
+        ("all_jobs: next page", keyset_older(queries.job_list(), "posted_date", newest)[:PAGE]),
+        ("all_jobs: applied markers", queries.applied_job_ids(employee, [1, 2, 3])),
+        ("hr_dashboard: recent jobs", queries.recent_jobs()),
+        ("sweeper: expired jobs", expired_job_ids(today, 1000)),
+        ("applicants: first page", keyset_older(queries.applicant_rows(applications), "applied_at")[:PAGE]),
+        ("applicants: next page", keyset_older(queries.applicant_rows(applications), "applied_at", newest)[:PAGE]),
+        ("applicants: per-job totals", queries.job_totals(applications)),
+    ]
+    for name, params in APPLICANT_FILTER_CASES:
+        _, filtered = queries.filter_applications(params)
+        checks.append((f"applicants: {name}", keyset_older(queries.applicant_rows(filtered), "applied_at")[:PAGE]))
+        checks.append((f"applicants: per-job totals for {name}", queries.job_totals(filtered)))
+    return checks + [
+        ("my_applications", queries.employee_applications(employee)),
+        ("view_applicants_per_job", keyset_older(queries.job_applicants(job), "applied_at")[:PAGE]),
+        ("promotion_list", queries.promotion_rows()[:PAGE]),
+        ("delete_promotion: latest promotion", queries.employee_promotions(employee)[:1]),
+        ("eligible_employees", queries.eligible_employee_rows(0, 50)),
+        ("employee_search", queries.employee_search_rows("ab", 0, 20)),
+        ("get_employee", lookup_query("AIB/1/2020")),
+        ("users", queries.user_rows()[:PAGE]),
+    ]
+
+
+def query_plan(queryset):
+    """EXPLAIN QUERY PLAN rows as (id, parent, detail)."""
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return [(row[0], row[1], row[-1]) for row in cursor.fetchall()]
+
+
+def full_scans(plan, limited=False):
+    """
+    Tables the plan reads in full.
+
+    A scan under a LIMIT stops after a page of rows, unless a temp B-tree
+    (GROUP BY, ORDER BY) has to see every row first. A scan on the inner side
+    of a join runs once per outer row the join has already narrowed. Neither
+    counts; every other SCAN step does, index order or not.
+    """
+    if limited and not any(parent == 0 and detail.startswith("USE TEMP B-TREE") for _, parent, detail in plan):
+        return []
+    scans, seen_parents = [], set()
+    for _, parent, detail in plan:
+        match = FULL_SCAN_RE.match(detail)
+        is_loop = detail.startswith(("SCAN ", "SEARCH "))
+        if match and parent not in seen_parents:
+            scans.append(match.group(1))
+        if is_loop:
+            seen_parents.add(parent)
+    return scans
+
+
+class Command(BaseCommand):
+    help = "Run EXPLAIN QUERY PLAN over the hot view queries and fail if any of them scans a whole table"
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("EXPLAIN QUERY PLAN output is SQLite-specific.")
+
+        failures = []
+        for name, queryset in hot_queries():
+            plan = query_plan(queryset)
+            steps = [detail for _, _, detail in plan]
+            scans = full_scans(plan, limited=queryset.query.is_sliced)
+            if scans:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f"FULL SCAN  {name}: {', '.join(scans)}"))
+            elif TEMP_SORT in steps:
+                self.stdout.write(self.style.WARNING(f"TEMP SORT  {name}"))
+            else:
+                self.stdout.write(f"ok         {name}")
+            if options["verbosity"] > 1 or scans:
+                for step in steps:
+                    self.stdout.write(f"             {step}")
+
+        if failures:
+            raise CommandError(f"{len(failures)} hot queries do a full table scan.")
+        self.stdout.write(self.style.SUCCESS("No full table scans in the hot queries."))
@@ -0,0 +1,49 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from awash.utils.sweeper import deactivate_expired_jobs, run_periodic_sweeper
+
+
+class Command(BaseCommand):
+    help = "Mark every active job whose deadline has passed as inactive"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, help="Update in batches of this many rows (default: one UPDATE)")
+        parser.add_argument("--time-budget", type=float, help="Stop starting new batches after this many seconds")
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, sweeping every --interval seconds (for a dedicated worker process)",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=getattr(settings, "JOB_SWEEP_INTERVAL", None) or 300,
+            help="Seconds between sweeps with --loop (default: settings.JOB_SWEEP_INTERVAL)",
+        )
+
+    def handle(self, *args, **options):
+        if options["loop"]:
+            self.stdout.write(f"Sweeping expired jobs every {options['interval']:g}s; Ctrl+C to stop.")
+            try:
+                run_periodic_sweeper(
+                    options["interval"],
+                    batch_size=options["batch_size"] or 1000,
+                    time_budget=options["time_budget"] if options["time_budget"] is not None else 5.0,
+                )
+            except KeyboardInterrupt:
+                pass
+            return
+
+        started = time.monotonic()
+        changed, finished = deactivate_expired_jobs(
+            batch_size=options["batch_size"], time_budget=options["time_budget"]
+        )
+        elapsed = time.monotonic() - started
+        message = f"Deactivated {changed} expired jobs in {elapsed:.2f}s."
+        if finished:
+            self.stdout.write(self.style.SUCCESS(message))
+        else:
+            self.stdout.write(self.style.WARNING(f"{message} Time budget reached; run again to finish."))
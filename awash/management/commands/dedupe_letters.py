@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from awash.models import Application, LetterBlob
+
+
+class Command(BaseCommand):
+    help = (
+        "Move recommendation letters uploaded before content-addressed storage into it, "
+        "merge identical files and rebuild the LetterBlob reference counts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only report what would be moved")
+
+    def handle(self, *args, **options):
+        storage = Application._meta.get_field("recommendation_letter").storage
+        legacy = (
+            Application.objects.exclude(recommendation_letter="")
+            .exclude(recommendation_letter__isnull=True)
+            .exclude(recommendation_letter__in=LetterBlob.objects.values("name"))
+            .only("id", "recommendation_letter")
+        )
+
+        moved, missing, freed = 0, 0, 0
+        old_names = set()
+        for application in legacy.iterator(chunk_size=500):
+            old_name = application.recommendation_letter.name
+            if not storage.exists(old_name):
+                missing += 1
+                continue
+            if options["dry_run"]:
+                moved += 1
+                continue
+            with storage.open(old_name) as handle:
+                new_name = storage.save(old_name, handle)
+            if new_name != old_name:
+                # update() so the post_save ref counting doesn't run; counts are rebuilt below
+                Application.objects.filter(id=application.id).update(recommendation_letter=new_name)
+                old_names.add(old_name)
+                moved += 1
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Dry run — {moved} letters would be moved, {missing} files missing."))
+            return
+
+        for old_name in old_names:
+            if not Application.objects.filter(recommendation_letter=old_name).exists():
+                freed += storage.size(old_name)
+                storage.delete(old_name)
+
+        with transaction.atomic():
+            LetterBlob.objects.all().delete()
+            LetterBlob.objects.bulk_create(
+                LetterBlob(name=row["recommendation_letter"], size=storage.size(row["recommendation_letter"]), ref_count=row["refs"])
+                for row in Application.objects.exclude(recommendation_letter="")
+                .exclude(recommendation_letter__isnull=True)
+                .values("recommendation_letter")
+                .annotate(refs=Count("id"))
+                .order_by()
+                if storage.exists(row["recommendation_letter"])
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Moved {moved} letters into content-addressed storage, freed {freed:,} bytes, "
+            f"{missing} files missing; {LetterBlob.objects.count()} distinct letters stored."
+        ))
@@ -1,26 +1,119 @@
 # employees/management/commands/import_employees.py
-import pandas as pd
-from django.core.management.base import BaseCommand
+from itertools import chain
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
 from awash.models import Employee
+from awash.utils.employee_import import DEFAULT_BATCH_SIZE, iter_sheet_rows
+
+# Spreadsheet column -> Employee field. "department" is the pre-rename name of position.
+COLUMN_FIELDS = {
+    "full_name": "full_name",
+    "position": "position",
+    "department": "position",
+    "email": "email",
+    "phone": "phone",
+}
+
 
 class Command(BaseCommand):
-    help = "Import employees from Excel file"
+    help = (
+        "Sync employees from an Excel file. Only new and changed rows are written; "
+        "employees missing from the file are reported but left in place."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument("file_path", type=str, help="Path to Excel file")
+        parser.add_argument("--sheet", help="Sheet to read (default: first sheet)")
+        parser.add_argument("--dry-run", action="store_true", help="Report the delta without writing")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per bulk write")
+        parser.add_argument("--show", type=int, default=10, help="Example rows to list per section")
 
     def handle(self, *args, **kwargs):
-        file_path = kwargs["file_path"]
-        df = pd.read_excel(file_path)
-
-        for _, row in df.iterrows():
-            Employee.objects.update_or_create(
-                employee_id=row["employee_id"],
-                defaults={
-                    "full_name": row["full_name"],
-                    "department": row.get("department", ""),
-                    "email": row.get("email", ""),
-                    "phone": row.get("phone", ""),
-                }
+        rows = iter_sheet_rows(kwargs["file_path"], kwargs["sheet"])
+        first = next(rows, None)
+        if first is None:
+            raise CommandError("The sheet is empty.")
+        if "employee_id" not in first:
+            raise CommandError("The sheet has no employee_id column.")
+        fields = sorted({field for column, field in COLUMN_FIELDS.items() if column in first})
+
+        incoming, invalid = self.read_incoming(first, rows, fields)
+        current = {
+            row[1]: (row[0], self.fingerprint(row[2:]))
+            for row in Employee.objects.values_list("id", "employee_id", *fields)
+        }
+
+        incoming_keys, current_keys = incoming.keys(), current.keys()
+        inserts = incoming_keys - current_keys
+        disappeared = current_keys - incoming_keys
+        changes = {key for key in incoming_keys & current_keys if incoming[key] != current[key][1]}
+
+        self.report("New", inserts, kwargs["show"])
+        self.report("Changed", changes, kwargs["show"])
+        self.report("Missing from file", disappeared, kwargs["show"])
+        unchanged = len(incoming) - len(inserts) - len(changes)
+        summary = (
+            f"{len(inserts)} new, {len(changes)} changed, {unchanged} unchanged, "
+            f"{len(disappeared)} missing from file, {invalid} invalid rows"
+        )
+        if kwargs["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Dry run — nothing written. {summary}"))
+            return
+
+        batch_size = kwargs["batch_size"]
+        with transaction.atomic():
+            Employee.objects.bulk_create(
+                [Employee(employee_id=key, **self.values(fields, incoming[key])) for key in sorted(inserts)],
+                batch_size=batch_size,
             )
-        self.stdout.write(self.style.SUCCESS("Employees imported successfully!"))
+            if changes and fields:
+                Employee.objects.bulk_update(
+                    [Employee(id=current[key][0], **self.values(fields, incoming[key])) for key in sorted(changes)],
+                    fields,
+                    batch_size=batch_size,
+                )
+        self.stdout.write(self.style.SUCCESS(f"Employees synced: {summary}"))
+
+    def read_incoming(self, first, rows, fields):
+        """Map employee_id -> fingerprint for every usable row; later duplicates win."""
+        incoming = {}
+        invalid = 0
+        for row in chain([first], rows):
+            invalid += self.add_row(incoming, row, fields)
+        return incoming, invalid
+
+    def add_row(self, incoming, row, fields):
+        employee_id = row.get("employee_id", "")
+        if not employee_id:
+            return 1
+        if "full_name" in fields and not row.get("full_name"):
+            return 1
+        values = {field: "" for field in fields}
+        for column, field in COLUMN_FIELDS.items():
+            if row.get(column):
+                values[field] = row[column]
+        incoming[employee_id] = self.fingerprint(values[field] for field in fields)
+        return 0
+
+    @staticmethod
+    def fingerprint(values):
+        # None and "" both mean "blank" so an empty cell doesn't count as a change
+        return tuple((value or "").strip() for value in values)
+
+    @staticmethod
+    def values(fields, fingerprint):
+        return {
+            field: value if value or field == "full_name" else None
+            for field, value in zip(fields, fingerprint)
+        }
+
+    def report(self, title, keys, limit):
+        if not keys or not limit:
+            return
+        self.stdout.write(f"{title} ({len(keys)}):")
+        for key in sorted(keys)[:limit]:
+            self.stdout.write(f"  {key}")
+        if len(keys) > limit:
+            self.stdout.write(f"  … and {len(keys) - limit} more")
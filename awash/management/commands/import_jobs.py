@@ -0,0 +1,50 @@
+import csv
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from awash.utils.employee_import import iter_sheet_rows
+from awash.utils.job_posting import build_jobs, post_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Post vacancies from a CSV or Excel file in one transaction. Columns match the "
+        "post_job form: title, deadline (YYYY-MM-DD), description, qualification, experience, "
+        "employment_type, job_category, duty_station, job_grade, vacancy_type, is_active."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("file_path", type=str, help="Path to a .csv or .xlsx file")
+        parser.add_argument("--sheet", help="Sheet to read from an Excel file (default: first sheet)")
+        parser.add_argument("--dry-run", action="store_true", help="Validate the rows without posting")
+
+    def handle(self, *args, **options):
+        path = Path(options["file_path"])
+        if not path.exists():
+            raise CommandError(f"{path} does not exist.")
+
+        if path.suffix.lower() == ".csv":
+            with path.open(newline="", encoding="utf-8-sig") as handle:
+                rows = [{key.strip().lower(): value for key, value in row.items() if key} for row in csv.DictReader(handle)]
+        else:
+            rows = list(iter_sheet_rows(path, options["sheet"]))
+
+        jobs, errors = build_jobs(rows)
+        for number, messages in errors.items():
+            # +1 for the header row so numbers match the spreadsheet
+            self.stdout.write(self.style.ERROR(f"Row {number + 1}: {'; '.join(messages)}"))
+        if errors:
+            raise CommandError(f"{len(errors)} invalid rows; nothing was posted.")
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Dry run — {len(jobs)} jobs are valid."))
+            return
+
+        created = post_jobs(jobs)
+        if created:
+            self.stdout.write(self.style.SUCCESS(
+                f"Posted {len(created)} jobs ({created[0].vacancy_number} … {created[-1].vacancy_number})."
+            ))
+        else:
+            self.stdout.write("No jobs to post.")
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from awash.utils.counters import find_drift, rebuild_counters
+
+
+class Command(BaseCommand):
+    help = "Rebuild the HR dashboard counters from the source tables and report any drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift; exit with an error if any counter is off",
+        )
+
+    def handle(self, *args, **options):
+        drift = find_drift()
+        for key in sorted(drift):
+            stored, actual = drift[key]
+            self.stdout.write(f"{key}: stored {stored}, actual {actual}")
+
+        if options["check"]:
+            if drift:
+                raise CommandError(f"{len(drift)} counter(s) have drifted.")
+            self.stdout.write(self.style.SUCCESS("Counters are in sync."))
+            return
+
+        counts = rebuild_counters()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {len(counts)} counters ({len(drift)} had drifted)."
+        ))
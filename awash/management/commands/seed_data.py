@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from awash.utils.synthetic import DEFAULT_PASSWORD, DEFAULT_VOLUMES, SyntheticData
+
+
+class Command(BaseCommand):
+    help = "Fill the database with synthetic employees, jobs, applications and promotions for scale testing"
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_VOLUMES.items():
+            parser.add_argument(f"--{name}", type=int, default=default, help=f"Rows to create (default {default:,})")
+        parser.add_argument("--scale", type=float, default=1.0, help="Multiply every volume, e.g. 0.01 for a quick run")
+        parser.add_argument("--seed", type=int, default=None, help="Random seed for a reproducible dataset")
+        parser.add_argument("--prefix", default="SYN", help="Employee ID prefix, kept apart from real IDs")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--password", default=DEFAULT_PASSWORD, help="Password shared by every generated user")
+
+    def handle(self, *args, **options):
+        volumes = {name: int(options[name] * options["scale"]) for name in DEFAULT_VOLUMES}
+        generator = SyntheticData(
+            seed=options["seed"],
+            prefix=options["prefix"],
+            batch_size=options["batch_size"],
+            password=options["password"],
+            log=self.stdout.write,
+        )
+        started = time.perf_counter()
+        try:
+            created = generator.generate(**volumes)
+        except ValueError as exc:
+            raise CommandError(exc)
+        summary = ", ".join(f"{count:,} {name}" for name, count in created.items())
+        self.stdout.write(self.style.SUCCESS(f"Created {summary} in {time.perf_counter() - started:.0f}s."))
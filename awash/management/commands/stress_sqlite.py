@@ -0,0 +1,104 @@
+import statistics
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, transaction
+
+from awash.utils.db import sqlite_pragmas
+
+PROBE_TABLE = "awash_stress_probe"
+
+
+class Command(BaseCommand):
+    help = (
+        "Hammer the database with concurrent writers (read-then-write transactions, like an "
+        "application submission) and readers, and report lock errors and latency"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=16)
+        parser.add_argument("--writes", type=int, default=100, help="Transactions per writer")
+        parser.add_argument("--readers", type=int, default=4)
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("This stress test targets the SQLite profile.")
+
+        self.stdout.write(f"DB_PROFILE={settings.DB_PROFILE} {sqlite_pragmas(connection)}")
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {PROBE_TABLE}")
+            cursor.execute(f"CREATE TABLE {PROBE_TABLE} (id INTEGER PRIMARY KEY, writer INTEGER, seq INTEGER)")
+
+        latencies, errors, reads = [], [], [0]
+        lock = threading.Lock()
+        start = threading.Barrier(options["writers"] + options["readers"])
+        done = threading.Event()
+
+        def writer(number):
+            start.wait()
+            try:
+                for _ in range(options["writes"]):
+                    began = time.perf_counter()
+                    try:
+                        with transaction.atomic(), connection.cursor() as cursor:
+                            cursor.execute(f"SELECT COUNT(*) FROM {PROBE_TABLE} WHERE writer = %s", [number])
+                            seq = cursor.fetchone()[0]
+                            cursor.execute(f"INSERT INTO {PROBE_TABLE} (writer, seq) VALUES (%s, %s)", [number, seq])
+                    except OperationalError as exc:
+                        with lock:
+                            errors.append(str(exc))
+                        continue
+                    with lock:
+                        latencies.append(time.perf_counter() - began)
+            finally:
+                connection.close()
+
+        def reader():
+            start.wait()
+            try:
+                while not done.is_set():
+                    try:
+                        with connection.cursor() as cursor:
+                            cursor.execute(f"SELECT COUNT(*), MAX(seq) FROM {PROBE_TABLE}")
+                            cursor.fetchone()
+                    except OperationalError as exc:
+                        with lock:
+                            errors.append(str(exc))
+                    with lock:
+                        reads[0] += 1
+            finally:
+                connection.close()
+
+        writers = [threading.Thread(target=writer, args=(n,)) for n in range(options["writers"])]
+        readers = [threading.Thread(target=reader) for _ in range(options["readers"])]
+        began = time.perf_counter()
+        for thread in writers + readers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        elapsed = time.perf_counter() - began
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {PROBE_TABLE}")
+            committed = cursor.fetchone()[0]
+            cursor.execute(f"DROP TABLE {PROBE_TABLE}")
+
+        expected = options["writers"] * options["writes"]
+        if latencies:
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            self.stdout.write(
+                f"{committed}/{expected} writes committed in {elapsed:.2f}s "
+                f"({committed / elapsed:.0f}/s), {reads[0]} reads; write latency "
+                f"p50 {statistics.median(latencies) * 1000:.1f} ms, p99 {p99 * 1000:.1f} ms"
+            )
+        if errors:
+            for message, count in sorted({e: errors.count(e) for e in errors}.items()):
+                self.stdout.write(self.style.ERROR(f"{count} x {message}"))
+            raise CommandError(f"{len(errors)} operations failed under contention.")
+        self.stdout.write(self.style.SUCCESS("No lock errors."))
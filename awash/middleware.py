@@ -0,0 +1,226 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+from awash.utils import metrics
+from awash.utils.profiling import RequestProfile, profiling_options
+
+logger = logging.getLogger("awash.requests")
+
+DEFAULT_TIMING = {
+    "SLOW_REQUEST_MS": 500,
+    "SLOW_QUERY_MS": 100,
+    "MAX_QUERIES": 50,
+    # True for every response, "staff" for staff users only; it reveals query counts and timings
+    "SERVER_TIMING_HEADER": False,
+}
+
+# Stats of the request being handled on this thread/task, or None
+_current = ContextVar("awash_request_stats", default=None)
+
+# SQLite steps through a result as its rows are fetched, so this is DB time too
+FETCH_METHODS = ("fetchone", "fetchmany", "fetchall")
+
+
+class RequestStats:
+    """
+    Counters for one request; also the ``execute_wrapper`` that feeds them.
+
+    The wrapper only adds two perf_counter() calls and a few attribute
+    updates per query — the SQL text is kept by reference, never formatted.
+    ``db_time`` also covers the cursor's fetchone/fetchmany/fetchall calls,
+    which is how the ORM reads rows; ``slowest`` is execute time alone.
+    """
+
+    __slots__ = ("queries", "db_time", "slowest", "slowest_sql", "template_time")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.slowest = 0.0
+        self.slowest_sql = None
+        self.template_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        cursor = context["cursor"]
+        if "fetchone" not in vars(cursor):
+            for name in FETCH_METHODS:
+                setattr(cursor, name, self.timed_fetch(getattr(cursor, name)))
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.queries += 1
+            self.db_time += elapsed
+            if elapsed > self.slowest:
+                self.slowest = elapsed
+                self.slowest_sql = sql
+
+    def timed_fetch(self, fetch):
+        def fetch_rows(*args):
+            started = time.perf_counter()
+            try:
+                return fetch(*args)
+            finally:
+                self.db_time += time.perf_counter() - started
+        return fetch_rows
+
+
+def current_stats():
+    """RequestStats of the request being handled, or None outside RequestTimingMiddleware."""
+    return _current.get()
+
+
+class RequestTimingMiddleware:
+    """
+    Measure every request: wall time, SQL query count and time, template
+    render time and the slowest query.
+
+    When settings.REQUEST_TIMING thresholds are crossed the numbers are
+    logged as one JSON line on the ``awash.requests`` logger, and with
+    SERVER_TIMING_HEADER on they also go out in a ``Server-Timing`` header
+    (visible in the browser's network panel). Works with DEBUG off since it
+    doesn't rely on connection.queries. Template time needs the
+    awash.template_backends.TimedDjangoTemplates backend. ``db`` covers
+    executing queries and fetching their rows. DB time spent while rendering
+    (a lazy queryset evaluated by the template) counts towards both ``db``
+    and ``tpl``; queries run while a streaming response is consumed are not
+    seen.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.options = {**DEFAULT_TIMING, **getattr(settings, "REQUEST_TIMING", {})}
+
+    def send_server_timing(self, request):
+        option = self.options["SERVER_TIMING_HEADER"]
+        if option == "staff":
+            # Only a user the request already loaded: looking it up here would add two queries
+            user = getattr(request, "_cached_user", None)
+            return user is not None and user.is_staff
+        return bool(option)
+
+    def __call__(self, request):
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(stats):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        duration = time.perf_counter() - started
+        request.awash_stats = stats
+
+        if self.send_server_timing(request):
+            response["Server-Timing"] = (
+                f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries", '
+                f"tpl;dur={stats.template_time * 1000:.1f}, "
+                f"total;dur={duration * 1000:.1f}"
+            )
+
+        if (
+            duration * 1000 >= self.options["SLOW_REQUEST_MS"]
+            or stats.slowest * 1000 >= self.options["SLOW_QUERY_MS"]
+            or stats.queries > self.options["MAX_QUERIES"]
+        ):
+            match = getattr(request, "resolver_match", None)
+            logger.warning(json.dumps({
+                "event": "slow_request",
+                "method": request.method,
+                "path": request.path,
+                "view": match.view_name if match else None,
+                "status": response.status_code,
+                "duration_ms": round(duration * 1000, 1),
+                "queries": stats.queries,
+                "db_ms": round(stats.db_time * 1000, 1),
+                "template_ms": round(stats.template_time * 1000, 1),
+                "slowest_query_ms": round(stats.slowest * 1000, 1),
+                "slowest_query": (stats.slowest_sql or "")[:500],
+            }))
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Feed the Prometheus metrics served at /metrics (see awash.utils.metrics).
+
+    Requests are labelled with their URL name from awash/urls.py, or
+    "unmatched" for 404s outside it, so arbitrary paths can't blow up the
+    number of series. Query counts come from RequestTimingMiddleware, which
+    must sit inside this one.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        match = getattr(request, "resolver_match", None)
+        view = (match.url_name if match else None) or "unmatched"
+        metrics.observe("awash_http_request_duration_seconds", duration, view=view)
+        metrics.inc("awash_http_requests_total", view=view, method=request.method, status=str(response.status_code))
+        stats = getattr(request, "awash_stats", None)
+        if stats is not None and stats.queries:
+            metrics.inc("awash_db_queries_total", stats.queries, view=view)
+            metrics.inc("awash_db_query_seconds_total", stats.db_time, view=view)
+        return response
+
+
+class ProfilerMiddleware:
+    """
+    Profile one request on demand: a staff user adds ``?profile=1`` (or
+    sends an ``X-Profile`` header) and the rest of the middleware chain and
+    the view run under cProfile and a stack sampler. The .prof and
+    flamegraph-ready .collapsed files are listed at /profiles/, and the
+    response names them in its ``X-Profile`` header.
+
+    Must come after AuthenticationMiddleware. Requests without the switch
+    only pay a substring test on the query string and a META lookup;
+    settings.PROFILING = {"DIR": None} removes the middleware altogether.
+
+    Only the work done before the response is returned is profiled. The
+    body of a StreamingHttpResponse or FileResponse (exports, letter ZIPs,
+    downloads) is produced later, while the server sends it, so those
+    profiles cover the view's setup only; they are marked "streaming".
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        options = profiling_options()
+        if not options["DIR"]:
+            raise MiddlewareNotUsed
+        self.param = options["QUERY_PARAM"]
+        self.meta_key = "HTTP_" + options["HEADER"].upper().replace("-", "_")
+        self.interval = options["SAMPLE_INTERVAL_MS"] / 1000
+
+    def wants_profile(self, request):
+        if self.meta_key in request.META:
+            return True
+        return self.param in request.META.get("QUERY_STRING", "") and self.param in request.GET
+
+    def __call__(self, request):
+        if not self.wants_profile(request) or not request.user.is_staff:
+            return self.get_response(request)
+
+        with RequestProfile(self.interval) as profile:
+            response = self.get_response(request)
+        match = getattr(request, "resolver_match", None)
+        response["X-Profile"] = profile.save({
+            "method": request.method,
+            "path": request.get_full_path(),
+            "view": match.url_name if match else None,
+            "user": request.user.get_username(),
+            "status": response.status_code,
+            "streaming": response.streaming,
+        })
+        return response
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+FTS_COLUMNS = "title, description, qualification, job_category, duty_station"
+
+
+def create_job_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS awash_job_fts USING fts5({FTS_COLUMNS}, tokenize='porter unicode61')"
+    )
+    schema_editor.execute(
+        f"INSERT INTO awash_job_fts (rowid, {FTS_COLUMNS}) SELECT id, {FTS_COLUMNS} FROM awash_job"
+    )
+
+
+def drop_job_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS awash_job_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0013_allemployee_record'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_job_fts, drop_job_fts),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:50
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    Job = apps.get_model("awash", "Job")
+    Application = apps.get_model("awash", "Application")
+    Promotion = apps.get_model("awash", "Promotion")
+    DashboardCounter = apps.get_model("awash", "DashboardCounter")
+
+    counts = {"jobs:active": 0, "jobs:inactive": 0}
+    for row in Job.objects.values("is_active").annotate(total=Count("id")).order_by():
+        counts["jobs:active" if row["is_active"] else "jobs:inactive"] = row["total"]
+    counts["applications"] = Application.objects.count()
+    for row in Promotion.objects.values("promoted_at").annotate(total=Count("id")).order_by():
+        counts[f"promotions:{row['promoted_at'].isoformat()}"] = row["total"]
+    DashboardCounter.objects.bulk_create(DashboardCounter(key=key, value=value) for key, value in counts.items())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0014_job_fts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardCounter',
+            fields=[
+                ('key', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:54
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def backfill_eligible_from(apps, schema_editor):
+    Employee = apps.get_model("awash", "Employee")
+    Promotion = apps.get_model("awash", "Promotion")
+
+    latest = dict(
+        Promotion.objects.values("employee_id").annotate(latest=Max("promoted_at")).values_list("employee_id", "latest")
+    )
+    changed = []
+    for employee in Employee.objects.only("id", "last_promotion_date").iterator(chunk_size=2000):
+        last = latest.get(employee.id, employee.last_promotion_date)
+        if last:
+            employee.last_promotion_date = last
+            employee.eligible_from = last + timedelta(days=365)
+            changed.append(employee)
+    Employee.objects.bulk_update(changed, ["last_promotion_date", "eligible_from"], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0016_position'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employee',
+            name='eligible_from',
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_eligible_from, migrations.RunPython.noop),
+    ]
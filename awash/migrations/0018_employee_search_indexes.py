@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:54
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0017_employee_eligible_from'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(django.db.models.functions.text.Upper('full_name'), name='employee_name_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(django.db.models.functions.text.Upper('employee_id'), name='employee_id_upper_idx'),
+        ),
+    ]
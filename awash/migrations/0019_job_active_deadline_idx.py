@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0018_employee_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['is_active', 'deadline'], name='job_active_deadline_idx'),
+        ),
+    ]
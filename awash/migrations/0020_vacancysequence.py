@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0019_job_active_deadline_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VacancySequence',
+            fields=[
+                ('year', models.PositiveSmallIntegerField(primary_key=True, serialize=False)),
+                ('last_number', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
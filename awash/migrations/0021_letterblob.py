@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:57
+
+import awash.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0020_vacancysequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LetterBlob',
+            fields=[
+                ('name', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='recommendation_letter',
+            field=models.FileField(blank=True, null=True, storage=awash.storage.letter_storage, upload_to='recommendations/'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0021_letterblob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['applied_at', 'id'], name='application_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'applied_at'], name='application_job_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['employee', 'applied_at'], name='application_emp_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['posted_date', 'id'], name='job_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='promotion',
+            index=models.Index(fields=['promoted_at'], name='promotion_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='promotion',
+            index=models.Index(fields=['employee', 'promoted_at'], name='promotion_emp_date_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+def populate_open_applications(apps, schema_editor):
+    Application = apps.get_model("awash", "Application")
+    DashboardCounter = apps.get_model("awash", "DashboardCounter")
+    DashboardCounter.objects.update_or_create(
+        key="applications:open",
+        defaults={"value": Application.objects.filter(job__is_active=True).count()},
+    )
+
+
+def remove_open_applications(apps, schema_editor):
+    apps.get_model("awash", "DashboardCounter").objects.filter(key="applications:open").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0022_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_open_applications, remove_open_applications),
+    ]
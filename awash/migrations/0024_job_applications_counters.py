@@ -0,0 +1,31 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def populate_job_applications(apps, schema_editor):
+    Application = apps.get_model("awash", "Application")
+    DashboardCounter = apps.get_model("awash", "DashboardCounter")
+    rows = Application.objects.values("job_id").annotate(total=Count("id")).order_by()
+    DashboardCounter.objects.bulk_create(
+        [DashboardCounter(key=f"applications:job:{row['job_id']}", value=row["total"]) for row in rows],
+        update_conflicts=True,
+        update_fields=["value"],
+        unique_fields=["key"],
+    )
+
+
+def remove_job_applications(apps, schema_editor):
+    apps.get_model("awash", "DashboardCounter").objects.filter(
+        key__gte="applications:job:", key__lt="applications:job;"
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0023_open_applications_counter'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_job_applications, remove_job_applications),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('awash', '0024_job_applications_counters'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='job',
+            name='job_active_deadline_idx',
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['deadline'], name='job_open_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['vacancy_type'], name='job_type_idx'),
+        ),
+    ]
@@ -1,13 +1,55 @@
-from django.db import models
+import re
+from datetime import date, datetime, timedelta
+
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
 from django.utils import timezone
 
+from awash.storage import letter_storage
+
 # Create your models here.
 class Allemployee_record(models.Model):
     employee_id = models.CharField(max_length=50, unique=True)  # e.g. AIB/20821/2022
     full_name = models.CharField(max_length=200)
     def __str__(self):
         return f"{self.employee_id} - {self.full_name}"
+# Employees promoted within this window may not apply or be promoted again
+PROMOTION_COOLDOWN = timedelta(days=365)
+
+
+class EmployeeQuerySet(models.QuerySet):
+    def eligible(self, on=None):
+        """Employees out of the promotion cooldown on ``on`` (default today); uses the eligible_from index."""
+        on = on or date.today()
+        return self.filter(models.Q(eligible_from__isnull=True) | models.Q(eligible_from__lte=on))
+
+    def ineligible(self, on=None):
+        return self.filter(eligible_from__gt=on or date.today())
+
+    def id_prefix(self, text):
+        """Case-insensitive prefix match on employee_id, as a range over the UPPER(employee_id) index."""
+        prefix = text.strip().upper()
+        return self.alias(id_upper=Upper("employee_id")).filter(id_upper__gte=prefix, id_upper__lt=prefix + "\U0010ffff")
+
+    def search(self, text):
+        """
+        Case-insensitive prefix match on full_name or employee_id.
+
+        Written as ranges over UPPER(column) so both expression indexes are used
+        instead of a LIKE scan.
+        """
+        prefix = " ".join(text.split()).upper()
+        if not prefix:
+            return self.none()
+        upper_bound = prefix + "\U0010ffff"
+        return self.alias(name_upper=Upper("full_name"), id_upper=Upper("employee_id")).filter(
+            models.Q(name_upper__gte=prefix, name_upper__lt=upper_bound)
+            | models.Q(id_upper__gte=prefix, id_upper__lt=upper_bound)
+        )
+
+
 class Employee(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, blank=True, null=True)
     employee_id = models.CharField(max_length=50, unique=True)  # e.g. AIB/20821/2022
@@ -19,18 +61,41 @@ class Employee(models.Model):
 
     # 🔹 New field
     last_promotion_date = models.DateField(blank=True, null=True)
+    # last_promotion_date + PROMOTION_COOLDOWN, denormalised so eligibility is an indexed range query
+    eligible_from = models.DateField(blank=True, null=True, db_index=True)
+
+    objects = EmployeeQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Case-insensitive prefix search for the promotion picker (see EmployeeQuerySet.search)
+            models.Index(Upper("full_name"), name="employee_name_upper_idx"),
+            models.Index(Upper("employee_id"), name="employee_id_upper_idx"),
+        ]
 
     def __str__(self):
         return f"{self.employee_id} - {self.full_name}"
 
+    def set_last_promotion_date(self, value):
+        """Set last_promotion_date and keep eligible_from in step; save both fields afterwards."""
+        value = self._meta.get_field("last_promotion_date").to_python(value)
+        self.last_promotion_date = value
+        self.eligible_from = value + PROMOTION_COOLDOWN if value else None
+
+    def save(self, *args, **kwargs):
+        # eligible_from is derived here so every writer (views, admin, shell, imports) keeps it
+        # in step; only queryset.update() bypasses this — run backfill_eligible_from after one
+        if "last_promotion_date" in self.__dict__:
+            self.set_last_promotion_date(self.last_promotion_date)
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "last_promotion_date" in update_fields:
+                kwargs["update_fields"] = {*update_fields, "eligible_from"}
+        super().save(*args, **kwargs)
+
     def can_apply(self):
         """Check if employee is eligible to apply (not promoted within 1 year)."""
-        from datetime import date, timedelta
-
-        if self.last_promotion_date:
-            one_year_later = self.last_promotion_date + timedelta(days=365)
-            if date.today() < one_year_later:
-                return False
+        if self.eligible_from and date.today() < self.eligible_from:
+            return False
         return True
     def delete(self, *args, **kwargs):
         if self.user:
@@ -58,52 +123,90 @@ class Job(models.Model):
     ]
     vacancy_type = models.CharField(max_length=10, choices=vacancy_type_choices, default='external')
 
+    class Meta:
+        indexes = [
+            # deactivate_expired_jobs: UPDATE ... WHERE is_active AND deadline < today. Partial,
+            # since Django compiles is_active=True to a bare "is_active" that can't seek a composite index
+            models.Index(fields=["deadline"], condition=models.Q(is_active=True), name="job_open_deadline_idx"),
+            # applicants page filtered by vacancy type
+            models.Index(fields=["vacancy_type"], name="job_type_idx"),
+            # all_jobs / hr_dashboard: newest first, keyset on (posted_date, id)
+            models.Index(fields=["posted_date", "id"], name="job_posted_idx"),
+        ]
+
     def __str__(self):
         return f"{self.vacancy_number} — {self.title}"
 
     def save(self, *args, **kwargs):
-        """
-        Two-step save:
-        1. Initial save to get PK.
-        2. Build vacancy_number as VAC-<year>-<pk zero-padded>.
-        3. Use update() to avoid recursion.
-        """
-        if not self.pk:
-            super().save(*args, **kwargs)  # Step 1
-            year = timezone.now().year
-            self.vacancy_number = f"VAC-{year}-{self.pk:06d}"  # Step 2
-            Job.objects.filter(pk=self.pk).update(vacancy_number=self.vacancy_number)  # Step 3
-        else:
-            super().save(*args, **kwargs)
-    def save(self, *args, **kwargs):
+        self.prepare_for_save()
+        super().save(*args, **kwargs)
+
+    def prepare_for_save(self):
+        """Normalise the deadline, deactivate past-deadline jobs and number new ones (shared with bulk posting)."""
         # Ensure self.deadline is a date object
         if isinstance(self.deadline, str):
-            from datetime import datetime
             self.deadline = datetime.strptime(self.deadline, "%Y-%m-%d").date()
 
         # Automatically deactivate past-deadline jobs
         if self.deadline and self.deadline < timezone.now().date():
             self.is_active = False
 
-        # Two-step save for vacancy_number
-        if not self.pk:
-            super().save(*args, **kwargs)  # Step 1
+        # Number is reserved up front so the INSERT writes it — no second UPDATE
+        if not self.pk and not self.vacancy_number:
             year = timezone.now().year
-            self.vacancy_number = f"VAC-{year}-{self.pk:06d}"  # Step 2
-            Job.objects.filter(pk=self.pk).update(vacancy_number=self.vacancy_number)  # Step 3
-        else:
-            super().save(*args, **kwargs)
-            
+            self.vacancy_number = VacancySequence.format(year, VacancySequence.allocate(year))
+
+
+class VacancySequence(models.Model):
+    """Per-year counter behind Job.vacancy_number (VAC-<year>-<number>)."""
+    year = models.PositiveSmallIntegerField(primary_key=True)
+    last_number = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.year}: {self.last_number}"
+
+    @staticmethod
+    def format(year, number):
+        return f"VAC-{year}-{number:06d}"
+
+    @classmethod
+    def allocate(cls, year, count=1):
+        """Reserve ``count`` consecutive numbers for ``year`` and return the first one."""
+        with transaction.atomic():
+            if not cls.objects.filter(year=year).update(last_number=F("last_number") + count):
+                cls.objects.get_or_create(year=year, defaults={"last_number": cls.highest_issued(year)})
+                cls.objects.filter(year=year).update(last_number=F("last_number") + count)
+            last_number = cls.objects.values_list("last_number", flat=True).get(year=year)
+        return last_number - count + 1
+
+    @staticmethod
+    def highest_issued(year):
+        """Largest number already used for ``year``, so a new sequence continues after pk-based numbers."""
+        prefix = f"VAC-{year}-"
+        numbers = [
+            int(number[len(prefix):])
+            for number in Job.objects.filter(vacancy_number__startswith=prefix).values_list("vacancy_number", flat=True)
+            if number[len(prefix):].isdigit()
+        ]
+        return max(numbers, default=0)
+
 
 class Application(models.Model):
     employee = models.ForeignKey("Employee", on_delete=models.CASCADE, related_name="applications")
     job = models.ForeignKey("Job", on_delete=models.CASCADE, related_name="applications")
     applied_at = models.DateTimeField(default=timezone.now)
-    recommendation_letter = models.FileField(upload_to="recommendations/", blank=True, null=True)
+    # Stored by content hash; identical letters share one file (see awash/storage.py)
+    recommendation_letter = models.FileField(upload_to="recommendations/", storage=letter_storage, blank=True, null=True)
 
     class Meta:
         unique_together = ('employee', 'job')  # Prevent duplicate applications
         ordering = ['-applied_at']
+        # Match the applicants, per-job and my_applications listings, which all sort on applied_at
+        indexes = [
+            models.Index(fields=["applied_at", "id"], name="application_applied_idx"),
+            models.Index(fields=["job", "applied_at"], name="application_job_applied_idx"),
+            models.Index(fields=["employee", "applied_at"], name="application_emp_applied_idx"),
+        ]
 
     def __str__(self):
         return f"{self.employee.full_name} → {self.job.title}"
@@ -115,5 +218,68 @@ class Promotion(models.Model):
     promoted_at = models.DateField(default=timezone.now)
     remarks = models.TextField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            # promotion_list and the exports sort by date; delete_promotion looks up an employee's latest
+            models.Index(fields=["promoted_at"], name="promotion_date_idx"),
+            models.Index(fields=["employee", "promoted_at"], name="promotion_emp_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.employee.full_name} → {self.new_grade} on {self.promoted_at}"
+
+class DashboardCounter(models.Model):
+    """
+    Running totals for the HR dashboard, maintained by the signal handlers in
+    awash/signals.py. Promotions are bucketed per day under "promotions:<YYYY-MM-DD>"
+    so a date window is a single primary-key range read.
+    """
+    key = models.CharField(max_length=50, primary_key=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.key} = {self.value}"
+
+
+
+class Position(models.Model):
+    """Catalog of job titles offered in the registration and promotion forms."""
+    GRADE_RE = re.compile(r"\(\s*\.?\s*([IVXL]+)\s*\)")
+
+    title = models.CharField(max_length=200, unique=True)
+    grade = models.CharField(max_length=10, blank=True)  # roman numeral from the title, e.g. "VIII"
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        ordering = ["title"]
+
+    def __str__(self):
+        return self.title
+
+    @classmethod
+    def parse_grade(cls, title):
+        """Last parenthesised roman numeral in the title: "Driver I (II)" -> "II"."""
+        grades = cls.GRADE_RE.findall(title or "")
+        return grades[-1] if grades else ""
+
+    @classmethod
+    def catalog_title(cls, value):
+        """The active catalog title matching ``value`` (case/whitespace-insensitive), or None."""
+        title = " ".join((value or "").split())
+        if not title:
+            return None
+        return cls.objects.filter(title__iexact=title, is_active=True).values_list("title", flat=True).first()
+
+    def save(self, *args, **kwargs):
+        self.grade = self.parse_grade(self.title)
+        super().save(*args, **kwargs)
+
+
+class LetterBlob(models.Model):
+    """One stored recommendation letter file and how many applications reference it."""
+    name = models.CharField(max_length=255, primary_key=True)  # storage name: recommendations/ab/<sha256>.pdf
+    size = models.PositiveBigIntegerField(default=0)
+    ref_count = models.PositiveIntegerField(default=0)
+
     def __str__(self):
-        return f"{self.employee.full_name} → {self.new_grade} on {self.promoted_at}"
\ No newline at end of file
+        return f"{self.name} ({self.ref_count} refs)"
@@ -0,0 +1,167 @@
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from awash.models import Application, DashboardCounter, Job, Position, Promotion
+from awash.storage import acquire_blob, release_blob
+from awash.utils import counters
+from awash.utils.db import configure_sqlite
+from awash.utils.position_index import reset_index
+from awash.utils.search import index_job, remove_job
+
+
+@receiver(connection_created)
+def connection_opened(sender, connection, **kwargs):
+    configure_sqlite(connection)
+
+
+# Keep the full-text index in step with the job table
+@receiver(post_save, sender=Job)
+def job_saved(sender, instance, **kwargs):
+    index_job(instance)
+
+
+@receiver(post_delete, sender=Job)
+def job_deleted(sender, instance, **kwargs):
+    remove_job(instance.pk)
+
+
+# Dashboard counters. post_init remembers the values as loaded so an update
+# can move a row between buckets; __dict__ is read so deferred fields aren't fetched.
+@receiver(post_init, sender=Job)
+def job_loaded(sender, instance, **kwargs):
+    instance._counted_is_active = instance.__dict__.get("is_active")
+
+
+@receiver(post_save, sender=Job)
+def job_counted(sender, instance, created, **kwargs):
+    if created:
+        counters.bump(counters.job_key(instance.is_active))
+    elif instance._counted_is_active is None or "is_active" not in instance.__dict__:
+        counters.recount_jobs()
+    elif instance._counted_is_active != instance.is_active:
+        counters.bump(counters.job_key(instance._counted_is_active), -1)
+        counters.bump(counters.job_key(instance.is_active))
+        moved = Application.objects.filter(job_id=instance.pk).count()
+        counters.bump(counters.OPEN_APPLICATIONS, moved if instance.is_active else -moved)
+    instance._counted_is_active = instance.__dict__.get("is_active")
+
+
+@receiver(post_delete, sender=Job)
+def job_uncounted(sender, instance, **kwargs):
+    # Its applications were deleted (and uncounted) first; drop the emptied per-job counter
+    DashboardCounter.objects.filter(key=counters.job_applications_key(instance.pk)).delete()
+    if "is_active" in instance.__dict__:
+        counters.bump(counters.job_key(instance.is_active), -1)
+    else:
+        counters.recount_jobs()
+
+
+def _job_is_open(application):
+    if Application.job.is_cached(application):
+        return application.job.is_active
+    # A job deleted along with its applications is still in the table while they go
+    return Job.objects.filter(id=application.job_id, is_active=True).exists()
+
+
+@receiver(post_save, sender=Application)
+def application_counted(sender, instance, created, **kwargs):
+    if created:
+        counters.bump(counters.APPLICATIONS)
+        counters.bump(counters.job_applications_key(instance.job_id))
+        if _job_is_open(instance):
+            counters.bump(counters.OPEN_APPLICATIONS)
+    elif instance._counted_job_id is not None and instance._counted_job_id != instance.job_id:
+        counters.bump(counters.job_applications_key(instance._counted_job_id), -1)
+        counters.bump(counters.job_applications_key(instance.job_id))
+        was_open = Job.objects.filter(id=instance._counted_job_id, is_active=True).exists()
+        counters.bump(counters.OPEN_APPLICATIONS, _job_is_open(instance) - was_open)
+    instance._counted_job_id = instance.job_id
+
+
+@receiver(post_delete, sender=Application)
+def application_uncounted(sender, instance, **kwargs):
+    counters.bump(counters.APPLICATIONS, -1)
+    counters.bump(counters.job_applications_key(instance.job_id), -1)
+    if _job_is_open(instance):
+        counters.bump(counters.OPEN_APPLICATIONS, -1)
+
+
+# Reference counts for the content-addressed recommendation letters
+def _letter_name(value):
+    return getattr(value, "name", value) or ""
+
+
+def _letter_size(letter):
+    try:
+        return letter.size
+    except OSError:
+        return 0
+
+
+@receiver(post_init, sender=Application)
+def application_loaded(sender, instance, **kwargs):
+    instance._stored_letter = _letter_name(instance.__dict__.get("recommendation_letter"))
+    instance._counted_job_id = instance.__dict__.get("job_id")
+
+
+@receiver(pre_save, sender=Application)
+def application_letter_saving(sender, instance, update_fields=None, **kwargs):
+    # A fresh upload takes its reference inside ContentAddressedStorage._save(),
+    # as does a letter stored before the save and flagged with _letter_stored (see views.apply)
+    saved = "recommendation_letter" in instance.__dict__ and (
+        update_fields is None or "recommendation_letter" in update_fields
+    )
+    letter = instance.recommendation_letter if saved else None
+    stored = instance.__dict__.pop("_letter_stored", False)
+    instance._uploading_letter = bool(letter) and (stored or not letter._committed)
+
+
+@receiver(post_save, sender=Application)
+def application_letter_saved(sender, instance, created, **kwargs):
+    letter = instance.recommendation_letter
+    name = _letter_name(letter)
+    previous = "" if created else instance._stored_letter
+    if name != previous:
+        if name and not instance._uploading_letter:
+            acquire_blob(name, _letter_size(letter))
+        if previous:
+            release_blob(previous, letter.storage)
+    elif name and instance._uploading_letter:
+        release_blob(name, letter.storage)  # the same file uploaded again was counted twice
+    instance._stored_letter = name
+
+
+@receiver(post_delete, sender=Application)
+def application_letter_deleted(sender, instance, **kwargs):
+    if instance._stored_letter:
+        release_blob(instance._stored_letter, instance.recommendation_letter.storage)
+
+
+@receiver(post_init, sender=Promotion)
+def promotion_loaded(sender, instance, **kwargs):
+    instance._counted_promoted_at = instance.__dict__.get("promoted_at")
+
+
+@receiver(post_save, sender=Promotion)
+def promotion_counted(sender, instance, created, **kwargs):
+    new_key = counters.promotion_key(instance.promoted_at)
+    if created:
+        counters.bump(new_key)
+    elif instance._counted_promoted_at is not None:
+        old_key = counters.promotion_key(instance._counted_promoted_at)
+        if old_key != new_key:
+            counters.bump(old_key, -1)
+            counters.bump(new_key)
+    instance._counted_promoted_at = instance.promoted_at
+
+
+@receiver(post_delete, sender=Promotion)
+def promotion_uncounted(sender, instance, **kwargs):
+    counters.bump(counters.promotion_key(instance.promoted_at), -1)
+
+
+@receiver(post_save, sender=Position)
+@receiver(post_delete, sender=Position)
+def position_changed(sender, **kwargs):
+    reset_index()
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import posixpath
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File storage that names every file after the SHA-256 of its bytes.
+
+    An upload is streamed to a temporary file in the target directory while
+    it is hashed, then renamed to ``<upload_to>/<aa>/<sha256><ext>``. If that
+    file already exists the temporary copy is dropped, so identical uploads
+    share one file on disk. Which rows point at a file is tracked by
+    LetterBlob.ref_count (see acquire_blob/release_blob).
+
+    Saving takes the new reference itself: the ref-count increment and the
+    "is the file already there?" decision happen under the same LetterBlob
+    row lock that collect_blob() deletes under, so an identical upload can't
+    keep a file that a concurrent release is about to remove.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is only known once the content is hashed in _save()
+        return name
+
+    def _save(self, name, content):
+        directory = posixpath.dirname(name)
+        extension = os.path.splitext(name)[1].lower()
+
+        os.makedirs(self.path(directory or "."), exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        handle = tempfile.NamedTemporaryFile(dir=self.path(directory or "."), prefix=".upload-", delete=False)
+        try:
+            with handle:
+                if hasattr(content, "seek"):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    handle.write(chunk)
+                    size += len(chunk)
+
+            sha = digest.hexdigest()
+            final_name = posixpath.join(directory, sha[:2], f"{sha}{extension}")
+            final_path = self.path(final_name)
+            with transaction.atomic():
+                acquire_blob(final_name, size)
+                if os.path.exists(final_path):
+                    os.unlink(handle.name)  # same bytes already stored
+                else:
+                    os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                    if self.file_permissions_mode is not None:
+                        os.chmod(handle.name, self.file_permissions_mode)
+                    os.replace(handle.name, final_path)
+        except BaseException:
+            if os.path.exists(handle.name):
+                os.unlink(handle.name)
+            raise
+        return final_name
+
+
+def letter_storage():
+    """Storage for Application.recommendation_letter (callable so migrations don't freeze its settings)."""
+    return ContentAddressedStorage()
+
+
+def acquire_blob(name, size=0):
+    """
+    Count one more reference to a stored file.
+
+    The row stays locked until the caller's transaction ends; run this inside
+    the transaction that decides whether the file needs writing.
+    """
+    from awash.models import LetterBlob
+
+    while True:
+        if LetterBlob.objects.filter(name=name).update(ref_count=F("ref_count") + 1):
+            return
+        try:
+            with transaction.atomic():
+                LetterBlob.objects.create(name=name, size=size, ref_count=1)
+            return
+        except IntegrityError:
+            continue  # created concurrently; take the reference on that row
+
+
+def release_blob(name, storage):
+    """Drop one reference; once the last one is gone the file is collected after commit."""
+    from awash.models import LetterBlob
+
+    with transaction.atomic():
+        LetterBlob.objects.filter(name=name, ref_count__gt=0).update(ref_count=F("ref_count") - 1)
+        if LetterBlob.objects.filter(name=name, ref_count=0).exists():
+            transaction.on_commit(lambda: collect_blob(name, storage))
+
+
+def collect_blob(name, storage):
+    """
+    Delete a stored file and its LetterBlob row if nothing references it.
+
+    The row is deleted first and the file removed before commit, so an upload
+    of the same bytes either took its reference before us (and we skip) or
+    waits on the row and then writes the file again.
+    """
+    from awash.models import LetterBlob
+
+    with transaction.atomic():
+        if LetterBlob.objects.filter(name=name, ref_count=0).delete()[0]:
+            storage.delete(name)
@@ -0,0 +1,33 @@
+import time
+
+from django.template.backends.django import DjangoTemplates, Template
+
+from awash.middleware import current_stats
+
+
+class TimedTemplate(Template):
+    """A Django template whose render time is added to the current request's RequestStats."""
+
+    def render(self, context=None, request=None):
+        stats = current_stats()
+        if stats is None:
+            return super().render(context, request)
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            stats.template_time += time.perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """
+    The stock Django template backend, timing top-level renders for
+    RequestTimingMiddleware. {% include %} and {% extends %} render inside
+    their parent, so nothing is counted twice.
+    """
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name).template, self)
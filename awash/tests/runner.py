@@ -0,0 +1,28 @@
+import shutil
+import tempfile
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+from awash.utils import metrics
+
+
+class AwashTestRunner(DiscoverRunner):
+    """
+    DiscoverRunner that points METRICS_DIR at a throwaway directory, so the
+    metric files written by test requests never join a real deployment's
+    /metrics totals.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.metrics_dir = tempfile.mkdtemp(prefix="awash-test-metrics-")
+        self.metrics_setting = override_settings(METRICS_DIR=self.metrics_dir)
+        self.metrics_setting.enable()
+        metrics.reset_store()
+
+    def teardown_test_environment(self, **kwargs):
+        metrics.reset_store()
+        self.metrics_setting.disable()
+        shutil.rmtree(self.metrics_dir, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,106 @@
+from datetime import datetime
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from awash.models import Application, DashboardCounter
+from awash.tests.utils import make_employee, make_job
+from awash.utils.counters import job_applications_key
+
+
+def applied(employee, job, day):
+    return Application.objects.create(
+        employee=employee, job=job, applied_at=timezone.make_aware(datetime(2024, 5, day, 12))
+    )
+
+
+class ApplicantsListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user("hr", password="x", is_staff=True)
+        cls.internal = make_job("Internal Auditor", vacancy_type="internal")
+        cls.external = make_job("Teller", vacancy_type="external")
+        cls.abebe = make_employee("AIB/00001/2020")
+        cls.almaz = make_employee("AIB/00002/2021", "Almaz Bekele Haile")
+        applied(cls.abebe, cls.internal, 1)
+        applied(cls.almaz, cls.internal, 10)
+        applied(cls.almaz, cls.external, 20)
+
+    def get(self, **filters):
+        self.client.force_login(self.hr)
+        response = self.client.get(reverse("applicants"), filters)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def shown(self, **filters):
+        return sorted(
+            (app.employee.employee_id, app.job.title) for app in self.get(**filters).context["applications"]
+        )
+
+    def test_filters(self):
+        self.assertEqual(len(self.shown()), 3)
+        self.assertEqual(self.shown(job=self.external.id), [("AIB/00002/2021", "Teller")])
+        self.assertEqual(self.shown(vacancy_type="internal"), [
+            ("AIB/00001/2020", "Internal Auditor"), ("AIB/00002/2021", "Internal Auditor"),
+        ])
+        self.assertEqual(self.shown(employee_id="AIB/00001"), [("AIB/00001/2020", "Internal Auditor")])
+
+    def test_date_range_includes_both_ends(self):
+        self.assertEqual(self.shown(date_from="2024-05-10", date_to="2024-05-20"), [
+            ("AIB/00002/2021", "Internal Auditor"), ("AIB/00002/2021", "Teller"),
+        ])
+        self.assertEqual(self.shown(date_to="2024-05-01"), [("AIB/00001/2020", "Internal Auditor")])
+
+    def test_extreme_and_invalid_dates(self):
+        self.assertEqual(len(self.shown(date_to="9999-12-31")), 3)
+        self.assertEqual(len(self.shown(date_from="0001-01-01")), 3)
+        self.assertEqual(len(self.shown(date_to="2024-02-31", job="x")), 3)
+
+    def test_job_id_too_big_for_sqlite_is_ignored(self):
+        too_big = "9" * 25
+        self.assertEqual(len(self.shown(job=too_big)), 3)
+        self.assertEqual(len(self.shown(job=str(2 ** 63))), 3)
+
+        response = self.client.get(reverse("export_applicants"), {"job": too_big})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('filename="applicants.csv"', response["Content-Disposition"])
+        rows = b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+        self.assertEqual(len(rows), 4)
+
+    def test_job_totals_follow_the_filters(self):
+        totals = {row["job__title"]: row["total"] for row in self.get().context["job_totals"]}
+        self.assertEqual(totals, {"Internal Auditor": 2, "Teller": 1})
+        totals = {row["job__title"]: row["total"] for row in self.get(date_from="2024-05-05").context["job_totals"]}
+        self.assertEqual(totals, {"Internal Auditor": 1, "Teller": 1})
+
+    def test_unfiltered_job_totals_come_from_the_counters(self):
+        DashboardCounter.objects.filter(key=job_applications_key(self.external.id)).update(value=7)
+        rows = self.get(job="x").context["job_totals"]
+        self.assertEqual([(row["job__title"], row["total"]) for row in rows], [("Teller", 7), ("Internal Auditor", 2)])
+        self.assertEqual(rows[0]["job_id"], self.external.id)
+        self.assertEqual(rows[0]["job__vacancy_number"], self.external.vacancy_number)
+        self.assertTrue(rows[0]["job__is_active"])
+
+    def test_keyset_pages_cover_everything_once(self):
+        first = self.get(page_size=5).context["applications"]
+        self.assertFalse(first.has_next)
+        extra = make_employee("AIB/00003/2022", "Dawit Hana Selam")
+        for day in range(1, 6):
+            applied(extra, make_job(f"Clerk {day}"), day)
+        seen = []
+        page = self.get(page_size=5).context["applications"]
+        seen += [app.id for app in page]
+        while page.has_next:
+            page = self.get(page_size=5, after=page.next_cursor).context["applications"]
+            seen += [app.id for app in page]
+        self.assertEqual(sorted(seen), sorted(Application.objects.values_list("id", flat=True)))
+
+    def test_hr_only(self):
+        self.client.force_login(self.abebe.user)
+        self.assertRedirects(self.client.get(reverse("applicants")), reverse("login"), fetch_redirect_response=False)
+
+    def test_newest_first(self):
+        dates = [app.applied_at for app in self.get().context["applications"]]
+        self.assertEqual(dates, sorted(dates, reverse=True))
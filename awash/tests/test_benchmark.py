@@ -0,0 +1,46 @@
+from django.test import SimpleTestCase
+
+from awash.utils.benchmark import compare
+
+
+def report(**views):
+    """A one-scale benchmark report; each view is given as (p95_ms, queries)."""
+    return {"results": {"0.01": {"views": {
+        name: {"p95_ms": p95, "queries": queries} for name, (p95, queries) in views.items()
+    }}}}
+
+
+class CompareTests(SimpleTestCase):
+    def test_p95_growth_beyond_the_threshold_regresses(self):
+        baseline = report(all_jobs=(10.0, 4), hr_dashboard=(10.0, 4))
+        lines, regressions = compare(report(all_jobs=(12.5, 4), hr_dashboard=(12.6, 4)), baseline, threshold=0.25)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("hr_dashboard", regressions[0])
+        self.assertIn("(+26%)", regressions[0])
+
+    def test_faster_views_pass(self):
+        _, regressions = compare(report(all_jobs=(5.0, 3)), report(all_jobs=(10.0, 4)))
+        self.assertEqual(regressions, [])
+
+    def test_any_extra_query_regresses(self):
+        lines, regressions = compare(report(all_jobs=(9.0, 5)), report(all_jobs=(10.0, 4)))
+        self.assertEqual(regressions, lines)
+        self.assertIn("queries 4 -> 5", regressions[0])
+
+    def test_zero_baseline_p95_only_checks_queries(self):
+        _, regressions = compare(report(all_jobs=(3.0, 4)), report(all_jobs=(0.0, 4)))
+        self.assertEqual(regressions, [])
+
+    def test_missing_and_new_views_are_listed_not_regressions(self):
+        lines, regressions = compare(report(all_jobs=(10.0, 4), register=(50.0, 6)), report(all_jobs=(10.0, 4), apply=(8.0, 4)))
+        self.assertEqual(regressions, [])
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(any("apply" in line and "missing" in line for line in lines))
+        self.assertTrue(any("register" in line and "new" in line for line in lines))
+
+    def test_scales_missing_from_the_baseline_are_new(self):
+        current = report(all_jobs=(10.0, 4))
+        lines, regressions = compare(current, {"results": {}})
+        self.assertEqual(regressions, [])
+        self.assertIn("new", lines[0])
@@ -0,0 +1,118 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from awash.models import Application, DashboardCounter, Job, Promotion
+from awash.tests.utils import make_employee, make_job
+from awash.utils.counters import dashboard_counts, find_drift, job_applications_key, rebuild_counters
+
+
+class DashboardCounterTests(TestCase):
+    def assertInSync(self):
+        self.assertEqual(find_drift(), {})
+
+    def per_job(self, *jobs):
+        stored = dict(DashboardCounter.objects.values_list("key", "value"))
+        return [stored.get(job_applications_key(job.id)) for job in jobs]
+
+    def test_jobs_move_between_buckets(self):
+        open_job = make_job("Teller")
+        make_job("Clerk", deadline=date.today() - timedelta(days=1))  # saved inactive
+        self.assertEqual(dashboard_counts()["active_jobs"], 1)
+        self.assertEqual(dashboard_counts()["inactive_jobs"], 1)
+
+        open_job.is_active = False
+        open_job.save()
+        self.assertEqual(dashboard_counts()["active_jobs"], 0)
+        self.assertEqual(dashboard_counts()["inactive_jobs"], 2)
+        open_job.delete()
+        self.assertEqual(dashboard_counts()["inactive_jobs"], 1)
+        self.assertInSync()
+
+    def test_deferred_job_save_recounts(self):
+        job = make_job("Teller")
+        deferred = Job.objects.only("id", "title").get(id=job.id)
+        deferred.title = "Senior Teller"
+        deferred.save()
+        Job.objects.only("id").get(id=job.id).delete()
+        self.assertInSync()
+
+    def test_applications_and_promotions(self):
+        employee = make_employee()
+        application = Application.objects.create(employee=employee, job=make_job())
+        today = date.today()
+        Promotion.objects.create(employee=employee, new_grade="VII", promoted_at=today)
+        old = Promotion.objects.create(employee=employee, new_grade="VI", promoted_at=today - timedelta(days=200))
+        counts = dashboard_counts()
+        self.assertEqual(counts["total_applications"], 1)
+        self.assertEqual(counts["promoted_this_year"], 2)
+        self.assertEqual(counts["promoted_last_6_months"], 1)
+        self.assertEqual(counts["promoted_last_3_months"], 1)
+
+        old.promoted_at = today - timedelta(days=30)
+        old.save()
+        self.assertEqual(dashboard_counts()["promoted_last_3_months"], 2)
+        application.delete()
+        old.delete()
+        self.assertEqual(dashboard_counts()["total_applications"], 0)
+        self.assertEqual(dashboard_counts()["promoted_this_year"], 1)
+        self.assertInSync()
+
+    def test_open_applications_follow_their_job(self):
+        employee = make_employee()
+        teller, clerk = make_job("Teller"), make_job("Clerk")
+        Application.objects.create(employee=employee, job=teller)
+        Application.objects.create(employee=employee, job=clerk)
+        self.assertEqual(dashboard_counts()["open_applications"], 2)
+
+        teller.is_active = False
+        teller.save()
+        self.assertEqual(dashboard_counts()["open_applications"], 1)
+        self.assertEqual(dashboard_counts()["total_applications"], 2)
+        teller.is_active = True
+        teller.save()
+        self.assertEqual(dashboard_counts()["open_applications"], 2)
+
+        Job.objects.get(id=clerk.id).delete()  # its application goes with it
+        self.assertEqual(dashboard_counts()["open_applications"], 1)
+        Application.objects.get().delete()
+        self.assertEqual(dashboard_counts()["open_applications"], 0)
+        self.assertInSync()
+
+    def test_applications_per_job(self):
+        employee, other = make_employee(), make_employee("AIB/00002/2020")
+        teller, clerk = make_job("Teller"), make_job("Clerk")
+        Application.objects.create(employee=employee, job=teller)
+        moved = Application.objects.create(employee=other, job=teller)
+        Application.objects.create(employee=employee, job=clerk)
+        self.assertEqual(self.per_job(teller, clerk), [2, 1])
+
+        clerk.is_active = False
+        clerk.save()
+        moved.job = clerk
+        moved.save()
+        self.assertEqual(dashboard_counts()["open_applications"], 1)
+        self.assertEqual(self.per_job(teller, clerk), [1, 2])
+        self.assertInSync()
+
+        Job.objects.get(id=clerk.id).delete()
+        self.assertFalse(DashboardCounter.objects.filter(key=job_applications_key(clerk.id)).exists())
+        self.assertEqual(self.per_job(teller), [1])
+        self.assertInSync()
+
+    def test_drift_is_reported_and_repaired(self):
+        make_job("Teller")
+        Job.objects.update(is_active=False)  # queryset updates skip the signals
+        self.assertEqual(find_drift(), {"jobs:active": (1, 0), "jobs:inactive": (0, 1)})
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_counters", "--check", stdout=StringIO())
+        call_command("rebuild_counters", stdout=StringIO())
+        self.assertInSync()
+
+    def test_rebuild_drops_stale_keys(self):
+        DashboardCounter.objects.create(key="promotions:2001-01-01", value=5)
+        rebuild_counters()
+        self.assertFalse(DashboardCounter.objects.filter(key="promotions:2001-01-01").exists())
@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from awash.models import PROMOTION_COOLDOWN, Employee, Promotion
+from awash.tests.utils import make_employee
+
+
+class EligibleFromTests(TestCase):
+    def setUp(self):
+        self.employee = make_employee()
+
+    def reload(self):
+        return Employee.objects.get(id=self.employee.id)
+
+    def test_any_save_derives_eligible_from(self):
+        # As the admin, the shell or an import would write it
+        promoted = date.today() - timedelta(days=30)
+        self.employee.last_promotion_date = promoted
+        self.employee.save()
+        self.assertEqual(self.reload().eligible_from, promoted + PROMOTION_COOLDOWN)
+        self.assertFalse(self.reload().can_apply())
+
+        self.employee.last_promotion_date = None
+        self.employee.save()
+        self.assertIsNone(self.reload().eligible_from)
+        self.assertTrue(self.reload().can_apply())
+
+    def test_update_fields_saves_eligible_from_too(self):
+        self.employee.last_promotion_date = "2020-01-01"
+        self.employee.save(update_fields=["last_promotion_date"])
+        self.assertEqual(self.reload().eligible_from, date(2020, 1, 1) + PROMOTION_COOLDOWN)
+
+    def test_deferred_save_leaves_it_alone(self):
+        self.employee.last_promotion_date = date(2020, 1, 1)
+        self.employee.save()
+        partial = Employee.objects.only("id", "phone").get(id=self.employee.id)
+        partial.phone = "0911"
+        partial.save()
+        self.assertEqual(self.reload().eligible_from, date(2020, 1, 1) + PROMOTION_COOLDOWN)
+
+    def test_eligible_queryset(self):
+        recent = make_employee("AIB/2", last_promotion_date=date.today() - timedelta(days=10))
+        long_ago = make_employee("AIB/3", last_promotion_date=date.today() - timedelta(days=800))
+        eligible = set(Employee.objects.eligible().values_list("id", flat=True))
+        self.assertEqual(eligible, {self.employee.id, long_ago.id})
+        self.assertEqual(list(Employee.objects.ineligible()), [recent])
+        later = date.today() + PROMOTION_COOLDOWN
+        self.assertIn(recent, Employee.objects.eligible(on=later))
+
+    def test_backfill_repairs_queryset_updates(self):
+        Promotion.objects.create(employee=self.employee, new_grade="VII", promoted_at=date(2021, 3, 1))
+        Employee.objects.update(last_promotion_date=None, eligible_from=None)  # bypasses save()
+        call_command("backfill_eligible_from", stdout=StringIO())
+        employee = self.reload()
+        self.assertEqual(employee.last_promotion_date, date(2021, 3, 1))
+        self.assertEqual(employee.eligible_from, date(2021, 3, 1) + PROMOTION_COOLDOWN)
+
+
+class PromotionFlowTests(TestCase):
+    def test_promote_then_delete_promotion(self):
+        self.client.force_login(User.objects.create_user("hr", password="x", is_staff=True))
+        employee = make_employee()
+        today = date.today()
+        self.client.post(reverse("promotion"), {
+            "employee": employee.id, "new_position": "Acting Branch Auditor", "promoted_at": today.isoformat(),
+        })
+        employee.refresh_from_db()
+        self.assertEqual(employee.eligible_from, today + PROMOTION_COOLDOWN)
+
+        # A second promotion inside the cooldown is refused
+        self.client.post(reverse("promotion"), {
+            "employee": employee.id, "new_position": "Acting Branch Auditor", "promoted_at": today.isoformat(),
+        })
+        self.assertEqual(Promotion.objects.count(), 1)
+
+        self.client.post(reverse("delete_promotion", args=[Promotion.objects.get().id]))
+        employee.refresh_from_db()
+        self.assertIsNone(employee.last_promotion_date)
+        self.assertIsNone(employee.eligible_from)
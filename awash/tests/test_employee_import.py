@@ -0,0 +1,78 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.test import TestCase, TransactionTestCase
+
+from awash.models import Allemployee_record
+from awash.tests.utils import write_workbook
+from awash.utils import employee_import
+from awash.utils.employee_import import expand_sources, iter_sheet_rows, load_allemployee_records
+
+
+HEADER = ("Employee_ID", "Full_Name", None)
+SHEETS = {
+    "Head Office": [HEADER, ("AIB/1/2020", " Abebe Kebede ", "x"), ("AIB/2/2020", "Almaz Bekele"), (None, "No Id")],
+    "Branches": [HEADER, ("AIB/3/2021", "Dawit Hana"), ("AIB/1/2020", "Duplicate Abebe"), (12345.0, "Numeric Id")],
+}
+
+
+class EmployeeImportTests(TransactionTestCase):
+    # Transactional: the loader commits batch by batch and parallel mode uses other processes
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "employees.xlsx")
+        write_workbook(self.path, SHEETS)
+        self.sources = expand_sources([self.path], all_sheets=True)
+
+    def test_rows_are_cleaned_and_keyed_by_header(self):
+        rows = list(iter_sheet_rows(self.path, "Head Office"))
+        self.assertEqual(rows[0], {"employee_id": "AIB/1/2020", "full_name": "Abebe Kebede"})
+        self.assertEqual(rows[2], {"employee_id": "", "full_name": "No Id"})
+        self.assertEqual(list(iter_sheet_rows(self.path, "Branches"))[2]["employee_id"], "12345")
+
+    def test_load_counts_created_skipped_and_invalid(self):
+        summary = load_allemployee_records(self.sources, batch_size=2)
+        self.assertEqual((summary.created, summary.skipped, summary.invalid), (4, 1, 1))
+        self.assertEqual(Allemployee_record.objects.get(employee_id="AIB/1/2020").full_name, "Abebe Kebede")
+
+        again = load_allemployee_records(self.sources, batch_size=2)
+        self.assertEqual((again.created, again.skipped, again.invalid), (0, 5, 1))
+        self.assertEqual(Allemployee_record.objects.count(), 4)
+
+    def test_rows_lost_to_a_concurrent_insert_count_as_skipped(self):
+        # Another importer commits AIB/2/2020 after this batch looked up the existing IDs
+        Allemployee_record.objects.create(employee_id="AIB/2/2020", full_name="Someone Else")
+        with mock.patch.object(employee_import, "_existing_ids", return_value=set()):
+            summary = load_allemployee_records(self.sources[:1], batch_size=10)
+        self.assertEqual((summary.created, summary.skipped), (1, 1))
+        self.assertEqual(Allemployee_record.objects.get(employee_id="AIB/2/2020").full_name, "Someone Else")
+
+    def test_parallel_mode_matches_serial_order_in_small_chunks(self):
+        serial = list(employee_import._iter_sources(self.sources, workers=1))
+        parallel = list(employee_import._iter_sources(self.sources, workers=2, chunk_size=1))
+        self.assertEqual(parallel, serial)
+
+    def test_parallel_load(self):
+        summary = load_allemployee_records(self.sources, batch_size=2, workers=2)
+        self.assertEqual((summary.created, summary.skipped, summary.invalid), (4, 1, 1))
+        self.assertEqual(Allemployee_record.objects.get(employee_id="AIB/1/2020").full_name, "Abebe Kebede")
+
+    def test_parallel_worker_errors_are_raised(self):
+        sources = self.sources + [(self.path, "No Such Sheet")]
+        with self.assertRaises(KeyError):
+            list(employee_import._iter_sources(sources, workers=2))
+
+
+class ReadSheetChunksTests(TestCase):
+    def test_chunks_are_bounded_and_terminated(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "employees.xlsx")
+            write_workbook(path, {"Sheet": [HEADER] + [(f"AIB/{n}/2020", "Name") for n in range(5)]})
+            chunks = []
+            queue = mock.Mock(put=chunks.append)
+            employee_import.read_sheet_chunks((path, None), queue, chunk_size=2)
+        self.assertEqual([len(chunk) for chunk in chunks[:-1]], [2, 2, 1])
+        self.assertIsNone(chunks[-1])
@@ -0,0 +1,42 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from awash.tests.utils import make_employee
+
+
+class EmployeeSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user("hr", password="x", is_staff=True)
+        make_employee("AIB/100/2020", "Abebe Kebede", user=False)
+        make_employee("AIB/101/2020", "abeba Tadesse", user=False, last_promotion_date=date.today() - timedelta(days=5))
+        make_employee("AIB/200/2021", "Zewditu Abebe", user=False)
+
+    def search(self, **params):
+        self.client.force_login(self.hr)
+        return self.client.get(reverse("employee_search"), params).json()
+
+    def test_prefix_on_name_or_id_case_insensitive(self):
+        names = [row["full_name"] for row in self.search(q="ABEB")["results"]]
+        self.assertEqual(names, ["Abebe Kebede", "abeba Tadesse"])
+        self.assertEqual([row["employee_id"] for row in self.search(q="aib/2")["results"]], ["AIB/200/2021"])
+        self.assertEqual(self.search(q="  ")["results"], [])
+
+    def test_reports_eligibility(self):
+        rows = {row["employee_id"]: row for row in self.search(q="aib")["results"]}
+        self.assertTrue(rows["AIB/100/2020"]["eligible"])
+        self.assertFalse(rows["AIB/101/2020"]["eligible"])
+
+    def test_pages(self):
+        first = self.search(q="aib", page_size=10)
+        self.assertFalse(first["has_more"])
+        self.assertEqual(len(first["results"]), 3)
+        self.assertEqual(self.search(q="aib", page=2)["results"], [])
+        self.assertEqual(self.search(q="aib", page="9" * 30), {"results": [], "page": int("9" * 30), "has_more": False})
+
+    def test_hr_only(self):
+        self.client.logout()
+        self.assertEqual(self.client.get(reverse("employee_search"), {"q": "a"}).status_code, 403)
@@ -0,0 +1,52 @@
+import csv
+import io
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from awash.models import Promotion
+from awash.tests.utils import make_employee
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user("hr", password="x", is_staff=True)
+        employee = make_employee(full_name="@SUM(A1:A9)")
+        Promotion.objects.create(
+            employee=employee,
+            old_grade="-1+1",
+            new_grade="Branch Manager",
+            promoted_at=date(2024, 3, 1),
+            remarks='=HYPERLINK("http://example.com","details")',
+        )
+
+    def export(self, file_format):
+        self.client.force_login(self.hr)
+        response = self.client.get(reverse("export_promotions"), {"format": file_format})
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content)
+
+    def assertNeutralised(self, row):
+        self.assertEqual(row, [
+            "AIB/00001/2020",
+            "'@SUM(A1:A9)",
+            "'-1+1",
+            "Branch Manager",
+            "2024-03-01",
+            "'=HYPERLINK(\"http://example.com\",\"details\")",
+        ])
+
+    def test_csv_formulas_are_neutralised(self):
+        rows = list(csv.reader(io.StringIO(self.export("csv").decode("utf-8-sig"))))
+        self.assertEqual(rows[0][:2], ["Employee ID", "Employee Name"])
+        self.assertNeutralised(rows[1])
+
+    def test_xlsx_formulas_are_neutralised(self):
+        worksheet = load_workbook(io.BytesIO(self.export("xlsx")), read_only=True).active
+        rows = [list(row) for row in worksheet.iter_rows(values_only=True)]
+        self.assertNeutralised(rows[1])
@@ -0,0 +1,57 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from awash.models import Employee
+from awash.tests.utils import write_workbook
+
+HEADER = ("employee_id", "full_name", "department", "email", "phone")
+
+
+class ImportEmployeesDeltaSyncTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "employees.xlsx")
+        Employee.objects.create(employee_id="AIB/1", full_name="Abebe Kebede", position="Teller", email="a@x.com")
+        Employee.objects.create(employee_id="AIB/2", full_name="Almaz Bekele", position="Clerk")
+        Employee.objects.create(employee_id="AIB/9", full_name="Left The Bank")
+
+    def sync(self, rows, *args):
+        write_workbook(self.path, {"Sheet": [HEADER, *rows]})
+        out = StringIO()
+        call_command("import_employees", self.path, *args, stdout=out)
+        return out.getvalue()
+
+    ROWS = [
+        ("AIB/1", "Abebe Kebede", "Teller", "a@x.com", None),  # unchanged
+        ("AIB/2", "Almaz Bekele", "Senior Clerk", None, "0911"),  # changed
+        ("AIB/3", "Dawit Hana", "Auditor", None, None),  # new
+        ("AIB/4", None, "Auditor", None, None),  # invalid: no name
+    ]
+
+    def test_writes_only_the_delta(self):
+        output = self.sync(self.ROWS)
+        self.assertIn("1 new, 1 changed, 1 unchanged, 1 missing from file, 1 invalid rows", output)
+        almaz = Employee.objects.get(employee_id="AIB/2")
+        self.assertEqual((almaz.position, almaz.phone, almaz.email), ("Senior Clerk", "0911", None))
+        self.assertEqual(Employee.objects.get(employee_id="AIB/3").position, "Auditor")
+        # Missing employees are reported, never deleted
+        self.assertTrue(Employee.objects.filter(employee_id="AIB/9").exists())
+
+        again = self.sync(self.ROWS)
+        self.assertIn("0 new, 0 changed, 3 unchanged", again)
+
+    def test_dry_run_writes_nothing(self):
+        output = self.sync(self.ROWS, "--dry-run")
+        self.assertIn("Dry run", output)
+        self.assertFalse(Employee.objects.filter(employee_id="AIB/3").exists())
+        self.assertEqual(Employee.objects.get(employee_id="AIB/2").position, "Clerk")
+
+    def test_requires_an_employee_id_column(self):
+        write_workbook(self.path, {"Sheet": [("name",), ("Abebe",)]})
+        with self.assertRaises(CommandError):
+            call_command("import_employees", self.path, stdout=StringIO())
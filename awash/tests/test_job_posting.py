@@ -0,0 +1,78 @@
+import json
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from awash.models import Job, VacancySequence
+from awash.tests.utils import make_job
+from awash.utils.counters import find_drift
+from awash.utils.search import search_jobs
+
+
+class VacancySequenceTests(TestCase):
+    def setUp(self):
+        self.year = timezone.now().year
+
+    def test_numbers_are_consecutive(self):
+        first, second = make_job(), make_job()
+        self.assertEqual(first.vacancy_number, f"VAC-{self.year}-000001")
+        self.assertEqual(second.vacancy_number, f"VAC-{self.year}-000002")
+
+    def test_block_allocation(self):
+        self.assertEqual(VacancySequence.allocate(self.year, 10), 1)
+        self.assertEqual(VacancySequence.allocate(self.year, 1), 11)
+
+    def test_new_sequence_continues_after_existing_numbers(self):
+        job = make_job()
+        Job.objects.filter(id=job.id).update(vacancy_number=f"VAC-{self.year}-000041")
+        VacancySequence.objects.all().delete()
+        self.assertEqual(make_job().vacancy_number, f"VAC-{self.year}-000042")
+
+    def test_editing_keeps_the_number(self):
+        job = make_job()
+        number = job.vacancy_number
+        job.title = "Renamed"
+        job.save()
+        self.assertEqual(Job.objects.get(id=job.id).vacancy_number, number)
+
+
+class BulkPostingTests(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create_user("hr", password="x", is_staff=True))
+
+    def post(self, jobs):
+        return self.client.post(reverse("post_jobs_bulk"), json.dumps({"jobs": jobs}), content_type="application/json")
+
+    def test_posts_all_rows_with_a_block_of_numbers(self):
+        deadline = (date.today() + timedelta(days=10)).isoformat()
+        response = self.post([
+            {"title": "Teller", "deadline": deadline, "vacancy_type": "Internal"},
+            {"title": "Credit Analyst", "deadline": f"{deadline} 00:00:00", "is_active": "yes"},
+            {"title": "Old Posting", "deadline": "2000-01-01"},
+        ])
+        self.assertEqual(response.status_code, 201)
+        numbers = [row["vacancy_number"] for row in response.json()["created"]]
+        self.assertEqual(len(set(numbers)), 3)
+        self.assertEqual(Job.objects.get(title="Teller").vacancy_type, "internal")
+        self.assertFalse(Job.objects.get(title="Old Posting").is_active)
+        # What bulk_create skips is done alongside: search index and counters
+        self.assertEqual([hit["id"] for hit in search_jobs("credit analyst")], [Job.objects.get(title="Credit Analyst").id])
+        self.assertEqual(find_drift(), {})
+
+    def test_one_bad_row_rejects_the_batch(self):
+        response = self.post([
+            {"title": "Teller", "deadline": "2030-01-01"},
+            {"title": "", "deadline": "someday"},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("2", response.json()["errors"])
+        self.assertFalse(Job.objects.exists())
+
+    def test_rejects_malformed_bodies_and_non_hr(self):
+        self.assertEqual(self.client.post(reverse("post_jobs_bulk"), "nope", content_type="application/json").status_code, 400)
+        self.assertEqual(self.post("not a list").status_code, 400)
+        self.client.logout()
+        self.assertEqual(self.post([]).status_code, 403)
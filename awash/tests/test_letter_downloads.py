@@ -0,0 +1,157 @@
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from awash.models import Application
+from awash.tests.utils import make_employee, make_job
+from awash.utils.downloads import parse_range
+
+LETTER = b"%PDF-1.4 " + bytes(range(256)) * 4
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_ranges(self):
+        self.assertEqual(parse_range("bytes=0-9", 100), (0, 9))
+        self.assertEqual(parse_range("bytes=90-", 100), (90, 99))
+        self.assertEqual(parse_range("bytes=90-500", 100), (90, 99))
+        self.assertEqual(parse_range("bytes=-10", 100), (90, 99))
+        self.assertEqual(parse_range("bytes=-500", 100), (0, 99))
+
+    def test_unsatisfiable(self):
+        self.assertIs(parse_range("bytes=100-", 100), False)
+        self.assertIs(parse_range("bytes=9-5", 100), False)
+        self.assertIs(parse_range("bytes=-0", 100), False)
+
+    def test_ignored(self):
+        for header in (None, "", "bytes=-", "bytes=0-1,5-9", "items=0-9"):
+            self.assertIsNone(parse_range(header, 100), header)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class DownloadLetterTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp(prefix="awash-downloads-")
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.owner = make_employee("AIB/00001/2020")
+        self.application = Application.objects.create(
+            employee=self.owner,
+            job=make_job(),
+            recommendation_letter=SimpleUploadedFile("letter.pdf", LETTER),
+        )
+        self.url = reverse("download_letter", args=[self.application.id])
+
+    def get(self, user, **headers):
+        self.client.force_login(user)
+        return self.client.get(self.url, headers=headers)
+
+    def test_owner_downloads_the_whole_file(self):
+        response = self.get(self.owner.user)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), LETTER)
+        self.assertEqual(response["Content-Length"], str(len(LETTER)))
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("AIB-00001-2020-recommendation.pdf", response["Content-Disposition"])
+
+    def test_access(self):
+        hr = User.objects.create_user("hr", password="x", is_staff=True)
+        self.assertEqual(self.get(hr).status_code, 200)
+        self.assertEqual(self.get(make_employee("AIB/00002/2020").user).status_code, 404)
+
+        self.client.logout()
+        self.assertRedirects(self.client.get(self.url), reverse("login"), fetch_redirect_response=False)
+
+    def test_missing_letter(self):
+        Application.objects.filter(id=self.application.id).update(recommendation_letter="")
+        self.assertEqual(self.get(self.owner.user).status_code, 404)
+
+    def test_etag_is_the_content_hash(self):
+        response = self.get(self.owner.user)
+        sha = self.application.recommendation_letter.name.rsplit("/", 1)[1].split(".")[0]
+        self.assertEqual(response["ETag"], f'"{sha}"')
+
+        cached = self.get(self.owner.user, if_none_match=f'W/"{sha}"')
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached["ETag"], f'"{sha}"')
+
+    def test_range(self):
+        response = self.get(self.owner.user, range="bytes=9-18")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), LETTER[9:19])
+        self.assertEqual(response["Content-Range"], f"bytes 9-18/{len(LETTER)}")
+        self.assertEqual(response["Content-Length"], "10")
+
+        tail = self.get(self.owner.user, range="bytes=-4")
+        self.assertEqual(b"".join(tail.streaming_content), LETTER[-4:])
+
+    def test_unsatisfiable_range(self):
+        response = self.get(self.owner.user, range=f"bytes={len(LETTER)}-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], f"bytes */{len(LETTER)}")
+
+    def test_stale_if_range_sends_the_whole_file(self):
+        response = self.get(self.owner.user, range="bytes=0-9", if_range='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), LETTER)
+
+    @override_settings(SENDFILE_BACKEND="nginx", SENDFILE_URL_PREFIX="/protected/")
+    def test_sendfile_backend(self):
+        response = self.get(self.owner.user)
+        self.assertEqual(response["X-Accel-Redirect"], "/protected/" + self.application.recommendation_letter.name)
+        self.assertEqual(response.content, b"")
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class JobLettersZipTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp(prefix="awash-downloads-")
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.job = make_job()
+        self.url = reverse("download_job_letters", args=[self.job.id])
+        for number, content in ((1, LETTER), (2, b"%PDF-1.4 second")):
+            Application.objects.create(
+                employee=make_employee(f"AIB/0000{number}/2020"),
+                job=self.job,
+                recommendation_letter=SimpleUploadedFile("letter.PDF", content),
+            )
+        Application.objects.create(employee=make_employee("AIB/00003/2020"), job=self.job)
+
+    def test_zip_holds_every_letter(self):
+        self.client.force_login(User.objects.create_user("hr", password="x", is_staff=True))
+        response = self.client.get(self.url)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        self.assertIn(f"letters_{self.job.vacancy_number.replace('/', '-')}.zip", response["Content-Disposition"])
+
+        with zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content))) as archive:
+            self.assertEqual(archive.namelist(), ["AIB-00001-2020.pdf", "AIB-00002-2020.pdf"])
+            self.assertEqual(archive.read("AIB-00001-2020.pdf"), LETTER)
+            self.assertEqual(archive.read("AIB-00002-2020.pdf"), b"%PDF-1.4 second")
+
+    def test_missing_files_are_listed(self):
+        missing = Application.objects.get(employee__employee_id="AIB/00002/2020").recommendation_letter
+        os.remove(missing.path)
+        self.client.force_login(User.objects.create_user("hr", password="x", is_staff=True))
+
+        response = self.client.get(self.url)
+        with zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content))) as archive:
+            self.assertEqual(archive.namelist(), ["AIB-00001-2020.pdf", "MISSING.txt"])
+            self.assertIn(b"AIB/00002/2020", archive.read("MISSING.txt"))
+
+    def test_hr_only(self):
+        self.client.force_login(Application.objects.first().employee.user)
+        self.assertRedirects(self.client.get(self.url), reverse("login"), fetch_redirect_response=False)
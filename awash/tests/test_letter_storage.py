@@ -0,0 +1,136 @@
+import os
+import shutil
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from awash.models import Application, LetterBlob
+from awash.storage import collect_blob
+from awash.tests.utils import make_employee, make_job
+
+
+def letter(content=b"%PDF-1.4 recommendation", name="letter.pdf"):
+    return SimpleUploadedFile(name, content, content_type="application/pdf")
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class LetterStorageTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp(prefix="awash-letters-")
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.employees = [make_employee(f"AIB/0000{i}/2020") for i in range(1, 4)]
+        self.job = make_job()
+
+    def apply(self, employee, upload):
+        return Application.objects.create(employee=employee, job=self.job, recommendation_letter=upload)
+
+    def refs(self, name):
+        return LetterBlob.objects.filter(name=name).values_list("ref_count", flat=True).first()
+
+    def path(self, name):
+        return os.path.join(self.media_root, name)
+
+    def test_identical_uploads_share_one_file(self):
+        first = self.apply(self.employees[0], letter())
+        second = self.apply(self.employees[1], letter(name="copy.PDF"))
+        other = self.apply(self.employees[2], letter(b"%PDF-1.4 another letter"))
+
+        name = first.recommendation_letter.name
+        self.assertEqual(second.recommendation_letter.name, name)
+        self.assertRegex(name, r"^recommendations/[0-9a-f]{2}/[0-9a-f]{64}\.pdf$")
+        self.assertNotEqual(other.recommendation_letter.name, name)
+        self.assertEqual(self.refs(name), 2)
+        self.assertEqual(self.refs(other.recommendation_letter.name), 1)
+        directory = os.path.dirname(self.path(name))
+        self.assertEqual([entry for entry in os.listdir(directory) if entry.startswith(".upload-")], [])
+
+    def test_file_is_deleted_with_its_last_reference(self):
+        first = self.apply(self.employees[0], letter())
+        second = self.apply(self.employees[1], letter())
+        name = first.recommendation_letter.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(self.refs(name), 1)
+        self.assertTrue(os.path.exists(self.path(name)))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertIsNone(self.refs(name))
+        self.assertFalse(os.path.exists(self.path(name)))
+
+    def test_replacing_a_letter_releases_the_old_one(self):
+        application = self.apply(self.employees[0], letter())
+        old_name = application.recommendation_letter.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application.recommendation_letter = letter(b"%PDF-1.4 revised")
+            application.save()
+        self.assertIsNone(self.refs(old_name))
+        self.assertFalse(os.path.exists(self.path(old_name)))
+        self.assertEqual(self.refs(application.recommendation_letter.name), 1)
+
+        # Uploading the same bytes again keeps a single reference
+        application.recommendation_letter = letter(b"%PDF-1.4 revised")
+        application.save()
+        self.assertEqual(self.refs(application.recommendation_letter.name), 1)
+
+    def test_sharing_a_stored_name_counts_a_reference(self):
+        first = self.apply(self.employees[0], letter())
+        name = first.recommendation_letter.name
+        self.apply(self.employees[1], name)
+        self.assertEqual(self.refs(name), 2)
+
+    def test_upload_racing_a_release_keeps_the_file(self):
+        first = self.apply(self.employees[0], letter())
+        name = first.recommendation_letter.name
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            first.delete()
+        self.assertEqual(self.refs(name), 0)
+        # The same bytes arrive before the release's on-commit delete runs
+        second = self.apply(self.employees[1], letter())
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(second.recommendation_letter.name, name)
+        self.assertEqual(self.refs(name), 1)
+        self.assertTrue(os.path.exists(self.path(name)))
+
+    def test_upload_after_collection_writes_the_file_again(self):
+        first = self.apply(self.employees[0], letter())
+        name = first.recommendation_letter.name
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+
+        second = self.apply(self.employees[1], letter())
+        self.assertEqual(second.recommendation_letter.name, name)
+        self.assertEqual(self.refs(name), 1)
+        with open(self.path(name), "rb") as handle:
+            self.assertEqual(handle.read(), b"%PDF-1.4 recommendation")
+
+    def test_collect_skips_referenced_blobs(self):
+        application = self.apply(self.employees[0], letter())
+        name = application.recommendation_letter.name
+        collect_blob(name, application.recommendation_letter.storage)
+        self.assertEqual(self.refs(name), 1)
+        self.assertTrue(os.path.exists(self.path(name)))
+
+    def test_duplicate_apply_stores_nothing(self):
+        self.client.force_login(self.employees[0].user)
+        url = reverse("apply", args=[self.job.id])
+        self.client.post(url, {"recommendation_letter": letter()})
+        # The second letter is stored before the insert finds the duplicate, then collected
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, {"recommendation_letter": letter(b"%PDF-1.4 second try")})
+
+        application = Application.objects.get(job=self.job)
+        self.assertRegex(application.recommendation_letter.name, r"^recommendations/[0-9a-f]{2}/[0-9a-f]{64}\.pdf$")
+        self.assertEqual(list(LetterBlob.objects.values_list("ref_count", flat=True)), [1])
+        stored = [files for _, _, files in os.walk(os.path.join(self.media_root, "recommendations"))]
+        self.assertEqual(sum(len(files) for files in stored), 1)
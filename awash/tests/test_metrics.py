@@ -0,0 +1,118 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from awash.models import Application
+from awash.tests.utils import make_employee, make_job
+from awash.utils import metrics
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+class MetricsDirMixin:
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.metrics_dir = directory.name
+        dir_setting = override_settings(METRICS_DIR=directory.name)
+        dir_setting.enable()
+        self.addCleanup(dir_setting.disable)
+        metrics.reset_store()
+        self.addCleanup(metrics.reset_store)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    METRICS_TOKEN="scrape-token",
+    METRICS_PUBLIC=False,
+    INTERNAL_IPS=[],
+)
+class MetricsViewTests(MetricsDirMixin, TestCase):
+    def scrape(self, **kwargs):
+        return self.client.get(reverse("metrics"), **kwargs)
+
+    def test_requires_token_staff_or_internal_ip(self):
+        self.assertEqual(self.scrape().status_code, 401)
+        self.assertEqual(self.scrape(headers={"Authorization": "Bearer wrong"}).status_code, 401)
+        self.assertEqual(self.scrape(headers={"Authorization": "Bearer scrape-token"}).status_code, 200)
+        self.assertEqual(self.scrape(REMOTE_ADDR="10.0.0.5").status_code, 401)
+        with self.settings(INTERNAL_IPS=["10.0.0.5"]):
+            self.assertEqual(self.scrape(REMOTE_ADDR="10.0.0.5").status_code, 200)
+
+        self.client.force_login(User.objects.create_user("clerk", password="x"))
+        self.assertEqual(self.scrape().status_code, 401)
+        self.client.force_login(User.objects.create_user("hr", password="x", is_staff=True))
+        self.assertEqual(self.scrape().status_code, 200)
+
+    @override_settings(METRICS_TOKEN=None)
+    def test_no_token_is_not_public(self):
+        self.assertEqual(self.scrape().status_code, 401)
+        self.assertEqual(self.scrape(headers={"Authorization": "Bearer "}).status_code, 401)
+        with self.settings(METRICS_PUBLIC=True):
+            self.assertEqual(self.scrape().status_code, 200)
+
+    def test_gauges_come_from_the_counters(self):
+        employee = make_employee()
+        Application.objects.create(employee=employee, job=make_job("Teller"))
+        closed = make_job("Clerk")
+        Application.objects.create(employee=employee, job=closed)
+        closed.is_active = False
+        closed.save()
+
+        with self.assertNumQueries(1):
+            body = self.scrape(headers={"Authorization": "Bearer scrape-token"}).content.decode()
+        self.assertIn("awash_active_jobs 1\n", body)
+        self.assertIn("awash_pending_applications 1\n", body)
+
+
+class TestMetricsDirTests(SimpleTestCase):
+    def test_suite_writes_outside_the_deployment_directory(self):
+        default = os.path.join(tempfile.gettempdir(), "awash-metrics")
+        self.assertNotEqual(os.path.realpath(settings.METRICS_DIR), os.path.realpath(default))
+        metrics.inc("awash_uploads_total", view="apply")
+        self.assertEqual(os.path.dirname(metrics.get_store().path), settings.METRICS_DIR)
+
+
+class MergeDeadProcessesTests(MetricsDirMixin, SimpleTestCase):
+    def write(self, pid, **values):
+        store = metrics.MmapStore(os.path.join(self.metrics_dir, f"metrics_{pid}.db"))
+        for view, amount in values.items():
+            store.add(metrics._key("awash_uploads_total", {"view": view}), amount)
+        store.close()
+
+    def uploads(self):
+        return {
+            dict(labels)["view"]: value
+            for (name, labels), value in metrics.collect().items()
+            if name == "awash_uploads_total"
+        }
+
+    def test_dead_workers_are_merged_and_removed(self):
+        first, second = dead_pid(), dead_pid()
+        self.write(first, apply=2)
+        self.write(second, apply=3, register=1)
+        self.write(os.getpid(), apply=1)
+
+        self.assertEqual(metrics.merge_dead_processes(), 2)
+        self.assertEqual(
+            sorted(os.listdir(self.metrics_dir)),
+            sorted([".merge.lock", metrics.MERGED_FILE, f"metrics_{os.getpid()}.db"]),
+        )
+        self.assertEqual(self.uploads(), {"apply": 6, "register": 1})
+
+        # Later merges add to the retired totals
+        self.write(dead_pid(), apply=4)
+        self.assertEqual(metrics.merge_dead_processes(), 1)
+        self.assertEqual(self.uploads(), {"apply": 10, "register": 1})
+        self.assertEqual(metrics.merge_dead_processes(), 0)
@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from awash.models import Job
+from awash.tests.utils import make_employee, make_job
+from awash.utils.pagination import decode_cursor, encode_cursor, get_page_size, keyset_paginate
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.jobs = [make_job(f"Job {n}") for n in range(7)]
+        # Two jobs share a timestamp so the id tiebreak is exercised
+        for offset, job in enumerate(cls.jobs):
+            Job.objects.filter(id=job.id).update(posted_date=now - timedelta(hours=min(offset, 5)))
+        cls.newest_first = list(Job.objects.order_by("-posted_date", "-id").values_list("id", flat=True))
+
+    def ids(self, page):
+        return [job.id for job in page]
+
+    def test_walks_forward_and_back_without_gaps(self):
+        queryset = Job.objects.all()
+        pages = [keyset_paginate(queryset, "posted_date", page_size=3)]
+        while pages[-1].has_next:
+            pages.append(keyset_paginate(queryset, "posted_date", after=pages[-1].next_cursor, page_size=3))
+        self.assertEqual([job for page in pages for job in self.ids(page)], self.newest_first)
+        self.assertFalse(pages[0].has_previous)
+
+        back = keyset_paginate(queryset, "posted_date", before=pages[-1].previous_cursor, page_size=3)
+        self.assertEqual(self.ids(back), self.ids(pages[-2]))
+
+    def test_bad_cursor_starts_over(self):
+        page = keyset_paginate(Job.objects.all(), "posted_date", after="not-a-cursor", page_size=3)
+        self.assertEqual(self.ids(page), self.newest_first[:3])
+
+    def test_cursor_round_trip(self):
+        job = Job.objects.get(id=self.newest_first[0])
+        field = Job._meta.get_field("posted_date")
+        self.assertEqual(decode_cursor(encode_cursor(job.posted_date, job.id), field), (job.posted_date, job.id))
+        self.assertIsNone(decode_cursor("%%%", field))
+
+    def test_page_size_choices(self):
+        factory = RequestFactory()
+        self.assertEqual(get_page_size(factory.get("/", {"page_size": "10"})), 10)
+        self.assertEqual(get_page_size(factory.get("/", {"page_size": "7"})), 25)
+        self.assertEqual(get_page_size(factory.get("/", {"page_size": "x"})), 25)
+
+    def test_all_jobs_board(self):
+        self.client.force_login(make_employee().user)
+        response = self.client.get(reverse("all_jobs"), {"page_size": 5})
+        self.assertEqual(self.ids(response.context["jobs"]), self.newest_first[:5])
+        following = self.client.get(reverse("all_jobs"), {"page_size": 5, "after": response.context["jobs"].next_cursor})
+        self.assertEqual(self.ids(following.context["jobs"]), self.newest_first[5:])
+        # Only the listed columns are loaded
+        self.assertNotIn("description", response.context["jobs"].object_list[0].__dict__)
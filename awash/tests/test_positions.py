@@ -0,0 +1,67 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from awash.models import Position, Promotion
+from awash.tests.utils import make_employee
+from awash.utils.position_index import reset_index
+
+
+class PositionCatalogTests(TestCase):
+    def setUp(self):
+        reset_index()
+
+    def test_migration_seeds_the_catalog(self):
+        self.assertGreater(Position.objects.count(), 800)
+        self.assertEqual(Position.objects.get(title="Acting Branch Manager Class I (XIV)").grade, "XIV")
+
+    def test_catalog_title(self):
+        self.assertEqual(Position.catalog_title(" acting  branch auditor"), "Acting Branch Auditor")
+        self.assertIsNone(Position.catalog_title("Chief Everything Officer"))
+        self.assertIsNone(Position.catalog_title(""))
+        Position.objects.filter(title="Acting Branch Auditor").update(is_active=False)
+        self.assertIsNone(Position.catalog_title("Acting Branch Auditor"))
+
+    def test_synthetic_data_needs_the_catalog(self):
+        Position.objects.update(is_active=False)
+        with self.assertRaisesMessage(CommandError, "position catalog is empty"):
+            call_command("seed_data", scale=0, stdout=StringIO())
+
+    def test_typeahead_prefix_then_substring(self):
+        results = self.client.get(reverse("position_search"), {"q": "branch auditor", "limit": 5}).json()["results"]
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all("branch auditor" in result["title"].lower() for result in results))
+        self.assertTrue(results[0]["title"].lower().startswith("branch auditor"))
+
+    def test_typeahead_etag_changes_with_the_catalog(self):
+        first = self.client.get(reverse("position_search"), {"q": "teller"})
+        unchanged = self.client.get(reverse("position_search"), {"q": "teller"}, headers={"If-None-Match": first["ETag"]})
+        self.assertEqual(unchanged.status_code, 304)
+        Position.objects.create(title="Teller Supervisor (IX)")
+        changed = self.client.get(reverse("position_search"), {"q": "teller"}, headers={"If-None-Match": first["ETag"]})
+        self.assertEqual(changed.status_code, 200)
+        self.assertIn("Teller Supervisor (IX)", [result["title"] for result in changed.json()["results"]])
+
+
+class PromotionPositionTests(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create_user("hr", password="x", is_staff=True))
+        self.employee = make_employee()
+
+    def promote(self, position):
+        return self.client.post(reverse("promotion"), {
+            "employee": self.employee.id, "new_position": position, "promoted_at": "2024-01-15",
+        })
+
+    def test_rejects_positions_outside_the_catalog(self):
+        self.promote("Chief Everything Officer")
+        self.assertFalse(Promotion.objects.exists())
+        self.employee.refresh_from_db()
+        self.assertIsNone(self.employee.last_promotion_date)
+
+    def test_stores_the_catalog_title(self):
+        self.promote("acting branch auditor")
+        self.assertEqual(Promotion.objects.get().new_grade, "Acting Branch Auditor")
@@ -0,0 +1,113 @@
+import os
+import tempfile
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from awash.tests.utils import make_job
+from awash.utils.profiling import list_profiles, profile_path, prune_profiles
+
+
+class ProfileDirMixin:
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.profile_dir = directory.name
+        dir_setting = override_settings(PROFILING={"DIR": directory.name, "KEEP": 3})
+        dir_setting.enable()
+        self.addCleanup(dir_setting.disable)
+
+    def saved(self):
+        return sorted(os.listdir(self.profile_dir))
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class ProfilerMiddlewareTests(ProfileDirMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user("hr", password="x", is_staff=True)
+        make_job()
+
+    def test_staff_request_is_profiled(self):
+        self.client.force_login(self.hr)
+        response = self.client.get(reverse("all_jobs"), {"profile": "1"})
+
+        name = response["X-Profile"]
+        self.assertEqual(self.saved(), [f"{name}.collapsed", f"{name}.json", f"{name}.prof"])
+        [profile] = list_profiles()
+        self.assertEqual(profile["name"], name)
+        self.assertEqual(profile["view"], "all_jobs")
+        self.assertEqual(profile["user"], "hr")
+        self.assertFalse(profile["streaming"])
+
+        header = self.client.get(reverse("all_jobs"), headers={"X-Profile": "1"})
+        self.assertIn("X-Profile", header)
+        self.assertIsNone(self.client.get(reverse("all_jobs")).get("X-Profile"))
+
+    def test_other_users_are_never_profiled(self):
+        response = self.client.get(reverse("all_jobs"), {"profile": "1"}, headers={"X-Profile": "1"})
+        self.assertNotIn("X-Profile", response)
+
+        self.client.force_login(User.objects.create_user("clerk", password="x"))
+        response = self.client.get(reverse("all_jobs"), {"profile": "1"}, headers={"X-Profile": "1"})
+        self.assertNotIn("X-Profile", response)
+        self.assertEqual(self.saved(), [])
+
+    def test_streaming_responses_are_marked(self):
+        self.client.force_login(self.hr)
+        response = self.client.get(reverse("export_promotions"), {"profile": "1"})
+        b"".join(response.streaming_content)
+        self.assertTrue(list_profiles()[0]["streaming"])
+
+    def test_only_keep_profiles_are_kept(self):
+        self.client.force_login(self.hr)
+        names = [self.client.get(reverse("all_jobs"), {"profile": "1"})["X-Profile"] for _ in range(5)]
+        self.assertEqual([profile["name"] for profile in list_profiles()], names[:-4:-1])
+        self.assertEqual(len(self.saved()), 9)
+
+    def test_downloads_are_staff_only(self):
+        self.client.force_login(self.hr)
+        name = self.client.get(reverse("all_jobs"), {"profile": "1"})["X-Profile"]
+        url = reverse("download_profile", args=[name, "collapsed"])
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.client.force_login(User.objects.create_user("clerk", password="x"))
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+class ProfileFilesTests(ProfileDirMixin, SimpleTestCase):
+    def touch(self, name, suffixes=(".json", ".prof", ".collapsed")):
+        for suffix in suffixes:
+            with open(os.path.join(self.profile_dir, name + suffix), "w") as handle:
+                handle.write("{}")
+
+    def test_profile_path_rejects_bad_names(self):
+        self.touch("20260101-120000-10-1")
+        self.touch("notes", (".prof",))
+        self.assertEqual(
+            profile_path("20260101-120000-10-1", "prof"),
+            os.path.join(self.profile_dir, "20260101-120000-10-1.prof"),
+        )
+        for name, kind in [
+            ("20260101-120000-10-1", "json"),
+            ("20260101-120000-10-1", "exe"),
+            ("notes", "prof"),
+            ("../20260101-120000-10-1", "prof"),
+            ("20260101-120000-10-1/../notes", "prof"),
+            ("20260101-120000-10-2", "prof"),  # well formed but not saved
+        ]:
+            self.assertIsNone(profile_path(name, kind), (name, kind))
+
+    def test_pruning_keeps_the_newest(self):
+        names = ["20260101-120000-10-1", "20260101-120000-10-2", "20260101-120000-10-10", "20260102-090000-11-1"]
+        for name in names:
+            self.touch(name)
+        self.touch("notes", (".json",))
+
+        prune_profiles(3)
+        self.assertEqual(
+            self.saved(),
+            sorted(f"{name}{suffix}" for name in names[1:] for suffix in (".json", ".prof", ".collapsed")) + ["notes.json"],
+        )
@@ -0,0 +1,252 @@
+import os
+import shutil
+import sys
+import tempfile
+
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.template.base import Node
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from awash import views
+from awash.models import Allemployee_record, Application, Employee, Job
+from awash.utils.employee_lookup import employee_cache
+from awash.utils.position_index import reset_index
+from awash.utils.synthetic import SyntheticData
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(TESTS_DIR)
+MEDIA_ROOT = tempfile.mkdtemp(prefix="awash-test-media-")
+
+# Two dataset sizes; every view must issue the same number of queries on both
+SMALL = {"records": 40, "employees": 20, "jobs": 6, "applications": 60, "promotions": 20}
+LARGE = {"records": 160, "employees": 80, "jobs": 24, "applications": 600, "promotions": 120}
+
+
+def query_origin(limit=4):
+    """Where a query came from: awash code and template lines, innermost first."""
+    origin = []
+    frame = sys._getframe(2)
+    while frame and len(origin) < limit:
+        code = frame.f_code
+        node = frame.f_locals.get("self") if code.co_name == "render_annotated" else None
+        if isinstance(node, Node) and getattr(node, "token", None) and getattr(node, "origin", None):
+            origin.append(f"{node.origin.template_name}:{node.token.lineno} {{{node.token.contents[:60]}}}")
+        elif code.co_filename.startswith(APP_DIR) and not code.co_filename.startswith(TESTS_DIR):
+            origin.append(f"{os.path.relpath(code.co_filename, APP_DIR)}:{frame.f_lineno} in {code.co_name}")
+        frame = frame.f_back
+    return origin
+
+
+class QueryRecorder:
+    """execute_wrapper that keeps each query's SQL with the code/template lines that issued it."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((sql, query_origin()))
+        return execute(sql, params, many, context)
+
+    def __len__(self):
+        return len(self.queries)
+
+    def report(self):
+        lines = []
+        for number, (sql, origin) in enumerate(self.queries, start=1):
+            lines.append(f"{number:>3}. {sql[:300]}")
+            lines.extend(f"       at {where}" for where in origin)
+        return "\n".join(lines)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    MEDIA_ROOT=MEDIA_ROOT,
+    METRICS_TOKEN="budget-token",
+)
+class QueryBudgetTests(TestCase):
+    """
+    Each view has a query budget that must hold at both dataset sizes, and
+    its query count must not grow with the data (no per-row queries).
+    A failure prints every query with the view/template line behind it.
+    """
+
+    # view name -> most queries allowed, including the session and user lookups
+    BUDGETS = {
+        "all_jobs": 5,
+        "all_jobs_search": 6,
+        "applicants_list": 4,
+        "view_applicants_per_job": 4,
+        "hr_dashboard": 4,
+        "all_users": 4,
+        "all_users_directory": 4,
+        "promotion": 2,
+        "promotion_list": 3,
+        "my_applications": 4,
+        "employee_search": 3,
+        "eligible_employees": 4,
+        "get_employee": 1,
+        "position_search": 1,
+        "export_applicants": 3,
+        "export_promotions": 3,
+        "register": 0,
+        "employee_dashboard": 3,
+        "view_detail": 4,
+        "apply": 4,
+        "download_letter": 3,
+        "profiles": 2,
+        "metrics": 1,
+        "healthz": 1,
+        "readyz": 3,
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user("hr", password="x", is_staff=True)
+        SyntheticData(seed=1, prefix="QS").generate(**SMALL)
+        cls.letter_application = Application.objects.order_by("id").first()
+        cls.letter_application.recommendation_letter.save("letter.pdf", ContentFile(b"%PDF-1.4 budget"))
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def grow(self):
+        delta = {name: LARGE[name] - SMALL[name] for name in LARGE}
+        SyntheticData(seed=2, prefix="QL").generate(**delta)
+
+    def request(self, user, url, data=None, headers=None):
+        """GET ``url`` as ``user`` (None for anonymous) and record its queries."""
+        employee_cache.clear()
+        reset_index()
+        if user is None:
+            self.client.logout()
+        else:
+            self.client.force_login(user)
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            response = self.client.get(url, data, headers=headers)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        self.assertLess(response.status_code, 400, f"{url} returned {response.status_code}")
+        return recorder
+
+    def assertWithinBudget(self, name, build):
+        """``build()`` returns (user, url, data[, headers]); it is called again after the data grows."""
+        budget = self.BUDGETS[name]
+        small = self.request(*build())
+        self.grow()
+        large = self.request(*build())
+        for label, recorder in (("small", small), ("large", large)):
+            if len(recorder) > budget:
+                self.fail(
+                    f"{name}: {len(recorder)} queries on the {label} dataset, budget is {budget}\n{recorder.report()}"
+                )
+        if len(large) != len(small):
+            self.fail(
+                f"{name}: query count grew with the data ({len(small)} -> {len(large)}); "
+                f"queries on the large dataset:\n{large.report()}"
+            )
+
+    def employee_user(self):
+        return Employee.objects.filter(user__isnull=False).order_by("id").first().user
+
+    def busiest_job(self):
+        return Application.objects.values_list("job_id", flat=True).order_by("job_id").first()
+
+    def test_all_jobs(self):
+        self.assertWithinBudget("all_jobs", lambda: (self.employee_user(), reverse("all_jobs"), None))
+
+    def test_all_jobs_search(self):
+        self.assertWithinBudget("all_jobs_search", lambda: (self.employee_user(), reverse("all_jobs"), {"q": "officer"}))
+
+    def test_applicants_list(self):
+        self.assertWithinBudget("applicants_list", lambda: (self.hr, reverse("applicants"), None))
+
+    def test_view_applicants_per_job(self):
+        job_id = self.busiest_job()
+        self.assertWithinBudget(
+            "view_applicants_per_job", lambda: (self.hr, reverse("view_applicants_per_job", args=[job_id]), None)
+        )
+
+    def test_hr_dashboard(self):
+        self.assertWithinBudget("hr_dashboard", lambda: (self.hr, reverse("hr_dashboard"), None))
+
+    def test_all_users(self):
+        self.assertWithinBudget("all_users", lambda: (self.hr, reverse("users"), None))
+
+    def test_all_users_directory(self):
+        self.assertWithinBudget("all_users_directory", lambda: (self.hr, reverse("users"), {"tab": "directory"}))
+
+    def test_promotion(self):
+        self.assertWithinBudget("promotion", lambda: (self.hr, reverse("promotion"), None))
+
+    def test_promotion_list(self):
+        self.assertWithinBudget("promotion_list", lambda: (self.hr, reverse("promotion_list"), None))
+
+    def test_my_applications(self):
+        user = Application.objects.order_by("id").first().employee.user
+        self.assertWithinBudget("my_applications", lambda: (user, reverse("my_applications"), None))
+
+    def test_employee_search(self):
+        self.assertWithinBudget("employee_search", lambda: (self.hr, reverse("employee_search"), {"q": "a"}))
+
+    def test_eligible_employees(self):
+        job = Job.objects.filter(vacancy_type="internal").order_by("id").first()
+        self.assertWithinBudget("eligible_employees", lambda: (self.hr, reverse("eligible_employees", args=[job.id]), None))
+
+    def test_get_employee(self):
+        employee_id = Allemployee_record.objects.order_by("id").values_list("employee_id", flat=True).first()
+        self.assertWithinBudget(
+            "get_employee", lambda: (self.hr, reverse("get_employee"), {"employee_id": employee_id})
+        )
+
+    def test_position_search(self):
+        self.assertWithinBudget("position_search", lambda: (self.hr, reverse("position_search"), {"q": "officer"}))
+
+    def test_export_applicants(self):
+        self.assertWithinBudget("export_applicants", lambda: (self.hr, reverse("export_applicants"), {"format": "xlsx"}))
+
+    def test_export_promotions(self):
+        self.assertWithinBudget("export_promotions", lambda: (self.hr, reverse("export_promotions"), None))
+
+    def test_register(self):
+        self.assertWithinBudget("register", lambda: (None, reverse("register"), None))
+
+    def test_employee_dashboard(self):
+        self.assertWithinBudget("employee_dashboard", lambda: (self.employee_user(), reverse("employee_dashboard"), None))
+
+    def test_view_detail(self):
+        job_id = self.busiest_job()
+        self.assertWithinBudget("view_detail", lambda: (self.employee_user(), reverse("view_detail", args=[job_id]), None))
+
+    def test_apply_form(self):
+        job_id = self.busiest_job()
+        user = Employee.objects.filter(user__isnull=False, last_promotion_date__isnull=True).order_by("id").first().user
+        self.assertWithinBudget("apply", lambda: (user, reverse("apply", args=[job_id]), None))
+
+    def test_download_letter(self):
+        application = self.letter_application
+        self.assertWithinBudget("download_letter", lambda: (self.hr, reverse("download_letter", args=[application.id]), None))
+
+    def test_profiles(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(PROFILING={"DIR": directory}):
+            self.assertWithinBudget("profiles", lambda: (self.hr, reverse("profiles"), None))
+
+    def test_metrics(self):
+        headers = {"Authorization": "Bearer budget-token"}
+        self.assertWithinBudget("metrics", lambda: (None, reverse("metrics"), None, headers))
+
+    def test_healthz(self):
+        self.assertWithinBudget("healthz", lambda: (None, reverse("healthz"), None))
+
+    def test_readyz(self):
+        def build():
+            # Measure the first probe, which also checks for unapplied migrations
+            views._migrations_applied = False
+            return None, reverse("readyz"), None
+
+        self.assertWithinBudget("readyz", build)
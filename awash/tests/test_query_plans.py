@@ -0,0 +1,54 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.db.models import Count
+from django.test import SimpleTestCase, TestCase
+
+from awash.management.commands.check_query_plans import full_scans, hot_queries, query_plan
+from awash.models import Application
+
+
+class QueryPlanTests(TestCase):
+    def test_hot_queries_use_indexes(self):
+        out = StringIO()
+        call_command("check_query_plans", stdout=out)
+        self.assertIn("No full table scans", out.getvalue())
+
+    def test_unfiltered_job_totals_are_checked(self):
+        names = [name for name, _ in hot_queries()]
+        self.assertIn("applicants: per-job totals", names)
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_covering_index_scan_fails_the_check(self):
+        grouped = Application.objects.values("job_id").annotate(total=Count("id")).order_by()
+        self.assertTrue(any("USING COVERING INDEX" in detail for _, _, detail in query_plan(grouped)))
+
+        out = StringIO()
+        with mock.patch(
+            "awash.management.commands.check_query_plans.hot_queries", return_value=[("grouped", grouped)]
+        ), self.assertRaises(CommandError):
+            call_command("check_query_plans", stdout=out)
+        self.assertIn("FULL SCAN  grouped: awash_application", out.getvalue())
+
+
+class FullScanTests(SimpleTestCase):
+    def test_index_scans_count(self):
+        for step in ("SCAN awash_job", "SCAN awash_job USING INDEX job_posted_idx",
+                     "SCAN awash_application USING COVERING INDEX application_job_applied_idx"):
+            self.assertEqual(full_scans([(2, 0, step)]), [step.split()[1]], step)
+        self.assertEqual(full_scans([(2, 0, "SEARCH awash_job USING INTEGER PRIMARY KEY (rowid=?)")]), [])
+
+    def test_limit_only_bounds_a_streamed_scan(self):
+        page = [(2, 0, "SCAN awash_job USING INDEX job_posted_idx")]
+        self.assertEqual(full_scans(page, limited=True), [])
+        sorted_page = page + [(20, 0, "USE TEMP B-TREE FOR ORDER BY")]
+        self.assertEqual(full_scans(sorted_page, limited=True), ["awash_job"])
+
+    def test_inner_side_of_a_join_is_skipped(self):
+        plan = [
+            (3, 0, "SEARCH awash_application USING INDEX application_job_applied_idx (job_id=?)"),
+            (7, 0, "SCAN awash_employee"),
+        ]
+        self.assertEqual(full_scans(plan), [])
+        self.assertEqual(full_scans(plan[::-1]), ["awash_employee"])
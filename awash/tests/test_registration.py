@@ -0,0 +1,97 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from awash.models import Allemployee_record, Employee
+from awash.utils.employee_lookup import LookupCache, employee_cache
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class RegisterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Allemployee_record.objects.create(employee_id="AIB/1/2020", full_name="Abebe Kebede Tadesse")
+
+    def setUp(self):
+        employee_cache.clear()
+
+    def register(self, employee_id="AIB/1/2020", **fields):
+        data = {
+            "employee_id": employee_id,
+            "email": "abebe@awashbank.com",
+            "position": "Acting Branch Auditor",
+            "password1": "Secret@123",
+            "password2": "Secret@123",
+            **fields,
+        }
+        return self.client.post(reverse("register"), data)
+
+    def lookup(self, employee_id="AIB/1/2020"):
+        return self.client.get(reverse("get_employee"), {"employee_id": employee_id}).json()
+
+    def test_registers_and_links_the_user(self):
+        self.assertEqual(self.lookup()["full_name"], "Abebe Kebede Tadesse")
+        response = self.register()
+        self.assertRedirects(response, reverse("login"), fetch_redirect_response=False)
+        employee = Employee.objects.get(employee_id="AIB/1/2020")
+        self.assertTrue(employee.is_registered)
+        self.assertEqual(employee.user.username, "AIB/1/2020")
+        self.assertEqual((employee.user.first_name, employee.user.last_name), ("Abebe", "Kebede Tadesse"))
+        # The cached "not registered yet" answer is dropped on registration
+        self.assertEqual(self.lookup(), {"error": "already_registered"})
+
+    def test_second_registration_is_refused(self):
+        self.register()
+        response = self.register(password1="Other@123", password2="Other@123")
+        self.assertTrue(response.context["has_account"])
+        self.assertEqual(User.objects.filter(username="AIB/1/2020").count(), 1)
+
+    def test_leftover_user_without_link_is_a_form_error(self):
+        # A half-finished earlier registration: the User exists but the employee isn't linked
+        User.objects.create_user("AIB/1/2020", password="x")
+        Employee.objects.create(employee_id="AIB/1/2020", full_name="Abebe Kebede Tadesse")
+        response = self.register()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["has_account"])
+        self.assertEqual(self.lookup(), {"error": "already_registered"})
+
+    def test_stale_registered_flag_allows_registering_again(self):
+        Employee.objects.create(employee_id="AIB/1/2020", full_name="Abebe Kebede Tadesse", is_registered=True)
+        self.assertEqual(self.lookup()["full_name"], "Abebe Kebede Tadesse")
+        self.assertRedirects(self.register(), reverse("login"), fetch_redirect_response=False)
+
+    def test_position_must_come_from_the_catalog(self):
+        response = self.register(position="Chief Everything Officer")
+        self.assertContains(response, "Choose your position from the list.")
+        self.assertFalse(User.objects.exists())
+
+        self.register(position="  acting   branch AUDITOR ")
+        self.assertEqual(Employee.objects.get(employee_id="AIB/1/2020").position, "Acting Branch Auditor")
+
+    def test_unknown_employee_and_password_mismatch(self):
+        self.assertEqual(self.lookup("AIB/404"), {"error": "not_found"})
+        self.assertIn("Employee not found", self.register("AIB/404").content.decode())
+        self.register(password2="Different@1")
+        self.assertFalse(User.objects.exists())
+
+
+class LookupCacheTests(TestCase):
+    def test_caches_until_invalidated(self):
+        calls = []
+        cache = LookupCache(lambda key: calls.append(key) or len(calls))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("a"), 1)
+        cache.invalidate("a")
+        self.assertEqual(cache.get("a"), 2)
+        self.assertEqual(calls, ["a", "a"])
+
+    def test_bounded_and_expiring(self):
+        cache = LookupCache(str.upper, maxsize=2)
+        for key in "abc":
+            cache.get(key)
+        self.assertEqual(list(cache._entries), ["b", "c"])
+        calls = []
+        expiring = LookupCache(lambda key: calls.append(key), ttl=0)
+        expiring.get("a")
+        expiring.get("a")
+        self.assertEqual(len(calls), 2)
@@ -0,0 +1,73 @@
+import json
+
+from django.contrib.auth.models import User
+from django.template.backends.django import Template
+from django.template.loader import get_template
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from awash.middleware import RequestStats
+from awash.template_backends import TimedTemplate
+from awash.tests.utils import make_job
+
+TIMING = {"SLOW_REQUEST_MS": 10_000, "SLOW_QUERY_MS": 10_000, "MAX_QUERIES": 10_000}
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class RequestTimingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user("hr", password="x", is_staff=True)
+        make_job()
+
+    def server_timing(self, user=None):
+        if user:
+            self.client.force_login(user)
+        return self.client.get(reverse("all_jobs")).get("Server-Timing")
+
+    @override_settings(REQUEST_TIMING=TIMING)
+    def test_header_is_off_by_default(self):
+        self.assertIsNone(self.server_timing())
+        self.assertIsNone(self.server_timing(self.hr))
+
+    @override_settings(REQUEST_TIMING={**TIMING, "SERVER_TIMING_HEADER": "staff"})
+    def test_header_for_staff_only(self):
+        self.assertIsNone(self.server_timing())
+        self.assertIsNone(self.server_timing(User.objects.create_user("clerk", password="x")))
+        header = self.server_timing(self.hr)
+        self.assertRegex(header, r'^db;dur=[\d.]+;desc="\d+ queries", tpl;dur=[\d.]+, total;dur=[\d.]+$')
+
+    @override_settings(REQUEST_TIMING={**TIMING, "SERVER_TIMING_HEADER": True})
+    def test_template_time_is_measured(self):
+        template_ms = float(self.server_timing().split("tpl;dur=")[1].split(",")[0])
+        self.assertGreater(template_ms, 0)
+
+    def test_fetching_rows_counts_as_db_time(self):
+        stats = RequestStats()
+        with connection.execute_wrapper(stats), connection.cursor() as cursor:
+            cursor.execute("WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 20000) SELECT i FROM n")
+            executed = stats.db_time
+            self.assertEqual(len(cursor.fetchall()), 20000)
+            self.assertGreater(stats.db_time, executed)
+
+            # A reused cursor isn't wrapped twice
+            fetchone = cursor.fetchone
+            cursor.execute("SELECT 1")
+            self.assertIs(cursor.fetchone, fetchone)
+            self.assertEqual(cursor.fetchone(), (1,))
+        self.assertEqual(stats.queries, 2)
+
+    def test_templates_are_timed_by_the_backend(self):
+        self.assertIsInstance(get_template("awash/all_jobs.html"), TimedTemplate)
+        # Django's own backend class is not patched
+        self.assertEqual(Template.render.__module__, "django.template.backends.django")
+
+    @override_settings(REQUEST_TIMING={**TIMING, "MAX_QUERIES": 0})
+    def test_slow_requests_are_logged(self):
+        with self.assertLogs("awash.requests", "WARNING") as logs:
+            self.client.get(reverse("all_jobs"))
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertEqual(entry["event"], "slow_request")
+        self.assertEqual(entry["view"], "all_jobs")
+        self.assertGreater(entry["queries"], 0)
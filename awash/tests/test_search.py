@@ -0,0 +1,81 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from awash.models import Job
+from awash.tests.utils import make_employee, make_job
+from awash.utils.search import build_match_query, rebuild_index, search_jobs
+from awash.views import SEARCH_MAX_PAGE
+
+
+def found_ids(text):
+    return [hit["id"] for hit in search_jobs(text)]
+
+
+class JobSearchIndexTests(TestCase):
+    def test_new_job_is_searchable(self):
+        job = make_job("Senior Credit Analyst", duty_station="Hawassa")
+        self.assertEqual(found_ids("credit analyst"), [job.id])
+        self.assertEqual(found_ids("hawassa"), [job.id])
+
+    def test_edited_job_is_reindexed(self):
+        job = make_job("Senior Credit Analyst", description="")
+        job.title = "Branch Manager"
+        job.save()
+        self.assertEqual(found_ids("credit"), [])
+        self.assertEqual(found_ids("branch manager"), [job.id])
+
+    def test_deleted_job_leaves_the_index(self):
+        job = make_job("Senior Credit Analyst")
+        job.delete()
+        self.assertEqual(found_ids("credit"), [])
+
+    def test_last_word_matches_as_prefix(self):
+        job = make_job("Senior Credit Analyst")
+        self.assertEqual(found_ids("senior cred"), [job.id])
+
+    def test_title_hits_rank_first(self):
+        in_description = make_job("Teller", description="Works closely with the auditor team.")
+        in_title = make_job("Internal Auditor")
+        self.assertEqual(found_ids("auditor"), [in_title.id, in_description.id])
+
+    def test_operators_in_user_input_are_quoted(self):
+        self.assertEqual(build_match_query('credit OR "x" NEAR(y'), '"credit" "OR" "x" "NEAR" "y"*')
+        self.assertEqual(build_match_query("  --  "), "")
+
+    def test_highlight_escapes_html(self):
+        make_job("<b>Auditor</b>")
+        [hit] = search_jobs("auditor")
+        self.assertEqual(hit["title"], "&lt;b&gt;<mark>Auditor</mark>&lt;/b&gt;")
+
+    def test_rebuild_index_matches_the_table(self):
+        job = make_job("Senior Credit Analyst")
+        Job.objects.filter(id=job.id).update(title="Branch Manager")  # bypasses the signals
+        rebuild_index()
+        self.assertEqual(found_ids("branch"), [job.id])
+
+
+class AllJobsSearchPagingTests(TestCase):
+    def setUp(self):
+        self.client.force_login(make_employee().user)
+
+    def test_pages_through_results(self):
+        jobs = [make_job(f"Credit Analyst {n}") for n in range(7)]
+        first = self.client.get(reverse("all_jobs"), {"q": "credit", "page_size": 5})
+        second = self.client.get(reverse("all_jobs"), {"q": "credit", "page_size": 5, "page": 2})
+        self.assertEqual(len(first.context["jobs"]), 5)
+        self.assertTrue(first.context["jobs"].has_next)
+        self.assertEqual(len(second.context["jobs"]), 2)
+        self.assertFalse(second.context["jobs"].has_next)
+        shown = {job.id for job in first.context["jobs"]} | {job.id for job in second.context["jobs"]}
+        self.assertEqual(shown, {job.id for job in jobs})
+
+    def test_page_past_the_limit_is_not_found(self):
+        response = self.client.get(reverse("all_jobs"), {"q": "credit", "page": SEARCH_MAX_PAGE + 1})
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(reverse("all_jobs"), {"q": "credit", "page": "9" * 40})
+        self.assertEqual(response.status_code, 404)
+
+    def test_invalid_page_falls_back_to_the_first(self):
+        job = make_job("Credit Analyst")
+        response = self.client.get(reverse("all_jobs"), {"q": "credit", "page": "abc"})
+        self.assertEqual([found.id for found in response.context["jobs"]], [job.id])
@@ -0,0 +1,80 @@
+import os
+import runpy
+import shutil
+import tempfile
+import threading
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection, connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase, override_settings
+
+import job_application.settings
+from awash.utils.db import sqlite_pragmas
+
+
+def load_settings(profile):
+    with mock.patch.dict(os.environ, {"DB_PROFILE": profile}):
+        return runpy.run_path(job_application.settings.__file__)
+
+
+class SqliteProfileTests(SimpleTestCase):
+    databases = {"default"}
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.production = load_settings("production")
+
+    def setUp(self):
+        directory = tempfile.mkdtemp(prefix="awash-sqlite-")
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        self.database = {**connection.settings_dict, "NAME": os.path.join(directory, "stress.sqlite3")}
+
+    def test_production_profile_takes_the_write_lock_up_front(self):
+        self.assertEqual(self.production["DATABASES"]["default"]["OPTIONS"], {"transaction_mode": "IMMEDIATE"})
+        self.assertEqual(self.production["SQLITE_PRAGMAS"]["journal_mode"], "WAL")
+        development = load_settings("development")
+        self.assertNotIn("OPTIONS", development["DATABASES"]["default"])
+        self.assertEqual(development["SQLITE_PRAGMAS"], {})
+
+    def test_pragmas_are_applied_to_new_connections(self):
+        pragmas = {"journal_mode": "WAL", "busy_timeout": 1234, "synchronous": "NORMAL"}
+        wrapper = DatabaseWrapper(self.database, alias="pragmas")
+        with override_settings(SQLITE_PRAGMAS=pragmas):
+            wrapper.ensure_connection()  # sends connection_created
+        try:
+            self.assertEqual(
+                sqlite_pragmas(wrapper, names=("journal_mode", "busy_timeout", "synchronous")),
+                {"journal_mode": "wal", "busy_timeout": 1234, "synchronous": 1},
+            )
+        finally:
+            wrapper.close()
+
+    def test_stress_run_under_the_production_profile_has_no_lock_errors(self):
+        # With the default deferred transactions this run reports "database is locked"
+        database = {**self.database, "OPTIONS": self.production["DATABASES"]["default"]["OPTIONS"]}
+        out, failures = StringIO(), []
+
+        def run():
+            # A fresh thread opens its own connections from the patched settings
+            try:
+                call_command("stress_sqlite", writers=8, writes=50, readers=2, stdout=out)
+            except Exception as exc:
+                failures.append(exc)
+            finally:
+                connection.close()
+
+        with mock.patch.dict(connections.settings, {"default": database}), override_settings(
+            DB_PROFILE="production", SQLITE_PRAGMAS=self.production["SQLITE_PRAGMAS"]
+        ):
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(failures, [], out.getvalue())
+        self.assertIn("400/400 writes committed", out.getvalue())
+        self.assertIn("No lock errors.", out.getvalue())
+        self.assertIn("'journal_mode': 'wal'", out.getvalue())
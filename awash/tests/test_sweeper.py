@@ -0,0 +1,58 @@
+import threading
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from awash.models import Application, Job
+from awash.tests.utils import make_employee, make_job
+from awash.utils.counters import dashboard_counts, find_drift
+from awash.utils.sweeper import deactivate_expired_jobs, run_periodic_sweeper
+
+
+class StopAfterFirstSweep(threading.Event):
+    def wait(self, timeout=None):
+        self.set()
+        return True
+
+
+class DeadlineSweeperTests(TestCase):
+    def setUp(self):
+        self.open_jobs = [make_job(f"Open {n}") for n in range(2)]
+        self.expired = [make_job(f"Expired {n}") for n in range(5)]
+        # Deadlines pass after posting; save() would deactivate them itself
+        Job.objects.filter(id__in=[job.id for job in self.expired]).update(deadline=date.today() - timedelta(days=1))
+        employee = make_employee()
+        for job in (self.open_jobs[0], *self.expired[:3]):
+            Application.objects.create(employee=employee, job=job)
+
+    def active_titles(self):
+        return set(Job.objects.filter(is_active=True).values_list("title", flat=True))
+
+    def test_single_update(self):
+        self.assertEqual(deactivate_expired_jobs(), (5, True))
+        self.assertEqual(self.active_titles(), {"Open 0", "Open 1"})
+        self.assertEqual(dashboard_counts()["active_jobs"], 2)
+        self.assertEqual(dashboard_counts()["open_applications"], 1)
+        self.assertEqual(find_drift(), {})
+
+    def test_batches_and_time_budget(self):
+        self.assertEqual(deactivate_expired_jobs(batch_size=2, time_budget=0), (2, False))
+        self.assertEqual(deactivate_expired_jobs(batch_size=2), (3, True))
+        self.assertEqual(self.active_titles(), {"Open 0", "Open 1"})
+        self.assertEqual(find_drift(), {})
+
+    def test_today_is_not_expired(self):
+        Job.objects.filter(id=self.open_jobs[0].id).update(deadline=date.today())
+        deactivate_expired_jobs()
+        self.assertIn("Open 0", self.active_titles())
+
+    def test_command_and_loop(self):
+        out = StringIO()
+        call_command("deactivate_expired_jobs", "--batch-size", "3", stdout=out)
+        self.assertIn("Deactivated 5 expired jobs", out.getvalue())
+
+        Job.objects.filter(id=self.open_jobs[0].id).update(deadline=date.today() - timedelta(days=1))
+        run_periodic_sweeper(interval=60, stop=StopAfterFirstSweep())
+        self.assertEqual(self.active_titles(), {"Open 1"})
@@ -0,0 +1,34 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from awash.models import Allemployee_record
+from awash.tests.utils import make_employee
+
+
+class UsersPageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.hr = User.objects.create_user("hr", password="x", is_staff=True)
+        make_employee("AIB/1/2020", "Abebe Kebede")
+        make_employee("AIB/2/2020", "Almaz Bekele")
+        for employee_id, name in (("AIB/1/2020", "Abebe Kebede"), ("AIB/3/2021", "Dawit Hana"), ("AIB/4/2021", "Hana Selam")):
+            Allemployee_record.objects.create(employee_id=employee_id, full_name=name)
+
+    def get(self, **params):
+        self.client.force_login(self.hr)
+        return self.client.get(reverse("users"), params).context["page"]
+
+    def test_users_tab_search(self):
+        self.assertEqual([user.username for user in self.get()], ["AIB/1/2020", "AIB/2/2020", "hr"])
+        self.assertEqual([user.username for user in self.get(q="almaz")], ["AIB/2/2020"])
+        self.assertEqual([user.username for user in self.get(q="aib/1")], ["AIB/1/2020"])
+
+    def test_directory_tab_lists_unregistered_records(self):
+        self.assertEqual([record.employee_id for record in self.get(tab="directory")], ["AIB/3/2021", "AIB/4/2021"])
+        self.assertEqual([record.employee_id for record in self.get(tab="directory", q="hana")], ["AIB/3/2021", "AIB/4/2021"])
+
+    def test_paginates(self):
+        page = self.get(page_size=5, page=99)
+        self.assertEqual(page.number, 1)
+        self.assertEqual(len(page), 3)
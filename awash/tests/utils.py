@@ -0,0 +1,38 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from openpyxl import Workbook
+
+from awash.models import Employee, Job
+
+
+def make_job(title="Customer Service Officer", days_open=14, **fields):
+    return Job.objects.create(
+        title=title,
+        deadline=fields.pop("deadline", date.today() + timedelta(days=days_open)),
+        description=fields.pop("description", f"{title} vacancy."),
+        **fields,
+    )
+
+
+def make_employee(employee_id="AIB/00001/2020", full_name="Abebe Kebede Tadesse", user=True, **fields):
+    """An Employee, with a linked User (username = employee_id) unless ``user`` is False."""
+    account = User.objects.create_user(employee_id, password="x") if user else None
+    return Employee.objects.create(
+        employee_id=employee_id,
+        full_name=full_name,
+        user=account,
+        is_registered=account is not None,
+        **fields,
+    )
+
+
+def write_workbook(path, sheets):
+    """``sheets`` maps sheet name -> rows, the first row being the header."""
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        worksheet = workbook.create_sheet(name)
+        for row in rows:
+            worksheet.append(row)
+    workbook.save(path)
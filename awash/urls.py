@@ -24,5 +24,18 @@ urlpatterns = [
     path('apply/<int:id>', views.apply, name='apply'),
     path('delete_promotion/<int:id>', views.delete_promotion, name='delete_promotion'),
     path("get-employee/", views.get_employee, name="get_employee"),  # new
+    path("positions/", views.position_search, name="position_search"),
+    path("eligible_employees/<int:id>", views.eligible_employees, name="eligible_employees"),
+    path("employee_search/", views.employee_search, name="employee_search"),
+    path("post_jobs_bulk/", views.post_jobs_bulk, name="post_jobs_bulk"),
+    path("letters/<int:id>", views.download_letter, name="download_letter"),
+    path("letters/job/<int:id>", views.download_job_letters, name="download_job_letters"),
+    path("applicants/export/", views.export_applicants, name="export_applicants"),
+    path("promotion_list/export/", views.export_promotions, name="export_promotions"),
+    path("metrics", views.metrics_view, name="metrics"),
+    path("healthz", views.healthz, name="healthz"),
+    path("readyz", views.readyz, name="readyz"),
+    path("profiles/", views.profiles, name="profiles"),
+    path("profiles/<str:name>.<str:kind>", views.download_profile, name="download_profile"),
 
 ]
\ No newline at end of file
@@ -0,0 +1,236 @@
+import json
+import platform
+import sqlite3
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+
+import django
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from awash.models import Allemployee_record, Application, Employee, Job, Position
+from awash.utils.employee_lookup import employee_cache
+from awash.utils.synthetic import DEFAULT_VOLUMES, SyntheticData
+
+BENCHMARK_PASSWORD = "Bench@12345"
+
+# Default dataset sizes, as fractions of the production volumes in DEFAULT_VOLUMES
+DEFAULT_SCALES = (0.001, 0.01, 0.05)
+
+# A view regresses when its p95 grows by more than this fraction, or its query count grows at all
+DEFAULT_THRESHOLD = 0.25
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class Scenario:
+    """
+    One benchmarked view: ``prepare(client, n)`` runs before each request
+    outside the timing (logins, picking fresh rows) and returns the
+    (method, url, data) to send.
+    """
+
+    def __init__(self, name, prepare):
+        self.name = name
+        self.prepare = prepare
+
+
+class ViewBenchmark:
+    """Seeds growing datasets and drives the main views through the test client."""
+
+    def __init__(self, requests=30, warmup=3, seed=0, log=None):
+        self.requests = requests
+        self.warmup = warmup
+        self.seed = seed
+        self.log = log or (lambda message: None)
+        self.seeded = dict.fromkeys(DEFAULT_VOLUMES, 0)
+
+    def grow_to(self, scale):
+        """Add rows until every table holds ``scale`` x DEFAULT_VOLUMES."""
+        target = {name: max(int(volume * scale), 1) for name, volume in DEFAULT_VOLUMES.items()}
+        delta = {name: max(target[name] - self.seeded[name], 0) for name in target}
+        generator = SyntheticData(seed=f"{self.seed}-{scale}", prefix=f"B{int(scale * 1e6)}", password=BENCHMARK_PASSWORD)
+        created = generator.generate(**delta)
+        for name, count in created.items():
+            self.seeded[name] += count
+        employee_cache.clear()
+        return dict(self.seeded)
+
+    def scenarios(self):
+        hr, _ = User.objects.get_or_create(username="bench-hr", defaults={"is_staff": True})
+        employees = list(Employee.objects.eligible().filter(user__isnull=False).select_related("user").order_by("id")[:500])
+        busiest_job = (
+            Application.objects.values("job_id").annotate(total=Count("id")).order_by("-total").values_list("job_id", flat=True).first()
+        )
+        open_jobs = list(Job.objects.filter(is_active=True).values_list("id", flat=True)[:50]) or [busiest_job]
+        record_ids = list(Allemployee_record.objects.order_by("?").values_list("employee_id", flat=True)[:1000])
+        unregistered = list(
+            Allemployee_record.objects.exclude(employee_id__in=Employee.objects.values("employee_id"))
+            .values_list("employee_id", flat=True)[: self.requests + self.warmup]
+        )
+
+        position = Position.objects.filter(is_active=True).values_list("title", flat=True).first()
+
+        def as_hr(method, url, data=None):
+            def prepare(client, n):
+                client.force_login(hr)
+                return method, url, data
+            return prepare
+
+        def as_employee(client, n):
+            client.force_login(employees[n % len(employees)].user)
+
+        def get_employee(client, n):
+            return "get", reverse("get_employee"), {"employee_id": record_ids[n % len(record_ids)]}
+
+        def all_jobs(client, n):
+            as_employee(client, n)
+            return "get", reverse("all_jobs"), None
+
+        def apply(client, n):
+            as_employee(client, n)
+            return "post", reverse("apply", args=[open_jobs[n % len(open_jobs)]]), {}
+
+        def register(client, n):
+            client.logout()
+            if n >= len(unregistered):
+                return None
+            return "post", reverse("register"), {
+                "employee_id": unregistered[n],
+                "email": "bench@example.com",
+                "position": position,
+                "password1": BENCHMARK_PASSWORD,
+                "password2": BENCHMARK_PASSWORD,
+            }
+
+        return [
+            Scenario("all_jobs", all_jobs),
+            Scenario("applicants_list", as_hr("get", reverse("applicants"))),
+            Scenario("view_applicants_per_job", as_hr("get", reverse("view_applicants_per_job", args=[busiest_job]))),
+            Scenario("hr_dashboard", as_hr("get", reverse("hr_dashboard"))),
+            Scenario("all_users", as_hr("get", reverse("users"))),
+            Scenario("promotion", as_hr("get", reverse("promotion"))),
+            Scenario("get_employee", get_employee),
+            Scenario("apply", apply if employees and busiest_job else None),
+            Scenario("register", register),
+        ]
+
+    def measure(self, scenario):
+        client = Client()
+        latencies, queries, statuses = [], [], set()
+        peak = 0
+        for n in range(self.warmup + self.requests):
+            request = scenario.prepare(client, n)
+            if request is None:
+                break
+            method, url, data = request
+            measured = n >= self.warmup
+            # Memory is traced on one request only; tracemalloc would distort the timings
+            trace = measured and n == self.warmup
+            if trace:
+                tracemalloc.start()
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = getattr(client, method)(url, data)
+                elapsed = time.perf_counter() - started
+            if trace:
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            if measured:
+                latencies.append(elapsed)
+                queries.append(len(captured))
+                statuses.add(response.status_code)
+
+        total = sum(latencies)
+        return {
+            "requests": len(latencies),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+            "rps": round(len(latencies) / total, 1) if total else 0.0,
+            "queries": max(queries, default=0),
+            "queries_mean": round(statistics.mean(queries), 1) if queries else 0,
+            "peak_memory_kb": round(peak / 1024, 1),
+            "status_codes": sorted(statuses),
+        }
+
+    def run(self, scales=DEFAULT_SCALES):
+        results = {}
+        for scale in scales:
+            started = time.perf_counter()
+            rows = self.grow_to(scale)
+            self.log(f"scale {scale}: seeded {rows} in {time.perf_counter() - started:.0f}s")
+            views = {}
+            for scenario in self.scenarios():
+                if scenario.prepare is None:
+                    continue
+                views[scenario.name] = self.measure(scenario)
+                stats = views[scenario.name]
+                self.log(
+                    f"  {scenario.name:<24} p50 {stats['p50_ms']:>8.1f} ms  p95 {stats['p95_ms']:>8.1f} ms  "
+                    f"p99 {stats['p99_ms']:>8.1f} ms  {stats['rps']:>7.1f} req/s  "
+                    f"{stats['queries']:>3} queries  {stats['peak_memory_kb']:>8.0f} KB"
+                )
+            results[str(scale)] = {"rows": rows, "views": views}
+        return {
+            "meta": {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "requests": self.requests,
+            },
+            "results": results,
+        }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Diff two benchmark reports.
+
+    Returns ``(lines, regressions)``: a human-readable line per view and
+    scale in either report, and the subset that got slower by more than
+    ``threshold`` at p95 or now issues more queries. Views only one report
+    has are listed as new or missing but aren't regressions.
+    """
+    lines, regressions = [], []
+    for scale, run in current["results"].items():
+        base_views = baseline.get("results", {}).get(scale, {}).get("views", {})
+        for view in sorted(base_views.keys() - run["views"].keys()):
+            lines.append(f"{scale:>6} {view:<24} missing from this run")
+        for view, stats in run["views"].items():
+            base = base_views.get(view)
+            if not base:
+                lines.append(f"{scale:>6} {view:<24} new, p95 {stats['p95_ms']:>8.1f} ms  queries {stats['queries']}")
+                continue
+            change = (stats["p95_ms"] - base["p95_ms"]) / base["p95_ms"] if base["p95_ms"] else 0.0
+            line = (
+                f"{scale:>6} {view:<24} p95 {base['p95_ms']:>8.1f} -> {stats['p95_ms']:>8.1f} ms ({change:+.0%})  "
+                f"queries {base['queries']} -> {stats['queries']}"
+            )
+            lines.append(line)
+            if change > threshold or stats["queries"] > base["queries"]:
+                regressions.append(line)
+    return lines, regressions
+
+
+def load_report(path):
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def save_report(report, path):
+    with open(path, "w") as handle:
+        json.dump(report, handle, indent=2)
+        handle.write("\n")
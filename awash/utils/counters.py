@@ -0,0 +1,144 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import BigIntegerField, CharField, Count, F, Subquery, Value
+from django.db.models.functions import Cast, Concat, Substr
+from django.utils import timezone
+
+from awash.models import Application, DashboardCounter, Job, Promotion
+
+ACTIVE_JOBS = "jobs:active"
+INACTIVE_JOBS = "jobs:inactive"
+APPLICATIONS = "applications"
+# Applications to jobs that are still open; moves when a job opens or closes
+OPEN_APPLICATIONS = "applications:open"
+# Applications per job under "applications:job:<id>", for the unfiltered applicants page totals
+JOB_APPLICATIONS_PREFIX = "applications:job:"
+_JOB_APPLICATIONS_END = "applications:job;"
+PROMOTIONS_PREFIX = "promotions:"
+# ";" sorts right after ":", so [PROMOTIONS_PREFIX, _PROMOTIONS_END) covers every day bucket
+_PROMOTIONS_END = "promotions;"
+
+
+def promotion_key(day):
+    return f"{PROMOTIONS_PREFIX}{Promotion._meta.get_field('promoted_at').to_python(day).isoformat()}"
+
+
+def job_key(is_active):
+    return ACTIVE_JOBS if is_active else INACTIVE_JOBS
+
+
+def job_applications_key(job_id):
+    return f"{JOB_APPLICATIONS_PREFIX}{job_id}"
+
+
+def busiest_job_ids(limit):
+    """Ids of the jobs with the most applications, as a subquery over one primary-key range of counters."""
+    return (
+        DashboardCounter.objects.filter(key__gte=JOB_APPLICATIONS_PREFIX, key__lt=_JOB_APPLICATIONS_END, value__gt=0)
+        .annotate(job_id=Cast(Substr("key", len(JOB_APPLICATIONS_PREFIX) + 1), BigIntegerField()))
+        .order_by("-value", "job_id")
+        .values("job_id")[:limit]
+    )
+
+
+def job_applications(job_id):
+    """The per-job application counter for ``job_id`` (e.g. OuterRef("id")), as a subquery."""
+    key = Concat(Value(JOB_APPLICATIONS_PREFIX), Cast(job_id, CharField()))
+    return Subquery(DashboardCounter.objects.filter(key=key).values("value")[:1])
+
+
+def bump(key, delta=1):
+    """Atomically add ``delta`` to a counter, creating it on first use."""
+    if not delta:
+        return
+    if DashboardCounter.objects.filter(key=key).update(value=F("value") + delta):
+        return
+    _, created = DashboardCounter.objects.get_or_create(key=key, defaults={"value": delta})
+    if not created:
+        DashboardCounter.objects.filter(key=key).update(value=F("value") + delta)
+
+
+def recount_jobs():
+    """Reset the job (and open application) counters from the tables; used when a change can't be tracked precisely."""
+    counts = compute_counters(jobs_only=True)
+    for key, value in counts.items():
+        DashboardCounter.objects.update_or_create(key=key, defaults={"value": value})
+
+
+def compute_counters(jobs_only=False):
+    """Recompute every counter from the source tables."""
+    counts = {ACTIVE_JOBS: 0, INACTIVE_JOBS: 0}
+    for row in Job.objects.values("is_active").annotate(total=Count("id")).order_by():
+        counts[job_key(row["is_active"])] = row["total"]
+    counts[OPEN_APPLICATIONS] = Application.objects.filter(job__is_active=True).count()
+    if jobs_only:
+        return counts
+    counts[APPLICATIONS] = Application.objects.count()
+    for row in Application.objects.values("job_id").annotate(total=Count("id")).order_by():
+        counts[job_applications_key(row["job_id"])] = row["total"]
+    for row in Promotion.objects.values("promoted_at").annotate(total=Count("id")).order_by():
+        counts[promotion_key(row["promoted_at"])] = row["total"]
+    return counts
+
+
+def find_drift():
+    """Return {key: (stored, actual)} for every counter that disagrees with the tables."""
+    actual = compute_counters()
+    stored = dict(DashboardCounter.objects.values_list("key", "value"))
+    drift = {}
+    for key in actual.keys() | stored.keys():
+        stored_value, actual_value = stored.get(key, 0), actual.get(key, 0)
+        if stored_value != actual_value:
+            drift[key] = (stored_value, actual_value)
+    return drift
+
+
+@transaction.atomic
+def rebuild_counters():
+    counts = compute_counters()
+    DashboardCounter.objects.all().delete()
+    DashboardCounter.objects.bulk_create(DashboardCounter(key=key, value=value) for key, value in counts.items())
+    return counts
+
+
+def dashboard_counts(today=None):
+    """
+    All dashboard numbers from one primary-key range read over the counters table.
+    """
+    today = today or timezone.now().date()
+    one_year_ago = (today - timedelta(days=365)).isoformat()
+    six_months_ago = (today - timedelta(days=182)).isoformat()  # approx
+    three_months_ago = (today - timedelta(days=91)).isoformat()  # approx
+
+    rows = DashboardCounter.objects.filter(key__in=[ACTIVE_JOBS, INACTIVE_JOBS, APPLICATIONS, OPEN_APPLICATIONS]) | DashboardCounter.objects.filter(
+        key__gte=PROMOTIONS_PREFIX + one_year_ago, key__lt=_PROMOTIONS_END
+    )
+
+    counts = {
+        "active_jobs": 0,
+        "inactive_jobs": 0,
+        "total_applications": 0,
+        "open_applications": 0,
+        "promoted_this_year": 0,
+        "promoted_last_6_months": 0,
+        "promoted_last_3_months": 0,
+    }
+    for key, value in rows.values_list("key", "value"):
+        if key == ACTIVE_JOBS:
+            counts["active_jobs"] = value
+        elif key == INACTIVE_JOBS:
+            counts["inactive_jobs"] = value
+        elif key == APPLICATIONS:
+            counts["total_applications"] = value
+        elif key == OPEN_APPLICATIONS:
+            counts["open_applications"] = value
+        else:
+            day = key[len(PROMOTIONS_PREFIX):]
+            counts["promoted_this_year"] += value
+            if day >= six_months_ago:
+                counts["promoted_last_6_months"] += value
+            if day >= three_months_ago:
+                counts["promoted_last_3_months"] += value
+    counts["total_jobs"] = counts["active_jobs"] + counts["inactive_jobs"]
+    return counts
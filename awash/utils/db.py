@@ -0,0 +1,22 @@
+from django.conf import settings
+
+
+def configure_sqlite(connection):
+    """Apply settings.SQLITE_PRAGMAS to a new SQLite connection (no-op for other backends)."""
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", None)
+    if connection.vendor != "sqlite" or not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def sqlite_pragmas(connection, names=("journal_mode", "synchronous", "busy_timeout", "mmap_size")):
+    """Current values of ``names`` on ``connection``, for reporting."""
+    values = {}
+    with connection.cursor() as cursor:
+        for name in names:
+            cursor.execute(f"PRAGMA {name}")
+            row = cursor.fetchone()
+            values[name] = row[0] if row else None
+    return values
@@ -0,0 +1,127 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.http import content_disposition_header, quote_etag
+
+CHUNK_SIZE = 64 * 1024
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_SHA256_NAME_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def file_etag(name, stat):
+    """Content-addressed names are their own ETag; anything else falls back to mtime and size."""
+    stem = os.path.splitext(os.path.basename(name))[0]
+    if _SHA256_NAME_RE.match(stem):
+        return quote_etag(stem)
+    return quote_etag(f"{int(stat.st_mtime):x}-{stat.st_size:x}")
+
+
+def _etag_matches(header, etag):
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as If-None-Match requires
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags
+
+
+def parse_range(header, size):
+    """
+    Parse a single ``bytes=`` range into an inclusive ``(start, end)``.
+
+    Returns None when the header is absent or not something we serve
+    partially (e.g. several ranges — the whole file is sent instead), and
+    False when the range can't be satisfied.
+    """
+    match = _RANGE_RE.match((header or "").replace(" ", ""))
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:  # suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _read_range(handle, start, length):
+    with handle:
+        handle.seek(start)
+        while length > 0:
+            chunk = handle.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def serve_file(request, storage, name, filename=None):
+    """
+    Send a stored file with conditional and range request support.
+
+    With ``SENDFILE_BACKEND`` set the response body is left to the front-end
+    server ("nginx" → X-Accel-Redirect under ``SENDFILE_URL_PREFIX``,
+    "apache"/"lighttpd" → X-Sendfile with the absolute path), which handles
+    Range itself. Otherwise full responses go through FileResponse, which
+    lets the WSGI server use its file wrapper (sendfile) and keeps the
+    worker out of the copy; single ranges are streamed in chunks.
+    """
+    path = storage.path(name)
+    stat = os.stat(path)
+    etag = file_etag(name, stat)
+    filename = filename or os.path.basename(name)
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        response = HttpResponseNotModified()
+        response["ETag"] = etag
+        return response
+
+    backend = getattr(settings, "SENDFILE_BACKEND", None)
+    if backend:
+        response = HttpResponse(content_type=content_type)
+        if backend == "nginx":
+            prefix = getattr(settings, "SENDFILE_URL_PREFIX", "/protected/")
+            response["X-Accel-Redirect"] = prefix.rstrip("/") + "/" + quote(name)
+        else:
+            response["X-Sendfile"] = path
+    else:
+        byte_range = None
+        if not request.headers.get("If-Range") or request.headers["If-Range"] == etag:
+            byte_range = parse_range(request.headers.get("Range"), stat.st_size)
+
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{stat.st_size}"
+            return response
+        if byte_range:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                _read_range(storage.open(name, "rb"), start, end - start + 1),
+                status=206,
+                content_type=content_type,
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+            response["Content-Length"] = end - start + 1
+        else:
+            response = FileResponse(storage.open(name, "rb"), content_type=content_type)
+            response["Content-Length"] = stat.st_size
+        response["Accept-Ranges"] = "bytes"
+
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, max-age=0, must-revalidate"
+    response["Content-Disposition"] = content_disposition_header(False, filename)
+    return response
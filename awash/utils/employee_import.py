@@ -0,0 +1,193 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.db import connection, transaction
+from openpyxl import load_workbook
+
+DEFAULT_BATCH_SIZE = 2000
+
+# Parsed chunks a parallel worker may have waiting for the writer
+QUEUE_CHUNKS = 4
+
+
+def clean_cell(value):
+    """Normalise a spreadsheet cell to a stripped string ("" for blanks)."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def sheet_names(path):
+    workbook = load_workbook(path, read_only=True)
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+
+def iter_sheet_rows(path, sheet=None):
+    """
+    Stream the rows of one worksheet as dicts keyed by the header row.
+
+    The workbook is opened in read-only mode, so rows are parsed lazily and
+    memory stays flat however large the file is. Header names are lowercased;
+    columns without a header are dropped.
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.worksheets[0]
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [(index, clean_cell(name).lower()) for index, name in enumerate(header) if clean_cell(name)]
+        for row in rows:
+            yield {name: clean_cell(row[index]) if index < len(row) else "" for index, name in columns}
+    finally:
+        workbook.close()
+
+
+def read_sheet_chunks(source, queue, chunk_size=DEFAULT_BATCH_SIZE):
+    """
+    Worker side of parallel mode: stream one (path, sheet) into ``queue`` in
+    lists of at most ``chunk_size`` rows, then put None. The queue is bounded,
+    so a worker that gets ahead of the database writer waits instead of
+    holding the rest of its sheet in memory.
+    """
+    path, sheet = source
+    try:
+        chunk = []
+        for row in iter_sheet_rows(path, sheet):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                queue.put(chunk)
+                chunk = []
+        if chunk:
+            queue.put(chunk)
+    finally:
+        # Always signal the end, so a failing worker can't leave the reader waiting forever
+        queue.put(None)
+
+
+class ImportSummary:
+    def __init__(self):
+        self.created = 0
+        self.skipped = 0
+        self.invalid = 0
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    @property
+    def rows(self):
+        return self.created + self.skipped + self.invalid
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self.started
+        return self
+
+    def __str__(self):
+        return (
+            f"{self.rows} rows in {self.seconds:.2f}s ({self.rows_per_second:,.0f} rows/s): "
+            f"{self.created} created, {self.skipped} skipped, {self.invalid} invalid"
+        )
+
+
+def expand_sources(paths, sheets=None, all_sheets=False):
+    """Turn file paths into (path, sheet) pairs; sheet=None means the first sheet."""
+    sources = []
+    for path in paths:
+        if all_sheets:
+            sources.extend((path, name) for name in sheet_names(path))
+        elif sheets:
+            sources.extend((path, name) for name in sheets)
+        else:
+            sources.append((path, None))
+    return sources
+
+
+def _iter_sources(sources, workers, chunk_size=DEFAULT_BATCH_SIZE):
+    if workers > 1 and len(sources) > 1:
+        yield from _iter_sources_parallel(sources, workers, chunk_size)
+    else:
+        for path, sheet in sources:
+            yield from iter_sheet_rows(path, sheet)
+
+
+def _iter_sources_parallel(sources, workers, chunk_size):
+    # One bounded queue per source, drained in source order so rows (and which
+    # duplicate wins) come out exactly as in serial mode. At most ``workers``
+    # sheets are parsed at once and each holds at most QUEUE_CHUNKS chunks.
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=workers) as pool:
+        queues = [manager.Queue(maxsize=QUEUE_CHUNKS) for _ in sources]
+        futures = [
+            pool.submit(read_sheet_chunks, source, queue, chunk_size)
+            for source, queue in zip(sources, queues)
+        ]
+        for future, queue in zip(futures, queues):
+            for chunk in iter(queue.get, None):
+                yield from chunk
+            future.result()  # re-raise a worker's parse error
+
+
+def _existing_ids(employee_ids):
+    # Imported here so worker processes can unpickle read_sheet_chunks without Django set up
+    from awash.models import Allemployee_record
+
+    return set(Allemployee_record.objects.filter(employee_id__in=employee_ids).values_list("employee_id", flat=True))
+
+
+def _write_batch(batch, summary):
+    from awash.models import Allemployee_record
+
+    existing = _existing_ids(batch.keys())
+    new_rows = [(employee_id, full_name) for employee_id, full_name in batch.items() if employee_id not in existing]
+    # ON CONFLICT DO NOTHING covers rows inserted concurrently since the lookup above. The
+    # summed rowcount leaves those out, so "created" is what the database actually inserted.
+    created = 0
+    if new_rows:
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {Allemployee_record._meta.db_table} (employee_id, full_name) VALUES (%s, %s) "
+                "ON CONFLICT (employee_id) DO NOTHING",
+                new_rows,
+            )
+            created = cursor.rowcount
+    summary.created += created
+    summary.skipped += len(batch) - created
+
+
+def load_allemployee_records(sources, batch_size=DEFAULT_BATCH_SIZE, workers=1):
+    """
+    Insert the employee directory from (path, sheet) sources into Allemployee_record.
+
+    Existing employee IDs are left untouched. Each batch costs one lookup and
+    one bulk INSERT inside its own transaction.
+    """
+    summary = ImportSummary()
+    seen = set()
+    batch = {}
+    for row in _iter_sources(sources, workers, batch_size):
+        employee_id, full_name = row.get("employee_id", ""), row.get("full_name", "")
+        if not employee_id or not full_name:
+            summary.invalid += 1
+            continue
+        if employee_id in seen:
+            summary.skipped += 1
+            continue
+        seen.add(employee_id)
+        batch[employee_id] = full_name
+        if len(batch) >= batch_size:
+            with transaction.atomic():
+                _write_batch(batch, summary)
+            batch = {}
+    if batch:
+        with transaction.atomic():
+            _write_batch(batch, summary)
+    return summary.finish()
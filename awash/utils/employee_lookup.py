@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from django.contrib.auth.models import User
+from django.db.models import BooleanField, CharField, Exists, IntegerField, OuterRef, Value
+
+from awash.models import Allemployee_record, Employee
+
+CACHE_SIZE = 10000
+CACHE_TTL = 60  # seconds; also bounds staleness across worker processes
+
+
+class LookupCache:
+    """
+    Bounded LRU cache with per-entry TTL for a single-argument loader.
+
+    Misses for the same key are merged: the first caller runs the loader and
+    everyone else arriving meanwhile waits for its result. Whatever the loader
+    returns is cached, including "not found" answers.
+    """
+
+    def __init__(self, loader, maxsize=CACHE_SIZE, ttl=CACHE_TTL):
+        self.loader = loader
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._pending = {}  # key -> Future of the in-flight load
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+            future = self._pending.get(key)
+            leader = future is None
+            if leader:
+                future = self._pending[key] = Future()
+                future.stale = False
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = self.loader(key)
+        except BaseException as exc:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._pending.pop(key, None)
+            # An invalidate() during the load means the value may already be out of date
+            if not future.stale:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            future = self._pending.get(key)
+            if future is not None:
+                future.stale = True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for future in self._pending.values():
+                future.stale = True
+
+
+def lookup_query(employee_id):
+    """Employee and directory rows for an ID as (source, full_name, position, email, registered), Employee first."""
+    text = CharField()
+    has_user = Exists(User.objects.filter(username=OuterRef("employee_id")))
+    employees = (
+        Employee.objects.filter(employee_id=employee_id)
+        .annotate(
+            source=Value(0, output_field=IntegerField()),
+            # Same rule as the register view: an existing username means registered
+            registered=has_user,
+        )
+        .values_list("source", "full_name", "position", "email", "registered")
+    )
+    records = (
+        Allemployee_record.objects.filter(employee_id=employee_id)
+        .annotate(
+            source=Value(1, output_field=IntegerField()),
+            position=Value("", output_field=text),
+            email=Value("", output_field=text),
+            registered=Value(False, output_field=BooleanField()),
+        )
+        .values_list("source", "full_name", "position", "email", "registered")
+    )
+    return employees.union(records, all=True).order_by("source")[:1]
+
+
+def load_employee(employee_id):
+    """
+    Resolve an employee ID for the registration form in one read-only query.
+
+    Employee rows win over the Allemployee_record directory. Returns the JSON
+    payload served by the get_employee view.
+    """
+    row = next(iter(lookup_query(employee_id)), None)
+
+    if row is None:
+        return {"error": "not_found"}
+    _, full_name, position, email, registered = row
+    if registered:
+        return {"error": "already_registered"}
+    return {
+        "full_name": full_name,
+        "department": position or "",
+        "email": email or "",
+        "is_registered": False,
+    }
+
+
+employee_cache = LookupCache(load_employee)
+
+
+def lookup_employee(employee_id):
+    return employee_cache.get(employee_id)
+
+
+def invalidate_employee(employee_id):
+    employee_cache.invalidate(employee_id)
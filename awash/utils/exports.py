@@ -0,0 +1,83 @@
+from datetime import datetime
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.http import content_disposition_header
+
+from awash.utils.streaming import iter_csv, iter_xlsx
+
+# Rows fetched per round trip while an export streams
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# (column heading, values() lookup)
+APPLICANT_COLUMNS = (
+    ("Vacancy Number", "job__vacancy_number"),
+    ("Job Title", "job__title"),
+    ("Employee ID", "employee__employee_id"),
+    ("Full Name", "employee__full_name"),
+    ("Position", "employee__position"),
+    ("Email", "employee__email"),
+    ("Phone", "employee__phone"),
+    ("Applied At", "applied_at"),
+    ("Recommendation Letter", "recommendation_letter"),
+)
+
+PROMOTION_COLUMNS = (
+    ("Employee ID", "employee__employee_id"),
+    ("Employee Name", "employee__full_name"),
+    ("Old Grade", "old_grade"),
+    ("New Grade", "new_grade"),
+    ("Promotion Date", "promoted_at"),
+    ("Remarks", "remarks"),
+)
+
+
+# Letters are stored under their content hash, which means nothing to a reader
+_FORMATTERS = {
+    "recommendation_letter": lambda value: "Yes" if value else "No",
+}
+
+
+# Spreadsheet apps run cells starting with these as formulas (CSV/formula injection)
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return timezone.localtime(value).replace(tzinfo=None) if timezone.is_aware(value) else value
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_value(value):
+    return value.strftime("%Y-%m-%d %H:%M") if isinstance(value, datetime) else value
+
+
+def export_rows(queryset, columns):
+    """Project ``queryset`` onto ``columns`` and yield rows, fetching EXPORT_CHUNK_SIZE at a time."""
+    lookups = [lookup for _, lookup in columns]
+    formatters = [_FORMATTERS.get(lookup, _export_value) for lookup in lookups]
+    for row in queryset.values_list(*lookups).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield [format_value(value) for format_value, value in zip(formatters, row)]
+
+
+def export_response(queryset, columns, filename, file_format="csv", title="Sheet1"):
+    """Stream ``queryset`` as a CSV or XLSX download; nothing is materialised up front."""
+    header = [heading for heading, _ in columns]
+    rows = export_rows(queryset, columns)
+    if file_format == "xlsx":
+        content = iter_xlsx(header, rows, title=title)
+    else:
+        file_format = "csv"
+        content = iter_csv(header, ([_csv_value(value) for value in row] for row in rows))
+
+    response = StreamingHttpResponse(content, content_type=EXPORT_FORMATS[file_format])
+    response["Content-Disposition"] = content_disposition_header(True, f"{filename}.{file_format}")
+    response["Cache-Control"] = "no-store"
+    return response
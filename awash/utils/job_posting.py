@@ -0,0 +1,83 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from awash.models import Job, VacancySequence
+from awash.utils import counters
+from awash.utils.search import index_jobs
+
+# Fields a posting may set, matching the post_job form
+JOB_FIELDS = (
+    "title", "deadline", "is_active", "description", "qualification", "experience",
+    "employment_type", "job_category", "duty_station", "job_grade", "vacancy_type",
+)
+TRUE_VALUES = {"1", "true", "yes", "y", "on", "active"}
+
+
+def build_job(data):
+    """
+    Build an unsaved Job from a dict of form, JSON or spreadsheet values.
+
+    Raises ValidationError when the row can't be posted.
+    """
+    values = {}
+    for field in JOB_FIELDS:
+        value = data.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+        if value not in (None, ""):
+            values[field] = value
+
+    if isinstance(values.get("is_active"), str):
+        values["is_active"] = values["is_active"].lower() in TRUE_VALUES
+    if isinstance(values.get("vacancy_type"), str):
+        values["vacancy_type"] = values["vacancy_type"].lower()
+    if isinstance(values.get("deadline"), str):
+        # Spreadsheet dates may come through as "2025-10-01 00:00:00"
+        deadline = values["deadline"].split()[0]
+        try:
+            values["deadline"] = parse_date(deadline) or deadline
+        except ValueError:
+            raise ValidationError({"deadline": [f"“{deadline}” is not a valid date."]})
+
+    job = Job(**values)
+    job.full_clean(exclude=["vacancy_number"], validate_unique=False)
+    return job
+
+
+def build_jobs(rows):
+    """Validate every row; returns (jobs, errors) where errors maps row number -> messages."""
+    jobs, errors = [], {}
+    for number, row in enumerate(rows, start=1):
+        try:
+            jobs.append(build_job(row))
+        except ValidationError as exc:
+            errors[number] = [
+                f"{field}: {message}" for field, messages in exc.message_dict.items() for message in messages
+            ]
+    return jobs, errors
+
+
+def post_jobs(jobs):
+    """
+    Insert many jobs in one transaction with a single bulk INSERT.
+
+    Vacancy numbers are reserved as one block from the year's sequence, and
+    the search index and dashboard counters — which bulk_create doesn't
+    trigger — are updated alongside.
+    """
+    if not jobs:
+        return []
+    year = timezone.now().year
+    with transaction.atomic():
+        first = VacancySequence.allocate(year, len(jobs))
+        for offset, job in enumerate(jobs):
+            job.vacancy_number = VacancySequence.format(year, first + offset)
+            job.prepare_for_save()
+        created = Job.objects.bulk_create(jobs)
+        index_jobs(created)
+        active = sum(1 for job in created if job.is_active)
+        counters.bump(counters.ACTIVE_JOBS, active)
+        counters.bump(counters.INACTIVE_JOBS, len(created) - active)
+    return created
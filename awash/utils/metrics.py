@@ -0,0 +1,290 @@
+import glob
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# Latency buckets in seconds; +Inf is implied
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# name -> (type, help); histograms are stored as per-bucket counts plus _sum and _count
+METRICS = {
+    "awash_http_request_duration_seconds": ("histogram", "Request latency by URL name."),
+    "awash_http_requests_total": ("counter", "Requests by URL name, method and status code."),
+    "awash_db_queries_total": ("counter", "SQL queries issued, by URL name."),
+    "awash_db_query_seconds_total": ("counter", "Time spent in SQL queries, by URL name."),
+    "awash_upload_bytes_total": ("counter", "Bytes of uploaded files accepted, by URL name."),
+    "awash_uploads_total": ("counter", "Uploaded files accepted, by URL name."),
+}
+
+_HEADER = struct.Struct("i")
+_VALUE = struct.Struct("d")
+_INITIAL_SIZE = 64 * 1024
+
+_PROCESS_FILE = re.compile(r"^metrics_(\d+)\.db$")
+# Totals of workers that have exited; kept so counters don't drop when a worker is recycled
+MERGED_FILE = "metrics_merged.db"
+
+
+def metrics_dir():
+    return str(getattr(settings, "METRICS_DIR", "metrics"))
+
+
+class MmapStore:
+    """
+    Append-only key -> float64 map in a memory-mapped file, one file per process.
+
+    Layout: a 4-byte "bytes used" header, then entries of
+    ``<int32 key length><utf-8 key, padded to 8 bytes><float64 value>``.
+    Only the owning process writes its file, so no cross-process locking
+    is needed; readers in any process sum the files (see collect()).
+    8-byte aligned doubles are written in one store, so readers never see
+    a torn value.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.positions = {}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        size = os.fstat(self.fd).st_size
+        if size == 0:
+            os.ftruncate(self.fd, _INITIAL_SIZE)
+            size = _INITIAL_SIZE
+        self.map = mmap.mmap(self.fd, size)
+        self.used = _HEADER.unpack_from(self.map, 0)[0] or 8
+        for key, _, position in _entries(self.map, self.used):
+            self.positions[key] = position
+
+    def _position(self, key):
+        position = self.positions.get(key)
+        if position is not None:
+            return position
+        encoded = key.encode()
+        padded = len(encoded) + (8 - (_HEADER.size + len(encoded)) % 8) % 8
+        needed = _HEADER.size + padded + _VALUE.size
+        while self.used + needed > len(self.map):
+            new_size = len(self.map) * 2
+            os.ftruncate(self.fd, new_size)
+            self.map.close()
+            self.map = mmap.mmap(self.fd, new_size)
+        entry = self.used
+        _HEADER.pack_into(self.map, entry, len(encoded))
+        self.map[entry + _HEADER.size:entry + _HEADER.size + len(encoded)] = encoded
+        position = entry + _HEADER.size + padded
+        _VALUE.pack_into(self.map, position, 0.0)
+        self.used += needed
+        # Publish the entry only once it is complete
+        _HEADER.pack_into(self.map, 0, self.used)
+        self.positions[key] = position
+        return position
+
+    def add(self, key, amount=1.0):
+        with self.lock:
+            position = self._position(key)
+            _VALUE.pack_into(self.map, position, _VALUE.unpack_from(self.map, position)[0] + amount)
+
+    def close(self):
+        self.map.close()
+        os.close(self.fd)
+
+
+def _entries(buffer, used):
+    offset = 8
+    while offset < used:
+        length = _HEADER.unpack_from(buffer, offset)[0]
+        key = bytes(buffer[offset + _HEADER.size:offset + _HEADER.size + length]).decode()
+        padded = length + (8 - (_HEADER.size + length) % 8) % 8
+        position = offset + _HEADER.size + padded
+        yield key, _VALUE.unpack_from(buffer, position)[0], position
+        offset = position + _VALUE.size
+
+
+_store = None
+_store_pid = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """This process's store, reopened after a fork so workers never share a file."""
+    global _store, _store_pid
+    if _store is None or _store_pid != os.getpid():
+        with _store_lock:
+            if _store is None or _store_pid != os.getpid():
+                _store = MmapStore(os.path.join(metrics_dir(), f"metrics_{os.getpid()}.db"))
+                _store_pid = os.getpid()
+    return _store
+
+
+def reset_store():
+    """Close this process's store; the next write opens one under the current METRICS_DIR."""
+    global _store, _store_pid
+    with _store_lock:
+        if _store is not None and _store_pid == os.getpid():
+            _store.close()
+        _store = _store_pid = None
+
+
+@contextmanager
+def _merge_lock(exclusive):
+    """Held exclusively while files are merged and shared while they are summed."""
+    if os.name != "posix":
+        yield
+        return
+    import fcntl
+
+    os.makedirs(metrics_dir(), exist_ok=True)
+    with open(os.path.join(metrics_dir(), ".merge.lock"), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def merge_dead_processes():
+    """
+    Fold the files of worker processes that have exited into MERGED_FILE and
+    delete them, so the directory doesn't grow with every recycled worker.
+    Returns how many files were merged.
+
+    Liveness is checked by PID, so METRICS_DIR must not be shared between
+    hosts or containers. A lock file keeps concurrent scrapes from merging
+    the same file twice.
+    """
+    if os.name != "posix":  # os.kill(pid, 0) is only a liveness probe on POSIX
+        return 0
+
+    directory = metrics_dir()
+    dead = []
+    for path in glob.glob(os.path.join(directory, "metrics_*.db")):
+        match = _PROCESS_FILE.match(os.path.basename(path))
+        if match and int(match.group(1)) != os.getpid() and not _process_alive(int(match.group(1))):
+            dead.append(path)
+    if not dead:
+        return 0
+
+    merged = 0
+    with _merge_lock(exclusive=True):
+        store = MmapStore(os.path.join(directory, MERGED_FILE))
+        try:
+            for path in dead:
+                try:
+                    with open(path, "rb") as handle:
+                        data = handle.read()
+                except FileNotFoundError:
+                    continue  # merged by another process meanwhile
+                if len(data) >= 8:
+                    for key, value, _ in _entries(data, _HEADER.unpack_from(data, 0)[0]):
+                        store.add(key, value)
+                os.unlink(path)
+                merged += 1
+        finally:
+            store.close()
+    return merged
+
+
+def _key(name, labels):
+    return json.dumps([name, sorted(labels.items())], separators=(",", ":"))
+
+
+def inc(name, amount=1.0, **labels):
+    get_store().add(_key(name, labels), amount)
+
+
+def observe(name, value, buckets=LATENCY_BUCKETS, **labels):
+    store = get_store()
+    index = bisect_left(buckets, value)
+    le = "+Inf" if index == len(buckets) else repr(buckets[index])
+    store.add(_key(f"{name}_bucket", {**labels, "le": le}), 1.0)
+    store.add(_key(f"{name}_sum", labels), value)
+    store.add(_key(f"{name}_count", labels), 1.0)
+
+
+def collect():
+    """Sum every process's store into {(sample name, labels tuple): value}."""
+    totals = {}
+    with _merge_lock(exclusive=False):
+        for path in glob.glob(os.path.join(metrics_dir(), "metrics_*.db")):
+            try:
+                with open(path, "rb") as handle:
+                    data = handle.read()
+            except OSError:
+                continue
+            if len(data) < 8:
+                continue
+            for key, value, _ in _entries(data, _HEADER.unpack_from(data, 0)[0]):
+                name, labels = json.loads(key)
+                sample = (name, tuple(tuple(pair) for pair in labels))
+                totals[sample] = totals.get(sample, 0.0) + value
+    return totals
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs):
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _number(value):
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def render(gauges=()):
+    """
+    Prometheus text exposition of the collected metrics plus ``gauges``,
+    an iterable of (name, help, value) computed at scrape time.
+    """
+    samples = collect()
+    lines = []
+    for name, (kind, help_text) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        if kind == "histogram":
+            lines.extend(_histogram_lines(name, samples))
+        else:
+            for (sample, labels), value in sorted(samples.items()):
+                if sample == name:
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+    for name, help_text, value in gauges:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(name, samples):
+    series = {}
+    for (sample, labels), value in samples.items():
+        if sample == f"{name}_bucket":
+            base = tuple(pair for pair in labels if pair[0] != "le")
+            le = dict(labels)["le"]
+            series.setdefault(base, {})[le] = value
+    lines = []
+    bounds = [repr(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+    for base in sorted(series):
+        cumulative = 0.0
+        for bound in bounds:
+            cumulative += series[base].get(bound, 0.0)
+            lines.append(f"{name}_bucket{_labels(base + (('le', bound),))} {_number(cumulative)}")
+        lines.append(f"{name}_sum{_labels(base)} {_number(samples.get((f'{name}_sum', base), 0.0))}")
+        lines.append(f"{name}_count{_labels(base)} {_number(samples.get((f'{name}_count', base), 0.0))}")
+    return lines
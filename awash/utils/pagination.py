@@ -0,0 +1,119 @@
+import base64
+import json
+
+from django.db.models import Q
+
+PAGE_SIZES = [5, 10, 25, 50]
+DEFAULT_PAGE_SIZE = 25
+
+# Largest id SQLite can store; bigger values overflow when bound as query parameters
+MAX_ID = 2 ** 63 - 1
+
+
+def parse_id(value):
+    """A database id from a query string value, or None for anything that can't be one."""
+    value = (value or "").strip()
+    if not (value.isascii() and value.isdigit()):
+        return None
+    number = int(value)
+    return number if 0 < number <= MAX_ID else None
+
+
+def get_page_size(request, default=DEFAULT_PAGE_SIZE, choices=PAGE_SIZES):
+    """Read ?page_size= from the request, falling back to ``default`` when invalid."""
+    try:
+        size = int(request.GET.get("page_size", default))
+    except (TypeError, ValueError):
+        return default
+    return size if size in choices else default
+
+
+def encode_cursor(value, pk):
+    raw = json.dumps([value.isoformat() if hasattr(value, "isoformat") else value, pk])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, field):
+    """Turn a cursor back into (value, pk); returns None for anything malformed."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, pk = json.loads(raw)
+        pk = int(pk)
+    except Exception:
+        return None
+    if not 0 <= pk <= MAX_ID:
+        return None
+    try:
+        return field.to_python(value), pk
+    except Exception:
+        return None
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+
+def keyset_older(queryset, field_name, after_key=None):
+    """``queryset`` newest first over (field_name, id), starting after the (value, pk) ``after_key``."""
+    if after_key is not None:
+        value, pk = after_key
+        queryset = queryset.filter(Q(**{f"{field_name}__lt": value}) | Q(**{field_name: value, "id__lt": pk}))
+    return queryset.order_by(f"-{field_name}", "-id")
+
+
+def keyset_paginate(queryset, field_name, after=None, before=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Newest-first keyset pagination over (field_name, id).
+
+    Only ``page_size + 1`` rows are read per page regardless of table size, so
+    the cost of a page stays flat as long as (field_name, id) is indexed.
+    ``after`` moves to older rows, ``before`` back to newer rows.
+    """
+    field = queryset.model._meta.get_field(field_name)
+    after_key = decode_cursor(after, field)
+    before_key = decode_cursor(before, field) if after_key is None else None
+
+    if before_key is not None:
+        value, pk = before_key
+        rows = list(
+            queryset.filter(Q(**{f"{field_name}__gt": value}) | Q(**{field_name: value, "id__gt": pk}))
+            .order_by(field_name, "id")[: page_size + 1]
+        )
+        if not rows:
+            return keyset_paginate(queryset, field_name, page_size=page_size)
+        has_more_newer = len(rows) > page_size
+        rows = rows[:page_size][::-1]
+        has_more_older = True
+    else:
+        rows = list(keyset_older(queryset, field_name, after_key)[: page_size + 1])
+        has_more_older = len(rows) > page_size
+        rows = rows[:page_size]
+        has_more_newer = after_key is not None
+
+    next_cursor = previous_cursor = None
+    if rows and has_more_older:
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, field_name), last.pk)
+    if rows and has_more_newer:
+        first = rows[0]
+        previous_cursor = encode_cursor(getattr(first, field_name), first.pk)
+    return KeysetPage(rows, next_cursor, previous_cursor)
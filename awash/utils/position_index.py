@@ -0,0 +1,72 @@
+import hashlib
+import threading
+import time
+from bisect import bisect_left
+
+from awash.models import Position
+
+INDEX_TTL = 300  # seconds; picks up catalog edits made through other worker processes
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 50
+
+
+class PositionIndex:
+    """
+    In-memory typeahead index over the active positions.
+
+    Titles are kept sorted by their lowercase form so prefix matches are a
+    binary search; substring matches scan the precomputed lowercase keys.
+    ``version`` is a digest of the catalog and doubles as the ETag seed.
+    """
+
+    def __init__(self, positions):
+        entries = sorted(((title.lower(), title, grade) for title, grade in positions), key=lambda e: e[0])
+        self.keys = [entry[0] for entry in entries]
+        self.entries = entries
+        digest = hashlib.sha1()
+        for _, title, grade in entries:
+            digest.update(f"{title}\x1f{grade}\x1e".encode())
+        self.version = digest.hexdigest()[:16]
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        query = " ".join((query or "").lower().split())
+        if not query:
+            return [self._result(entry) for entry in self.entries[:limit]]
+
+        results = []
+        start = bisect_left(self.keys, query)
+        for index in range(start, len(self.keys)):
+            if not self.keys[index].startswith(query) or len(results) >= limit:
+                break
+            results.append(self._result(self.entries[index]))
+        if len(results) < limit:
+            for entry in self.entries:
+                if query in entry[0] and not entry[0].startswith(query):
+                    results.append(self._result(entry))
+                    if len(results) >= limit:
+                        break
+        return results
+
+    @staticmethod
+    def _result(entry):
+        return {"title": entry[1], "grade": entry[2]}
+
+
+_index = None
+_built_at = 0.0
+_lock = threading.Lock()
+
+
+def get_index():
+    global _index, _built_at
+    with _lock:
+        if _index is None or time.monotonic() - _built_at > INDEX_TTL:
+            _index = PositionIndex(Position.objects.filter(is_active=True).values_list("title", "grade"))
+            _built_at = time.monotonic()
+        return _index
+
+
+def reset_index():
+    global _index
+    with _lock:
+        _index = None
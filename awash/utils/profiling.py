@@ -0,0 +1,172 @@
+import cProfile
+import json
+import os
+import pstats
+import re
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from itertools import count
+
+from django.conf import settings
+
+DEFAULT_PROFILING = {
+    "DIR": os.path.join(tempfile.gettempdir(), "awash-profiles"),
+    "QUERY_PARAM": "profile",
+    "HEADER": "X-Profile",
+    "SAMPLE_INTERVAL_MS": 1,
+    "KEEP": 50,
+}
+
+# Names of saved profiles; anything else is refused by profile_path()
+PROFILE_NAME = re.compile(r"^\d{8}-\d{6}-\d+-\d+$")
+PROFILE_FILES = {"prof": ".prof", "collapsed": ".collapsed"}
+
+_sequence = count(1)
+
+
+def profiling_options():
+    return {**DEFAULT_PROFILING, **getattr(settings, "PROFILING", {})}
+
+
+def profile_dir():
+    return str(profiling_options()["DIR"])
+
+
+class StackSampler:
+    """
+    Samples the call stack of one thread from a background thread.
+
+    Stacks are cut at ``anchor`` (the frame that started profiling) so they
+    hold only the profiled code, and counted as flamegraph "collapsed"
+    lines: ``outer;inner;leaf <samples>``. Samples are only taken when the
+    sampler gets the GIL, so CPU-bound stretches are sampled at roughly
+    sys.getswitchinterval() rather than ``interval``.
+    """
+
+    def __init__(self, thread_id, anchor, interval=0.001):
+        self.thread_id = thread_id
+        self.anchor = anchor
+        self.interval = interval
+        self.counts = {}
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="awash-stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and frame is not self.anchor:
+                code = frame.f_code
+                stack.append(f"{frame.f_globals.get('__name__', '?')}.{code.co_qualname}")
+                frame = frame.f_back
+            # Skip the tail end, when the profiled thread is already stopping us
+            if stack and not stack[-1].startswith(__name__):
+                key = ";".join(reversed(stack))
+                self.counts[key] = self.counts.get(key, 0) + 1
+                self.samples += 1
+
+    def collapsed(self):
+        return "".join(f"{stack} {samples}\n" for stack, samples in sorted(self.counts.items()))
+
+
+class RequestProfile:
+    """cProfile plus a StackSampler around one call; ``save()`` writes the results."""
+
+    def __init__(self, interval=0.001):
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler(threading.get_ident(), sys._getframe(1), interval)
+        self.started = None
+        self.duration = 0.0
+
+    def __enter__(self):
+        self.sampler.start()
+        self.started = time.perf_counter()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profile.disable()
+        self.duration = time.perf_counter() - self.started
+        self.sampler.stop()
+        return False
+
+    def top(self, limit=10):
+        """The functions with the most own time, as (function, own seconds, cumulative seconds, calls)."""
+        stats = pstats.Stats(self.profile).stats
+        rows = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+        return [
+            (f"{os.path.basename(filename)}:{line}({name})", round(own, 6), round(cumulative, 6), calls)
+            for (filename, line, name), (_, calls, own, cumulative, _) in rows
+        ]
+
+    def save(self, meta):
+        """Write <name>.prof, <name>.collapsed and <name>.json; returns the name."""
+        directory = profile_dir()
+        os.makedirs(directory, exist_ok=True)
+        name = f"{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}-{next(_sequence)}"
+        base = os.path.join(directory, name)
+        self.profile.dump_stats(base + ".prof")
+        with open(base + ".collapsed", "w") as handle:
+            handle.write(self.sampler.collapsed())
+        meta = {
+            "name": name,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "duration_ms": round(self.duration * 1000, 1),
+            "samples": self.sampler.samples,
+            "top": self.top(),
+            **meta,
+        }
+        # The .json goes last: list_profiles() only shows profiles whose files are complete
+        with open(base + ".json", "w") as handle:
+            json.dump(meta, handle)
+        prune_profiles(profiling_options()["KEEP"])
+        return name
+
+
+def _saved_names():
+    try:
+        entries = os.listdir(profile_dir())
+    except FileNotFoundError:
+        return []
+    names = [entry[:-5] for entry in entries if entry.endswith(".json") and PROFILE_NAME.match(entry[:-5])]
+    # Newest first; the name starts with the timestamp
+    return sorted(names, key=lambda name: (name[:15], int(name.rsplit("-", 1)[1])), reverse=True)
+
+
+def list_profiles(limit=None):
+    profiles = []
+    for name in _saved_names()[:limit]:
+        try:
+            with open(os.path.join(profile_dir(), name + ".json")) as handle:
+                profiles.append(json.load(handle))
+        except (OSError, ValueError):
+            continue
+    return profiles
+
+
+def prune_profiles(keep):
+    for name in _saved_names()[keep:]:
+        for suffix in (".json", *PROFILE_FILES.values()):
+            try:
+                os.remove(os.path.join(profile_dir(), name + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def profile_path(name, kind):
+    """Path of a saved profile file, or None for an unknown name or kind."""
+    if kind not in PROFILE_FILES or not PROFILE_NAME.match(name):
+        return None
+    path = os.path.join(profile_dir(), name + PROFILE_FILES[kind])
+    return path if os.path.exists(path) else None
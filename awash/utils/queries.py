@@ -0,0 +1,150 @@
+"""
+Querysets behind the busiest pages.
+
+The views build on these and ``manage.py check_query_plans`` runs EXPLAIN
+over the same functions, so the plans it checks are the ones actually served.
+"""
+from datetime import date, datetime, timedelta
+
+from django.contrib.auth.models import User
+from django.db.models import Count, F, OuterRef
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from awash.models import Application, Employee, Job, Promotion
+from awash.utils import counters
+from awash.utils.pagination import parse_id
+
+# Columns rendered by the job listing tables
+JOB_LIST_FIELDS = ("id", "vacancy_number", "title", "posted_date", "deadline", "is_active")
+
+# How many jobs the applicants page summarises (busiest first)
+JOB_TOTALS_LIMIT = 50
+
+APPLICANT_FILTERS = ("job", "vacancy_type", "date_from", "date_to", "employee_id")
+
+
+def job_list():
+    # Only the columns the table shows — description/qualification stay on disk
+    return Job.objects.only(*JOB_LIST_FIELDS)
+
+
+def recent_jobs(limit=5):
+    return job_list().order_by("-posted_date")[:limit]
+
+
+def applied_job_ids(employee, job_ids):
+    return Application.objects.filter(employee=employee, job_id__in=job_ids).values_list("job_id", flat=True)
+
+
+def _parse_day(value):
+    try:
+        return parse_date(value) if value else None
+    except ValueError:
+        return None
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()))
+
+
+def filter_applications(params):
+    """Applications matching the applicants page filters in ``params`` (request.GET or a dict)."""
+    filters = {name: params.get(name, "").strip() for name in APPLICANT_FILTERS}
+
+    applications = Application.objects.all()
+    # An id SQLite can't hold is ignored like any other invalid value
+    job_id = parse_id(filters["job"])
+    if job_id:
+        applications = applications.filter(job_id=job_id)
+    if filters["vacancy_type"] in dict(Job.vacancy_type_choices):
+        applications = applications.filter(job__vacancy_type=filters["vacancy_type"])
+    date_from = _parse_day(filters["date_from"])
+    date_to = _parse_day(filters["date_to"])
+    # Compare against datetimes (not applied_at__date) so the applied_at index stays usable
+    if date_from:
+        applications = applications.filter(applied_at__gte=_day_start(date_from))
+    # date.max has no next day to compare against, and every application falls before it anyway
+    if date_to and date_to < date.max:
+        applications = applications.filter(applied_at__lt=_day_start(date_to + timedelta(days=1)))
+    # A range over the UPPER(employee_id) index rather than a LIKE over every application
+    if filters["employee_id"]:
+        applications = applications.filter(employee__in=Employee.objects.id_prefix(filters["employee_id"]))
+    return filters, applications
+
+
+def applicant_rows(applications):
+    return applications.select_related("employee", "job").only(
+        "id", "applied_at", "recommendation_letter",
+        "employee__employee_id", "employee__full_name",
+        "job__id", "job__vacancy_number", "job__title", "job__vacancy_type",
+    )
+
+
+def job_totals(applications, limit=JOB_TOTALS_LIMIT):
+    """
+    Per-job application counts, busiest first.
+
+    A filtered page groups its own applications; the unfiltered page reads the
+    per-job dashboard counters so it never aggregates the whole table.
+    """
+    if applications.query.has_filters():
+        return (
+            applications.values("job_id", "job__vacancy_number", "job__title", "job__is_active")
+            .annotate(total=Count("id"))
+            .order_by("-total", "job_id")[:limit]
+        )
+    return (
+        Job.objects.filter(id__in=counters.busiest_job_ids(limit))
+        .annotate(total=counters.job_applications(OuterRef("id")))
+        .values(
+            "total",
+            job_id=F("id"),
+            job__vacancy_number=F("vacancy_number"),
+            job__title=F("title"),
+            job__is_active=F("is_active"),
+        )
+        .order_by("-total", "id")
+    )
+
+
+def employee_applications(employee):
+    return Application.objects.filter(employee=employee).select_related("job").order_by("-applied_at")
+
+
+def job_applicants(job):
+    return Application.objects.filter(job=job).select_related("employee")
+
+
+def promotion_rows():
+    return Promotion.objects.select_related("employee").order_by("-promoted_at")
+
+
+def employee_promotions(employee):
+    return Promotion.objects.filter(employee=employee).order_by("-promoted_at")
+
+
+def eligible_employee_rows(after, limit):
+    """One keyset page (plus a look-ahead row) of employees who may apply."""
+    return (
+        Employee.objects.eligible()
+        .filter(id__gt=after)
+        .order_by("id")
+        .values("id", "employee_id", "full_name", "position")[: limit + 1]
+    )
+
+
+def employee_search_rows(query, offset, limit):
+    """One page (plus a look-ahead row) of the promotion form's employee picker."""
+    return (
+        Employee.objects.search(query)
+        .order_by("full_name", "id")
+        .values("id", "full_name", "employee_id", "eligible_from")[offset: offset + limit + 1]
+    )
+
+
+def user_rows():
+    # One joined query per page; the template reads u.employee without extra queries
+    return User.objects.select_related("employee").only(
+        "id", "username", "email", "is_staff", "is_superuser", "employee__full_name"
+    ).order_by("username")
@@ -0,0 +1,105 @@
+import re
+
+from django.db import connection
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+# FTS5 index over the searchable Job columns; rowid is the Job id.
+FTS_TABLE = "awash_job_fts"
+FTS_COLUMNS = ("title", "description", "qualification", "job_category", "duty_station")
+
+# bm25 weights, same order as FTS_COLUMNS — a hit in the title counts most
+FTS_WEIGHTS = (10.0, 2.0, 2.0, 5.0, 5.0)
+
+# Control characters used as highlight markers so the text can be escaped before <mark> is added
+_HL_OPEN, _HL_CLOSE = "\x02", "\x03"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_available():
+    return connection.vendor == "sqlite"
+
+
+def build_match_query(text):
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Every word must match; the last one is treated as a prefix so results
+    show up while the user is still typing.
+    """
+    tokens = _TOKEN_RE.findall(text or "")
+    if not tokens:
+        return ""
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def index_job(job):
+    index_jobs([job])
+
+
+def index_jobs(jobs):
+    """(Re)index saved jobs; bulk_create bypasses post_save, so bulk writers call this directly."""
+    if not fts_available() or not jobs:
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [[job.pk] for job in jobs])
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(FTS_COLUMNS)}) VALUES (%s, %s, %s, %s, %s, %s)",
+            [[job.pk, *(getattr(job, column) or "" for column in FTS_COLUMNS)] for job in jobs],
+        )
+
+
+def remove_job(job_id):
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [job_id])
+
+
+def _highlighted(value):
+    return mark_safe(escape(value).replace(_HL_OPEN, "<mark>").replace(_HL_CLOSE, "</mark>"))
+
+
+def search_jobs(text, limit=25, offset=0):
+    """
+    Ranked full-text search over jobs.
+
+    Returns a list of dicts ``{"id", "rank", "title", "snippet"}`` best match
+    first; ``title`` and ``snippet`` are HTML-safe with hits wrapped in <mark>.
+    """
+    match = build_match_query(text)
+    if not match or not fts_available():
+        return []
+
+    weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+    sql = f"""
+        SELECT rowid,
+               bm25({FTS_TABLE}, {weights}) AS rank,
+               highlight({FTS_TABLE}, 0, %s, %s),
+               snippet({FTS_TABLE}, -1, %s, %s, '…', 16)
+        FROM {FTS_TABLE}
+        WHERE {FTS_TABLE} MATCH %s
+        ORDER BY rank
+        LIMIT %s OFFSET %s
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [_HL_OPEN, _HL_CLOSE, _HL_OPEN, _HL_CLOSE, match, limit, offset])
+        rows = cursor.fetchall()
+
+    return [
+        {"id": job_id, "rank": rank, "title": _highlighted(title), "snippet": _highlighted(snippet)}
+        for job_id, rank, title, snippet in rows
+    ]
+
+
+def rebuild_index():
+    """Repopulate the FTS table from awash_job (used by the migration and for repairs)."""
+    if not fts_available():
+        return
+    columns = ", ".join(FTS_COLUMNS)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(f"INSERT INTO {FTS_TABLE} (rowid, {columns}) SELECT id, {columns} FROM awash_job")
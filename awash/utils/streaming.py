@@ -0,0 +1,178 @@
+import csv
+import zipfile
+from datetime import date, datetime
+from xml.sax.saxutils import escape
+
+# Bytes collected before a chunk is handed to the response
+FLUSH_SIZE = 64 * 1024
+
+_XML_INVALID = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+
+
+class _Sink:
+    """
+    Write-only buffer that streaming writers fill and generators drain.
+
+    It has no tell()/seek(), so zipfile treats it as unseekable and writes
+    data descriptors after each member instead of seeking back.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        self.size = 0
+        return data
+
+
+def iter_file(storage, name, chunk_size=FLUSH_SIZE):
+    """Read a stored file lazily, opening it only when iteration starts."""
+    with storage.open(name, "rb") as handle:
+        while chunk := handle.read(chunk_size):
+            yield chunk
+
+
+def iter_csv(header, rows):
+    """Encode rows as UTF-8 CSV (with a BOM so Excel detects the encoding), in ~FLUSH_SIZE chunks."""
+
+    class Line:
+        def write(self, value):
+            return value
+
+    writer = csv.writer(Line())
+    buffer = ["\ufeff" + writer.writerow(header)]
+    size = 0
+    for row in rows:
+        line = writer.writerow(row)
+        buffer.append(line)
+        size += len(line)
+        if size >= FLUSH_SIZE:
+            yield "".join(buffer).encode()
+            buffer.clear()
+            size = 0
+    yield "".join(buffer).encode()
+
+
+def iter_zip(members, compression=zipfile.ZIP_DEFLATED):
+    """
+    Stream a ZIP archive built from ``(name, size, chunks)`` members.
+
+    ``chunks`` is any iterable of bytes and ``size`` its length when known
+    (None otherwise; members over 2 GB must give it so ZIP64 is used).
+    Output is yielded as it is produced, so memory use is bounded by
+    FLUSH_SIZE plus the compressor's window whatever the archive size.
+    """
+    sink = _Sink()
+    with zipfile.ZipFile(sink, "w", compression=compression) as archive:
+        for name, size, chunks in members:
+            info = zipfile.ZipInfo(name, date_time=datetime.now().timetuple()[:6])
+            info.compress_type = compression
+            if size is not None:
+                info.file_size = size
+            with archive.open(info, "w") as member:
+                for chunk in chunks:
+                    member.write(chunk)
+                    if sink.size >= FLUSH_SIZE:
+                        yield sink.drain()
+            # Send each finished member right away so the client sees progress early
+            if sink.size:
+                yield sink.drain()
+    yield sink.drain()
+
+
+# Minimal SpreadsheetML package: one worksheet, inline strings, no styles
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{title}" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+_XLSX_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_XLSX_SHEET_END = "</sheetData></worksheet>"
+
+
+def _xlsx_cell(value):
+    if value is None or value == "":
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f"<c><v>{value}</v></c>"
+    if isinstance(value, datetime):
+        value = value.strftime("%Y-%m-%d %H:%M")
+    elif isinstance(value, date):
+        value = value.isoformat()
+    text = escape(str(value).translate(_XML_INVALID))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_sheet_rows(header, rows):
+    yield _XLSX_SHEET_START.encode()
+    buffer = ["<row>" + "".join(_xlsx_cell(value) for value in header) + "</row>"]
+    for row in rows:
+        buffer.append("<row>" + "".join(_xlsx_cell(value) for value in row) + "</row>")
+        if len(buffer) >= 500:
+            yield "".join(buffer).encode()
+            buffer.clear()
+    buffer.append(_XLSX_SHEET_END)
+    yield "".join(buffer).encode()
+
+
+def iter_xlsx(header, rows, title="Sheet1"):
+    """
+    Stream a single-sheet .xlsx workbook.
+
+    The worksheet XML is written row by row into a streamed ZIP, so unlike
+    openpyxl (whose write-only mode still assembles the package at save())
+    the first bytes go out immediately and nothing is spooled to disk.
+    """
+    title = escape(title.translate(str.maketrans("", "", "[]:*?/\\"))[:31] or "Sheet1", {'"': "&quot;"})
+    return iter_zip([
+        ("[Content_Types].xml", None, [_XLSX_CONTENT_TYPES.encode()]),
+        ("_rels/.rels", None, [_XLSX_ROOT_RELS.encode()]),
+        ("xl/workbook.xml", None, [_XLSX_WORKBOOK.format(title=title).encode()]),
+        ("xl/_rels/workbook.xml.rels", None, [_XLSX_WORKBOOK_RELS.encode()]),
+        ("xl/worksheets/sheet1.xml", None, _xlsx_sheet_rows(header, rows)),
+    ])
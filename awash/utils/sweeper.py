@@ -0,0 +1,73 @@
+import logging
+import threading
+import time
+
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from awash.models import Application, Job
+from awash.utils import counters
+
+logger = logging.getLogger(__name__)
+
+
+def expired_jobs(today):
+    return Job.objects.filter(is_active=True, deadline__lt=today)
+
+
+def expired_job_ids(today, batch_size):
+    """The next batch to deactivate, oldest deadline first."""
+    return expired_jobs(today).order_by("deadline").values_list("id", flat=True)[:batch_size]
+
+
+def deactivate_expired_jobs(today=None, batch_size=None, time_budget=None):
+    """
+    Flip is_active to False for every active job whose deadline has passed.
+
+    Without ``batch_size`` this is a single UPDATE served by the partial
+    deadline index over active jobs. With it, rows are flipped in batches of that
+    size, stopping early once ``time_budget`` seconds have been spent.
+    Returns (rows_changed, finished). Dashboard counters are moved in the
+    same transaction since queryset updates don't send signals.
+    """
+    today = today or timezone.now().date()
+    started = time.monotonic()
+    changed = 0
+
+    while True:
+        with transaction.atomic():
+            if batch_size:
+                expired = Job.objects.filter(id__in=list(expired_job_ids(today, batch_size)))
+            else:
+                expired = expired_jobs(today)
+            closed_applications = Application.objects.filter(job__in=expired.values("id")).count()
+            count = expired.update(is_active=False)
+            if count:
+                counters.bump(counters.ACTIVE_JOBS, -count)
+                counters.bump(counters.INACTIVE_JOBS, count)
+                counters.bump(counters.OPEN_APPLICATIONS, -closed_applications)
+        changed += count
+
+        if not batch_size or count < batch_size:
+            return changed, True
+        if time_budget is not None and time.monotonic() - started >= time_budget:
+            return changed, False
+
+
+def run_periodic_sweeper(interval, batch_size=1000, time_budget=5.0, stop=None):
+    """
+    Run deactivate_expired_jobs every ``interval`` seconds until ``stop``
+    (a threading.Event) is set. Blocks; meant for a dedicated worker process
+    (``manage.py deactivate_expired_jobs --loop``), not for web workers.
+    """
+    stop = stop or threading.Event()
+    while not stop.is_set():
+        try:
+            changed, finished = deactivate_expired_jobs(batch_size=batch_size, time_budget=time_budget)
+            if changed:
+                logger.info("Deactivated %d expired jobs%s", changed, "" if finished else " (budget reached)")
+        except Exception:
+            logger.exception("Expired job sweep failed")
+        finally:
+            close_old_connections()
+        stop.wait(interval)
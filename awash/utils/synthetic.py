@@ -0,0 +1,270 @@
+import random
+import time
+from datetime import datetime, time as dt_time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.utils import timezone
+
+from awash.models import (
+    PROMOTION_COOLDOWN,
+    Allemployee_record,
+    Application,
+    Employee,
+    Job,
+    Position,
+    Promotion,
+    VacancySequence,
+)
+from awash.utils.counters import rebuild_counters
+from awash.utils.search import rebuild_index
+
+# Volumes of a production-sized bank, used when a count isn't given
+DEFAULT_VOLUMES = {
+    "records": 100_000,
+    "employees": 50_000,
+    "jobs": 10_000,
+    "applications": 2_000_000,
+    "promotions": 200_000,
+}
+DEFAULT_PASSWORD = "Awash@12345"
+
+NAMES = (
+    "Abebe", "Almaz", "Bekele", "Birtukan", "Dawit", "Eleni", "Fikru", "Genet", "Haile", "Hana",
+    "Kebede", "Lemlem", "Meron", "Mulugeta", "Selam", "Solomon", "Tadesse", "Tigist", "Yonas",
+    "Zewditu", "Getachew", "Mekdes", "Tesfaye", "Rahel", "Henok", "Saron", "Yared", "Bethlehem",
+    "Kidus", "Liya", "Abdi", "Chaltu", "Gemechu", "Lensa", "Tolosa", "Ayantu", "Girma", "Mesfin",
+)
+# (duty station, weight) — head office and large cities carry most vacancies
+DUTY_STATIONS = (
+    ("Addis Ababa", 40), ("Adama", 6), ("Bahir Dar", 6), ("Hawassa", 6), ("Mekelle", 5),
+    ("Dire Dawa", 5), ("Gondar", 4), ("Jimma", 4), ("Dessie", 3), ("Harar", 2), ("Arba Minch", 2),
+    ("Shashemene", 2), ("Debre Markos", 2), ("Nekemte", 2), ("Bishoftu", 2),
+)
+JOB_CATEGORIES = (("IT & Digital", 2), ("Accounting and Finance", 5), ("Marketing & Sales", 3))
+EMPLOYMENT_TYPES = (("Permanent", 85), ("Contract", 15))
+JOB_GRADES = ("V", "VI", "VII", "VIII", "IX", "X", "XI", "XII")
+DEADLINE_DAYS = (7, 10, 14, 21, 30, 45)
+HISTORY_DAYS = 3 * 365
+
+
+class SyntheticData:
+    """
+    Bulk generator of realistic-looking HR data for scale testing.
+
+    Rows are built in chunks and written with bulk_create, so what signals
+    normally maintain (dashboard counters, the job search index) is rebuilt
+    once at the end. Every User shares one
+    password hash computed up front — hashing per user would dominate the
+    run. ``seed`` makes a run reproducible; IDs use ``prefix`` so they
+    never collide with real AIB employee IDs and reruns append.
+    """
+
+    def __init__(self, seed=None, prefix="SYN", batch_size=5000, password=DEFAULT_PASSWORD, log=None):
+        self.rng = random.Random(seed)
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.password = password
+        self.log = log or (lambda message: None)
+        self.now = timezone.now()
+        self.promotion_plan = []  # (employee index, date), filled by create_employees
+
+    def _weighted(self, pairs, k):
+        values, weights = zip(*pairs)
+        return self.rng.choices(values, weights=weights, k=k)
+
+    def _name(self):
+        return " ".join(self.rng.choice(NAMES) for _ in range(3))
+
+    def _positions(self):
+        titles = list(Position.objects.filter(is_active=True).values_list("title", flat=True))
+        if not titles:
+            raise ValueError("The position catalog is empty; run migrate or add positions before generating data.")
+        # A few positions (clerks, customer service) are far more common than the rest
+        self.rng.shuffle(titles)
+        return [(title, 1 / (rank + 1) ** 0.8) for rank, title in enumerate(titles)]
+
+    def _chunks(self, count):
+        for start in range(0, count, self.batch_size):
+            yield start, min(self.batch_size, count - start)
+
+    def _timed(self, label, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        count = result if isinstance(result, int) else len(result)
+        self.log(f"{label}: {count:,} rows in {time.perf_counter() - started:.1f}s")
+        return result
+
+    def generate(self, records=0, employees=0, jobs=0, applications=0, promotions=0):
+        """Create the requested volumes; ``employees`` are registered users drawn from ``records``."""
+        records = max(records, employees)
+        positions = self._positions()
+        with transaction.atomic():
+            record_rows = self._timed("employee records", self.create_records, records)
+            employee_rows = self._timed("employees + users", self.create_employees, record_rows[:employees], positions, promotions)
+            job_rows = self._timed("jobs", self.create_jobs, jobs, positions)
+            application_count = self._timed("applications", self.create_applications, job_rows, employee_rows, applications)
+            promotion_rows = self._timed("promotions", self.create_promotions, employee_rows)
+            rebuild_index()
+            rebuild_counters()
+        return {
+            "records": len(record_rows),
+            "employees": len(employee_rows),
+            "jobs": len(job_rows),
+            "applications": application_count,
+            "promotions": len(promotion_rows),
+        }
+
+    def create_records(self, count):
+        first = Allemployee_record.objects.filter(employee_id__startswith=f"{self.prefix}/").count() + 1
+        rows = []
+        for start, size in self._chunks(count):
+            batch = [
+                Allemployee_record(
+                    employee_id=f"{self.prefix}/{first + n:06d}/{self.rng.randint(2005, self.now.year)}",
+                    full_name=self._name(),
+                )
+                for n in range(start, start + size)
+            ]
+            Allemployee_record.objects.bulk_create(batch)
+            rows.extend((record.employee_id, record.full_name) for record in batch)
+        return rows
+
+    def create_employees(self, records, positions, promotions):
+        password = make_password(self.password)
+        # Promotion history is planned first so last_promotion_date/eligible_from go in with the INSERT
+        self.promotion_plan = []
+        latest = {}
+        for _ in range(promotions if records else 0):
+            index = self.rng.randrange(len(records))
+            day = (self.now - timedelta(days=self.rng.randint(0, 6 * 365))).date()
+            self.promotion_plan.append((index, day))
+            if index not in latest or day > latest[index]:
+                latest[index] = day
+
+        employees = []
+        titles = self._weighted(positions, len(records)) if records else []
+        for start, size in self._chunks(len(records)):
+            users = []
+            for employee_id, full_name in records[start:start + size]:
+                first_name, _, last_name = full_name.partition(" ")
+                users.append(User(
+                    username=employee_id,
+                    password=password,
+                    first_name=first_name,
+                    last_name=last_name,
+                    email=f"{employee_id.replace('/', '.').lower()}@awashbank.com",
+                ))
+            User.objects.bulk_create(users)
+            batch = []
+            for offset, user in enumerate(users):
+                index = start + offset
+                last = latest.get(index)
+                batch.append(Employee(
+                    user=user,
+                    employee_id=user.username,
+                    full_name=records[index][1],
+                    position=titles[index],
+                    email=user.email,
+                    phone=f"+2519{self.rng.randint(10_000_000, 99_999_999)}",
+                    is_registered=True,
+                    last_promotion_date=last,
+                    eligible_from=last + PROMOTION_COOLDOWN if last else None,
+                ))
+            employees.extend(Employee.objects.bulk_create(batch))
+        return employees
+
+    def create_jobs(self, count, positions):
+        today = self.now.date()
+        jobs = []
+        titles = self._weighted(positions, count)
+        stations = self._weighted(DUTY_STATIONS, count)
+        categories = self._weighted(JOB_CATEGORIES, count)
+        employment_types = self._weighted(EMPLOYMENT_TYPES, count)
+        for index in range(count):
+            # Skewed towards recent postings; the newest few weeks are still open
+            posted = self.now - timedelta(days=min(self.rng.expovariate(1 / 240), HISTORY_DAYS), hours=self.rng.random() * 24)
+            deadline = posted.date() + timedelta(days=self.rng.choice(DEADLINE_DAYS))
+            jobs.append(Job(
+                title=titles[index],
+                posted_date=posted,
+                deadline=deadline,
+                is_active=deadline >= today,
+                description=f"{titles[index]} vacancy at the {stations[index]} district.",
+                qualification="BA/BSc in a related field",
+                experience=f"{self.rng.randint(0, 8)} years",
+                employment_type=employment_types[index],
+                job_category=categories[index],
+                duty_station=stations[index],
+                job_grade=self.rng.choice(JOB_GRADES),
+                vacancy_type="internal" if self.rng.random() < 0.3 else "external",
+            ))
+        jobs.sort(key=lambda job: job.posted_date)
+
+        by_year = {}
+        for job in jobs:
+            by_year.setdefault(job.posted_date.year, []).append(job)
+        for year, year_jobs in by_year.items():
+            first = VacancySequence.allocate(year, len(year_jobs))
+            for offset, job in enumerate(year_jobs):
+                job.vacancy_number = VacancySequence.format(year, first + offset)
+
+        # posted_date is auto_now_add, which bulk_create overwrites; put the planned dates back
+        planned = [job.posted_date for job in jobs]
+        created = []
+        for start, size in self._chunks(len(jobs)):
+            created.extend(Job.objects.bulk_create(jobs[start:start + size]))
+        for job, posted in zip(created, planned):
+            job.posted_date = posted
+        Job.objects.bulk_update(created, ["posted_date"], batch_size=self.batch_size)
+        return created
+
+    def create_applications(self, jobs, employees, count):
+        if not jobs or not employees:
+            return 0
+        # Heavy-tailed popularity: most vacancies draw a handful, a few draw thousands
+        weights = [self.rng.lognormvariate(0, 1.2) for _ in jobs]
+        total_weight = sum(weights)
+        employee_ids = [employee.id for employee in employees]
+        # The biggest table by far: plain executemany over tuples skips building millions of
+        # model instances and bulk_create's 999-parameter batches
+        sql = (
+            f"INSERT INTO {Application._meta.db_table} (employee_id, job_id, applied_at, recommendation_letter) "
+            "VALUES (%s, %s, %s, '')"
+        )
+        adapt = connection.ops.adapt_datetimefield_value
+        created = 0
+        pending = []
+        with connection.cursor() as cursor:
+            for job, weight in zip(jobs, weights):
+                applicants = min(round(count * weight / total_weight), len(employee_ids))
+                closes = min(timezone.make_aware(datetime.combine(job.deadline, dt_time.max)), self.now)
+                window = max((closes - job.posted_date).total_seconds(), 60)
+                for employee_id in self.rng.sample(employee_ids, applicants):
+                    applied_at = job.posted_date + timedelta(seconds=self.rng.random() * window)
+                    pending.append((employee_id, job.id, adapt(applied_at)))
+                if len(pending) >= self.batch_size:
+                    cursor.executemany(sql, pending)
+                    created += len(pending)
+                    pending = []
+            cursor.executemany(sql, pending)
+        return created + len(pending)
+
+    def create_promotions(self, employees):
+        created = []
+        pending = []
+        for index, day in self.promotion_plan:
+            grade = self.rng.randrange(len(JOB_GRADES) - 1)
+            pending.append(Promotion(
+                employee_id=employees[index].id,
+                old_grade=JOB_GRADES[grade],
+                new_grade=JOB_GRADES[grade + 1],
+                promoted_at=day,
+                remarks="Annual performance promotion" if self.rng.random() < 0.8 else "Acting assignment confirmed",
+            ))
+            if len(pending) >= self.batch_size:
+                created.extend(Promotion.objects.bulk_create(pending))
+                pending = []
+        created.extend(Promotion.objects.bulk_create(pending))
+        return created
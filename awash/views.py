@@ -1,52 +1,64 @@
 # accounts/views.py
+import json
+import os
+import zipfile
 from django.contrib.auth.models import User
 from django.contrib.auth.hashers import make_password
 from django.shortcuts import render, redirect, get_object_or_404
-from awash.models import Employee, Job, Application, Promotion, Allemployee_record
-from django.http import JsonResponse
+from awash.models import Employee, Job, Application, Promotion, Allemployee_record, Position
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.crypto import constant_time_compare
+from django.utils.http import content_disposition_header
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_POST
 from django.contrib.auth import authenticate, login, logout
 from django.contrib import messages
-from awash.utils.position_list import POSITION_LIST  # Import the position list
+from awash.utils import metrics, position_index, queries
+from awash.utils.profiling import list_profiles, profile_path, profiling_options
+from awash.utils.pagination import PAGE_SIZES, KeysetPage, get_page_size, keyset_paginate, parse_id
+from awash.utils.search import search_jobs
+from awash.utils.counters import dashboard_counts
+from awash.utils.employee_lookup import invalidate_employee, lookup_employee
+from awash.utils.job_posting import build_jobs, post_jobs
+from awash.utils.downloads import serve_file
+from awash.utils.exports import APPLICANT_COLUMNS, PROMOTION_COLUMNS, export_response
+from awash.utils.streaming import iter_file, iter_zip
+from awash.storage import release_blob
 from django.contrib.auth import authenticate, login
 from django.contrib import messages
-from datetime import timedelta
-from django.utils import timezone
+from datetime import date
+from urllib.parse import urlencode
+from django.core.paginator import Paginator
+from django.db.models import Q
+
+
+# Most jobs accepted by one post_jobs_bulk request
+BULK_POST_LIMIT = 1000
+
+# Deepest page of ranked search results that all_jobs will serve
+SEARCH_MAX_PAGE = 1000
+
 def get_employee(request):
     emp_id = request.GET.get("employee_id", "").strip()
     if not emp_id:
         return JsonResponse({"error": "not_found"})
 
-    # Check Employee table
-    try:
-        emp = Employee.objects.get(employee_id=emp_id)
-
-        # If Employee exists but User does not exist, allow registration
-        if not emp.user or not User.objects.filter(username=emp.employee_id).exists():
-            emp.is_registered = False
-            emp.save()
+    # Read-only and cached; register/delete_user invalidate the entry
+    return JsonResponse(lookup_employee(emp_id))
 
-        if emp.is_registered:
-            return JsonResponse({"error": "already_registered"})
-        else:
-            return JsonResponse({
-                "full_name": emp.full_name,
-                "department": emp.position or "",
-                "email": emp.email or "",
-                "is_registered": False,
-            })
-
-    except Employee.DoesNotExist:
-        # Check Allemployee_record
-        try:
-            record = Allemployee_record.objects.get(employee_id=emp_id)
-            return JsonResponse({
-                "full_name": record.full_name,
-                "department": "",  # optional default
-                "email": "",       # optional
-                "is_registered": False,
-            })
-        except Allemployee_record.DoesNotExist:
-            return JsonResponse({"error": "not_found"})
+@cache_control(max_age=position_index.INDEX_TTL)
+@condition(etag_func=lambda request: position_index.get_index().version)
+def position_search(request):
+    """Typeahead for the position fields of the registration and promotion forms."""
+    try:
+        limit = min(max(int(request.GET.get("limit", position_index.DEFAULT_LIMIT)), 1), position_index.MAX_LIMIT)
+    except ValueError:
+        limit = position_index.DEFAULT_LIMIT
+    results = position_index.get_index().search(request.GET.get("q", ""), limit)
+    return JsonResponse({"results": results})
 
 def home(request):
     return render(request, "awash/home.html")
@@ -63,10 +75,16 @@ def register(request):
             messages.error(request, "Passwords do not match")
             return render(request, "awash/register.html")
 
+        # The field is a free-text typeahead, so only catalog titles are accepted
+        position = Position.catalog_title(position)
+        if position is None:
+            messages.error(request, "Choose your position from the list.")
+            return render(request, "awash/register.html")
+
         try:
             record = Allemployee_record.objects.get(employee_id=employee_id)
         except Allemployee_record.DoesNotExist:
-            return render(request, "awash/register.html", {"error": "Employee not found. Contact HR.", "positions": POSITION_LIST})
+            return render(request, "awash/register.html", {"error": "Employee not found. Contact HR."})
 
         # Check if Employee account already exists
         employee, created = Employee.objects.get_or_create(employee_id=employee_id, defaults={
@@ -75,28 +93,36 @@ def register(request):
             "email": email
         })
 
-        if employee.is_registered:
-            return render(request, "awash/register.html", {"has_account": True, "positions": POSITION_LIST})
-
-        # Create Django User
-        user = User.objects.create_user(
-            username=employee.employee_id,
-            email=email,
-            password=password1,
-            first_name=employee.full_name.split()[0],
-            last_name=" ".join(employee.full_name.split()[1:])
-        )
+        # The username is what's unique: a User left over from a half-finished registration blocks
+        # it even when the employee isn't linked, while a stale is_registered flag alone doesn't
+        if User.objects.filter(username=employee.employee_id).exists():
+            return render(request, "awash/register.html", {"has_account": True})
 
-        employee.user = user
-        employee.position = position
-        employee.email = email
-        employee.is_registered = True
-        employee.save()
+        try:
+            with transaction.atomic():
+                # Create Django User
+                user = User.objects.create_user(
+                    username=employee.employee_id,
+                    email=email,
+                    password=password1,
+                    first_name=employee.full_name.split()[0],
+                    last_name=" ".join(employee.full_name.split()[1:])
+                )
+
+                employee.user = user
+                employee.position = position
+                employee.email = email
+                employee.is_registered = True
+                employee.save()
+        except IntegrityError:
+            # A concurrent registration for the same ID got there first
+            return render(request, "awash/register.html", {"has_account": True})
+        invalidate_employee(employee.employee_id)
         messages.success(request, "Registration successful! You can now log in.")
 
         return redirect("login")
 
-    return render(request, "awash/register.html", {"positions": POSITION_LIST})
+    return render(request, "awash/register.html")
 def login_user(request):
     if request.method == "POST":
         employee_id = request.POST.get("employee_id")
@@ -122,7 +148,7 @@ def employee_dashboard(request):
         return redirect("login")
 
     try:
-        employee = Employee.objects.get(employee_id=request.user.username)
+        employee = request.user.employee  # cached on the user, so base.html doesn't query it again
     except Employee.DoesNotExist:
         employee = None  # or handle the error
 
@@ -136,35 +162,9 @@ def hr_dashboard(request):
     if not request.user.is_authenticated or not request.user.is_staff:
         return redirect("login")
 
-    employees = Employee.objects.all()
-    jobs = Job.objects.all()
-    active_jobs = Job.objects.filter(is_active=True).count()
-    inactive_jobs = Job.objects.filter(is_active=False).count()
-    recent_jobs = Job.objects.all().order_by("-posted_date")[:5]
-    total_applications = Application.objects.count()
-
-    # Promotion stats
-    today = timezone.now().date()
-    one_year_ago = today - timedelta(days=365)
-    six_months_ago = today - timedelta(days=182)  # approx
-    three_months_ago = today - timedelta(days=91)  # approx
-
-    promotions = Promotion.objects.all()
-    promoted_this_year = promotions.filter(promoted_at__gte=one_year_ago).count()
-    promoted_last_6_months = promotions.filter(promoted_at__gte=six_months_ago).count()
-    promoted_last_3_months = promotions.filter(promoted_at__gte=three_months_ago).count()
-
-    context = {
-        "employees": employees,
-        "job": jobs,
-        "active_jobs": active_jobs,
-        "inactive_jobs": inactive_jobs,
-        "recent_jobs": recent_jobs,
-        "total_applications": total_applications,
-        "promoted_this_year": promoted_this_year,
-        "promoted_last_6_months": promoted_last_6_months,
-        "promoted_last_3_months": promoted_last_3_months,
-    }
+    # Counters are kept up to date by awash/signals.py
+    context = dashboard_counts()
+    context["recent_jobs"] = queries.recent_jobs()
     return render(request, "awash/hr_dashboard.html", context)
 
 def post_job(request):
@@ -207,18 +207,80 @@ def post_job(request):
 
     return render(request, "awash/post_job.html")
 
+@require_POST
+def post_jobs_bulk(request):
+    """
+    Post many jobs at once from a JSON body: {"jobs": [{"title": ..., "deadline": "YYYY-MM-DD", ...}]}.
+    Nothing is written unless every row is valid.
+    """
+    if not request.user.is_authenticated or not request.user.is_staff:
+        return JsonResponse({"error": "forbidden"}, status=403)
+
+    try:
+        rows = json.loads(request.body).get("jobs")
+    except (ValueError, AttributeError):
+        rows = None
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        return JsonResponse({"error": "expected a JSON object with a \"jobs\" list"}, status=400)
+    if len(rows) > BULK_POST_LIMIT:
+        return JsonResponse({"error": f"at most {BULK_POST_LIMIT} jobs per request"}, status=400)
+
+    jobs, errors = build_jobs(rows)
+    if errors:
+        return JsonResponse({"errors": errors}, status=400)
+    created = post_jobs(jobs)
+    return JsonResponse(
+        {"created": [{"id": job.id, "vacancy_number": job.vacancy_number} for job in created]},
+        status=201,
+    )
+
 def all_jobs(request):
-    jobs = Job.objects.all().order_by("-posted_date")
-    applied_job_ids = []
+    page_size = get_page_size(request)
+    query = request.GET.get("q", "").strip()
+    page_number = 1
+    if query:
+        try:
+            page_number = max(int(request.GET.get("page", 1)), 1)
+        except ValueError:
+            page_number = 1
+        # Also keeps the OFFSET inside SQLite's 64-bit integer range
+        if page_number > SEARCH_MAX_PAGE:
+            raise Http404("That page contains no results")
+        hits = search_jobs(query, limit=page_size + 1, offset=(page_number - 1) * page_size)
+        found = queries.job_list().in_bulk([hit["id"] for hit in hits[:page_size]])
+        results = []
+        for hit in hits[:page_size]:
+            job = found.get(hit["id"])
+            if job:
+                job.search_title = hit["title"]
+                job.search_snippet = hit["snippet"]
+                results.append(job)
+        jobs = KeysetPage(
+            results,
+            next_cursor=page_number + 1 if len(hits) > page_size else None,
+            previous_cursor=page_number - 1 if page_number > 1 else None,
+        )
+    else:
+        jobs = keyset_paginate(
+            queries.job_list(),
+            "posted_date",
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            page_size=page_size,
+        )
+    applied_job_ids = set()
     if request.user.is_authenticated:
         try:
             employee = request.user.employee  # Assuming OneToOne link
-            applied_job_ids = Application.objects.filter(employee=employee).values_list('job_id', flat=True)
+            applied_job_ids = set(queries.applied_job_ids(employee, [job.id for job in jobs]))
         except Employee.DoesNotExist:
-            applied_job_ids = []
+            applied_job_ids = set()
     context = {
         "jobs": jobs,
-        "applied_job_ids": applied_job_ids
+        "applied_job_ids": applied_job_ids,
+        "page_size": page_size,
+        "page_sizes": PAGE_SIZES,
+        "query": query,
     }
     return render(request, "awash/all_jobs.html", context)
 def view_detail(request, id):
@@ -232,7 +294,7 @@ def view_detail(request, id):
 
 def apply(request, id):
     job = get_object_or_404(Job, id=id)
-    employee = Employee.objects.get(user=request.user)  # logged-in employee
+    employee = request.user.employee  # logged-in employee, cached for base.html
 
     # 🔹 Check promotion eligibility before applying
     if not employee.can_apply():
@@ -242,15 +304,34 @@ def apply(request, id):
     if request.method == "POST":
         recommendation_letter = request.FILES.get("recommendation_letter")
 
-        application, created = Application.objects.get_or_create(
-            employee=employee,
-            job=job,
-            defaults={"recommendation_letter": recommendation_letter}
-        )
+        # Hash and store the letter before taking the write lock; storing it
+        # takes the file's reference, which the new row then owns
+        letter_field = Application._meta.get_field("recommendation_letter")
+        letter_name = ""
+        if recommendation_letter:
+            letter_name = letter_field.storage.save(
+                letter_field.generate_filename(None, recommendation_letter.name),
+                recommendation_letter,
+                max_length=letter_field.max_length,
+            )
+
+        application = Application(employee=employee, job=job, recommendation_letter=letter_name)
+        application._letter_stored = bool(letter_name)
+        try:
+            with transaction.atomic():
+                application.save(force_insert=True)
+            created = True
+        except IntegrityError:
+            created = False  # already applied, possibly in a concurrent request
+        if not created and letter_name:
+            release_blob(letter_name, letter_field.storage)
 
         if not created:
             messages.warning(request, "You have already applied for this job.")
         else:
+            if recommendation_letter:
+                metrics.inc("awash_uploads_total", view="apply")
+                metrics.inc("awash_upload_bytes_total", recommendation_letter.size, view="apply")
             messages.success(request, f"Application submitted for {job.title}!")
 
         return redirect("all_jobs")  # redirect to job list
@@ -258,19 +339,76 @@ def apply(request, id):
     return render(request, "awash/apply.html", {"job": job})
 
 def applicants_list(request):
-    jobs = Job.objects.all().order_by("-posted_date")
-
     if not request.user.is_authenticated or not request.user.is_staff:
         messages.error(request, "You must be logged in as HR to view this page.")
         return redirect("login")
 
-    applications = Application.objects.select_related("employee", "job").all()
-    
+    page_size = get_page_size(request)
+    filters, applications = queries.filter_applications(request.GET)
+
+    page = keyset_paginate(
+        queries.applicant_rows(applications),
+        "applied_at",
+        after=request.GET.get("after"),
+        before=request.GET.get("before"),
+        page_size=page_size,
+    )
+
+    active_filters = {key: value for key, value in filters.items() if value}
     context = {
-        "jobs": jobs,
-        "applications": applications,
+        "applications": page,
+        # Per-job totals for the current filters
+        "job_totals": queries.job_totals(applications),
+        "job_totals_limit": queries.JOB_TOTALS_LIMIT,
+        "filters": filters,
+        "filter_query": urlencode({**active_filters, "page_size": page_size}),
+        "vacancy_types": Job.vacancy_type_choices,
+        "page_size": page_size,
+        "page_sizes": PAGE_SIZES,
     }
-    return render(request, "awash/applicants.html", context) 
+    return render(request, "awash/applicants.html", context)
+
+def export_applicants(request):
+    """Applicants matching the applicants page filters (e.g. ?job=<id>) as CSV or XLSX."""
+    if not request.user.is_authenticated or not request.user.is_staff:
+        messages.error(request, "You must be logged in as HR to view this page.")
+        return redirect("login")
+
+    filters, applications = queries.filter_applications(request.GET)
+    filename = "applicants"
+    job_id = parse_id(filters["job"])
+    if job_id:
+        vacancy_number = Job.objects.filter(id=job_id).values_list("vacancy_number", flat=True).first()
+        filename = f"applicants_{(vacancy_number or str(job_id)).replace('/', '-')}"
+    return export_response(
+        applications.order_by("job_id", "-applied_at", "-id"),
+        APPLICANT_COLUMNS,
+        filename,
+        request.GET.get("format", "csv"),
+        title="Applicants",
+    )
+
+
+def eligible_employees(request, id):
+    """JSON list of employees outside the promotion cooldown who may apply to an internal vacancy."""
+    if not request.user.is_authenticated or not request.user.is_staff:
+        return JsonResponse({"error": "forbidden"}, status=403)
+
+    job = get_object_or_404(Job.objects.only("id", "vacancy_number", "vacancy_type"), id=id)
+    if job.vacancy_type != "internal":
+        return JsonResponse({"error": "not_internal"}, status=400)
+
+    limit = get_page_size(request, default=50, choices=[25, 50, 100, 500])
+    try:
+        after = int(request.GET.get("after", 0))
+    except ValueError:
+        after = 0
+    rows = list(queries.eligible_employee_rows(after, limit))
+    return JsonResponse({
+        "vacancy_number": job.vacancy_number,
+        "results": rows[:limit],
+        "next": rows[limit - 1]["id"] if len(rows) > limit else None,
+    })
 
 def view_applicants_per_job(request, id):
     if not request.user.is_authenticated or not request.user.is_staff:
@@ -278,26 +416,96 @@ def view_applicants_per_job(request, id):
         return redirect("login")
 
     job = get_object_or_404(Job, id=id)
-    applications = Application.objects.filter(job=job).select_related("employee")
+    page_size = get_page_size(request, default=50)
+    # One keyset page over the (job, applied_at) index instead of every applicant at once
+    applications = keyset_paginate(
+        queries.job_applicants(job),
+        "applied_at",
+        after=request.GET.get("after"),
+        before=request.GET.get("before"),
+        page_size=page_size,
+    )
 
     context = {
         "job": job,
         "applications": applications,
+        "page_query": urlencode({"page_size": page_size}),
     }
     return render(request, "awash/view_applicants_per_job.html", context)
 
 
+def download_letter(request, id):
+    """Recommendation letter of one application, for HR or the employee who applied."""
+    if not request.user.is_authenticated:
+        return redirect("login")
+
+    application = get_object_or_404(
+        Application.objects.select_related("employee").only(
+            "recommendation_letter", "employee__employee_id", "employee__user_id"
+        ),
+        id=id,
+    )
+    # Someone else's letter is reported as missing rather than forbidden
+    if not request.user.is_staff and application.employee.user_id != request.user.id:
+        raise Http404
+    letter = application.recommendation_letter
+    if not letter or not letter.storage.exists(letter.name):
+        raise Http404
+
+    extension = os.path.splitext(letter.name)[1]
+    filename = f"{application.employee.employee_id.replace('/', '-')}-recommendation{extension}"
+    return serve_file(request, letter.storage, letter.name, filename)
+
+
+def download_job_letters(request, id):
+    """Every recommendation letter for a job in one streamed ZIP, named by employee ID."""
+    if not request.user.is_authenticated or not request.user.is_staff:
+        messages.error(request, "You must be logged in as HR to view this page.")
+        return redirect("login")
+
+    job = get_object_or_404(Job.objects.only("id", "vacancy_number"), id=id)
+    storage = Application._meta.get_field("recommendation_letter").storage
+    letters = (
+        Application.objects.filter(job=job)
+        .exclude(recommendation_letter="")
+        .exclude(recommendation_letter__isnull=True)
+        .order_by("employee__employee_id")
+        .values_list("employee__employee_id", "recommendation_letter")
+    )
+
+    def members():
+        missing = []
+        for employee_id, name in letters.iterator(chunk_size=500):
+            safe_id = employee_id.replace("/", "-")
+            try:
+                size = storage.size(name)
+            except OSError:
+                missing.append(employee_id)
+                continue
+            yield f"{safe_id}{os.path.splitext(name)[1]}", size, iter_file(storage, name)
+        if missing:
+            yield "MISSING.txt", None, ["Letters not found on disk for:\n".encode(), "\n".join(missing).encode()]
+
+    # Letters are PDFs and images, already compressed; storing them keeps the stream cheap
+    response = StreamingHttpResponse(iter_zip(members(), compression=zipfile.ZIP_STORED), content_type="application/zip")
+    filename = f"letters_{(job.vacancy_number or str(job.id)).replace('/', '-')}.zip"
+    response["Content-Disposition"] = content_disposition_header(True, filename)
+    response["Cache-Control"] = "no-store"
+    return response
+
+
 def my_applications(request):
     if not request.user.is_authenticated:
         return redirect("login")
 
     try:
-        employee = Employee.objects.get(user=request.user)
+        # Through the accessor so base.html's request.user.employee reuses the cached row
+        employee = request.user.employee
     except Employee.DoesNotExist:
         messages.error(request, "Employee profile not found.")
         return redirect("employee_dashboard")
 
-    applications = Application.objects.filter(employee=employee).select_related("job").order_by("-applied_at")
+    applications = queries.employee_applications(employee)
 
     return render(request, "awash/my_applications.html", {"applications": applications})
 
@@ -349,13 +557,32 @@ def all_users(request):
         messages.error(request, "You must be logged in as HR to view this page.")
         return redirect("login")
 
-    employees = Employee.objects.select_related("user").all().order_by("full_name")
-    users = User.objects.all()  # rename variable to 'users' to avoid confusion
-    employee_file = Allemployee_record.objects.all()
+    tab = "directory" if request.GET.get("tab") == "directory" else "users"
+    query = request.GET.get("q", "").strip()
+    page_size = get_page_size(request)
+
+    if tab == "users":
+        rows = queries.user_rows()
+        if query:
+            rows = rows.filter(
+                Q(username__istartswith=query) | Q(email__istartswith=query) | Q(employee__full_name__icontains=query)
+            )
+    else:
+        # Directory records nobody has registered an account for yet
+        rows = Allemployee_record.objects.exclude(
+            employee_id__in=Employee.objects.filter(is_registered=True).values("employee_id")
+        ).order_by("employee_id")
+        if query:
+            rows = rows.filter(Q(employee_id__istartswith=query) | Q(full_name__icontains=query))
+
+    page = Paginator(rows, page_size).get_page(request.GET.get("page"))
     context = {
-        "employees": employees,
-        "users": users,
-        "employee_file":employee_file
+        "tab": tab,
+        "page": page,
+        "query": query,
+        "page_size": page_size,
+        "page_sizes": PAGE_SIZES,
+        "filter_query": urlencode({"tab": tab, "q": query, "page_size": page_size}),
     }
     return render(request, "awash/users.html", context)
 def delete_user(request, id):
@@ -370,6 +597,7 @@ def delete_user(request, id):
 
     username = user_to_delete.username
     user_to_delete.delete()  # delete the user
+    invalidate_employee(username)
     messages.success(request, f"User '{username}' and linked employee record (if any) have been deleted successfully.")
 
     return redirect("users")
@@ -387,10 +615,15 @@ def promotion(request):
 
         try:
             employee = Employee.objects.get(id=employee_id)
-        except Employee.DoesNotExist:
+        except (Employee.DoesNotExist, ValueError):
             messages.error(request, "Employee not found.")
             return redirect("promotion")
 
+        new_position = Position.catalog_title(new_position)
+        if new_position is None:
+            messages.error(request, "Choose the new position from the list.")
+            return redirect("promotion")
+
         # Check eligibility
         if not employee.can_apply():
             messages.error(request, f"Employee {employee.full_name} is not eligible for promotion (promoted within last year).")
@@ -405,27 +638,65 @@ def promotion(request):
         )
 
         # Update employee details
-        employee.last_promotion_date = promotion_date
-        employee.save(update_fields=["last_promotion_date"])
+        employee.set_last_promotion_date(promotion_date)
+        employee.save(update_fields=["last_promotion_date", "eligible_from"])
 
         messages.success(request, f"Employee {employee.full_name} promoted to {new_position} successfully.")
         return redirect("promotion")
 
-    employees = Employee.objects.all().order_by("full_name")
-    context = {
-        "employees": employees,
-        "positions": POSITION_LIST
-    }
-    return render(request, "awash/promotion.html", context)
+    # The employee picker is filled on demand from employee_search
+    return render(request, "awash/promotion.html")
+def employee_search(request):
+    """Paginated typeahead for the promotion form's employee picker."""
+    if not request.user.is_authenticated or not request.user.is_staff:
+        return JsonResponse({"error": "forbidden"}, status=403)
+
+    page_size = get_page_size(request, default=20, choices=[10, 20, 50])
+    try:
+        page_number = max(int(request.GET.get("page", 1)), 1)
+    except ValueError:
+        page_number = 1
+    # Past SEARCH_MAX_PAGE the OFFSET could overflow SQLite's integer; nobody pages that far
+    if page_number > SEARCH_MAX_PAGE:
+        return JsonResponse({"results": [], "page": page_number, "has_more": False})
+    offset = (page_number - 1) * page_size
+    rows = list(queries.employee_search_rows(request.GET.get("q", ""), offset, page_size))
+    today = date.today()
+    results = [
+        {
+            "id": row["id"],
+            "full_name": row["full_name"],
+            "employee_id": row["employee_id"],
+            "eligible": row["eligible_from"] is None or row["eligible_from"] <= today,
+            "eligible_from": row["eligible_from"],
+        }
+        for row in rows[:page_size]
+    ]
+    return JsonResponse({"results": results, "page": page_number, "has_more": len(rows) > page_size})
+
 def promotion_list(request):
     if not request.user.is_authenticated or not request.user.is_staff:
         messages.error(request, "You must be logged in as HR to view this page.")
         return redirect("login")
 
-    promotions = Promotion.objects.select_related("employee").order_by("-promoted_at")
+    promotions = queries.promotion_rows()
     return render(request, "awash/promotion_list.html", {"promotions": promotions})
 
 
+def export_promotions(request):
+    if not request.user.is_authenticated or not request.user.is_staff:
+        messages.error(request, "You must be logged in as HR to view this page.")
+        return redirect("login")
+
+    return export_response(
+        Promotion.objects.order_by("-promoted_at", "-id"),
+        PROMOTION_COLUMNS,
+        f"promotions_{date.today():%Y-%m-%d}",
+        request.GET.get("format", "csv"),
+        title="Promotions",
+    )
+
+
 def delete_promotion(request, id):
     if not request.user.is_authenticated or not request.user.is_staff:
         messages.error(request, "You must be logged in as HR to perform this action.")
@@ -436,12 +707,104 @@ def delete_promotion(request, id):
     promotion.delete()
 
     # Optionally, clear the last_promotion_date if this was the latest promotion
-    latest_promo = Promotion.objects.filter(employee=employee).order_by('-promoted_at').first()
+    latest_promo = queries.employee_promotions(employee).first()
     if latest_promo:
-        employee.last_promotion_date = latest_promo.promoted_at
+        employee.set_last_promotion_date(latest_promo.promoted_at)
     else:
-        employee.last_promotion_date = None
-    employee.save(update_fields=['last_promotion_date'])
+        employee.set_last_promotion_date(None)
+    employee.save(update_fields=['last_promotion_date', 'eligible_from'])
 
     messages.success(request, f"Promotion record for {employee.full_name} has been deleted.")
-    return redirect("promotion_list")
\ No newline at end of file
+    return redirect("promotion_list")
+
+
+def _metrics_allowed(request):
+    token = settings.METRICS_TOKEN
+    if token and constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return True
+    if getattr(settings, "METRICS_PUBLIC", False) or request.META.get("REMOTE_ADDR") in settings.INTERNAL_IPS:
+        return True
+    return request.user.is_authenticated and request.user.is_staff
+
+
+def metrics_view(request):
+    """Prometheus text exposition, summed over every worker process."""
+    if not _metrics_allowed(request):
+        return HttpResponse("Unauthorized\n", status=401, content_type="text/plain")
+
+    metrics.merge_dead_processes()
+    # Counters are kept up to date by awash/signals.py, so a scrape never counts rows
+    counts = dashboard_counts()
+    gauges = [
+        ("awash_active_jobs", "Jobs open for applications.", counts["active_jobs"]),
+        ("awash_pending_applications", "Applications to jobs that are still open.", counts["open_applications"]),
+    ]
+    return HttpResponse(metrics.render(gauges), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def _database_ok():
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            return cursor.fetchone() == (1,)
+    except Exception:
+        return False
+
+
+def healthz(request):
+    """Liveness: the process answers and can reach the database."""
+    if not _database_ok():
+        return JsonResponse({"status": "error", "database": False}, status=503)
+    return JsonResponse({"status": "ok"})
+
+
+_migrations_applied = False
+
+
+def _migrations_ok():
+    # Only checked until it first succeeds; migrations don't get un-applied under a running worker
+    global _migrations_applied
+    if not _migrations_applied:
+        executor = MigrationExecutor(connection)
+        _migrations_applied = not executor.migration_plan(executor.loader.graph.leaf_nodes())
+    return _migrations_applied
+
+
+def _metrics_ok():
+    try:
+        metrics.get_store()
+        return True
+    except OSError:
+        return False
+
+
+def readyz(request):
+    """Readiness: database reachable, fully migrated, and the metrics store writable."""
+    checks = {"database": _database_ok()}
+    checks["migrations"] = checks["database"] and _migrations_ok()
+    checks["metrics"] = _metrics_ok()
+    ready = all(checks.values())
+    return JsonResponse({"status": "ok" if ready else "error", **checks}, status=200 if ready else 503)
+
+
+def profiles(request):
+    """Recent request profiles recorded by ProfilerMiddleware."""
+    if not request.user.is_authenticated or not request.user.is_staff:
+        messages.error(request, "You must be logged in as HR to view this page.")
+        return redirect("login")
+
+    options = profiling_options()
+    return render(request, "awash/profiles.html", {
+        "profiles": list_profiles(),
+        "param": options["QUERY_PARAM"],
+        "header": options["HEADER"],
+    })
+
+
+def download_profile(request, name, kind):
+    if not request.user.is_authenticated or not request.user.is_staff:
+        raise Http404
+    path = profile_path(name, kind)
+    if path is None:
+        raise Http404
+    return FileResponse(open(path, "rb"), as_attachment=True, filename=os.path.basename(path))
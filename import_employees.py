@@ -1,26 +1,29 @@
+import argparse
 import os
+
 import django
-import pandas as pd
 
 # Set Django settings module
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'job_application.settings')  # replace 'yourproject' with your project name
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'job_application.settings')
 django.setup()
 
-from awash.models import Allemployee_record  # replace 'yourapp' with your app name
+from awash.utils.employee_import import DEFAULT_BATCH_SIZE, expand_sources, load_allemployee_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load the bank employee directory into Allemployee_record.")
+    parser.add_argument("files", nargs="*", default=["employees.xlsx"], help="Excel files to load (default: employees.xlsx)")
+    parser.add_argument("--sheet", action="append", dest="sheets", help="Sheet to read; repeat for several (default: first sheet)")
+    parser.add_argument("--all-sheets", action="store_true", help="Read every sheet of every file")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per INSERT transaction")
+    parser.add_argument("--workers", type=int, default=1, help="Parse several sheets/files in parallel processes")
+    args = parser.parse_args()
 
-# Load the Excel file
-df = pd.read_excel('employees.xlsx')  # ensure the path is correct
+    sources = expand_sources(args.files, sheets=args.sheets, all_sheets=args.all_sheets)
+    summary = load_allemployee_records(sources, batch_size=args.batch_size, workers=args.workers)
+    print(summary)
 
-# Loop through rows and insert
-for index, row in df.iterrows():
-    employee_id = str(row['employee_id']).strip()
-    full_name = str(row['full_name']).strip()
 
-    obj, created = Allemployee_record.objects.get_or_create(
-        employee_id=employee_id,
-        defaults={'full_name': full_name}
-    )
-    if created:
-        print(f"Created: {employee_id} - {full_name}")
-    else:
-        print(f"Skipped (already exists): {employee_id}")
+# Worker processes started with spawn/forkserver re-import this file; only the parent loads
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -29,6 +31,16 @@ ALLOWED_HOSTS = []
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# Let the front-end server send protected files: "nginx" (X-Accel-Redirect to
+# SENDFILE_URL_PREFIX, an `internal` location aliased to MEDIA_ROOT) or
+# "apache"/"lighttpd" (X-Sendfile). None streams them from Django.
+SENDFILE_BACKEND = None
+SENDFILE_URL_PREFIX = '/protected/'
+
+# Seconds between sweeps of `manage.py deactivate_expired_jobs --loop`, which runs
+# as its own worker process; alternatively schedule the command from cron.
+JOB_SWEEP_INTERVAL = 300
 # Application definition
 
 INSTALLED_APPS = [
@@ -42,20 +54,73 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'awash.middleware.MetricsMiddleware',
+    'awash.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'awash.middleware.ProfilerMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Thresholds for awash.middleware.RequestTimingMiddleware: a request slower than
+# SLOW_REQUEST_MS, with a query slower than SLOW_QUERY_MS or issuing more than
+# MAX_QUERIES queries is logged as one JSON line on the "awash.requests" logger.
+# SERVER_TIMING_HEADER: True, 'staff' (staff users only) or False.
+REQUEST_TIMING = {
+    'SLOW_REQUEST_MS': 500,
+    'SLOW_QUERY_MS': 100,
+    'MAX_QUERIES': 50,
+    'SERVER_TIMING_HEADER': 'staff',
+}
+
+# Per-process metric files behind /metrics, summed at scrape time. Every worker
+# of one deployment must share it; clear it when deploying so counters restart.
+METRICS_DIR = os.environ.get('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'awash-metrics'))
+# Per-process files are checked by PID, so keep the directory local to one host.
+# Test runs (see TEST_RUNNER) and benchmark_views write to a temporary directory instead.
+# /metrics answers requests with an "Authorization: Bearer <METRICS_TOKEN>"
+# header, staff users and INTERNAL_IPS; METRICS_PUBLIC = True opens it to anyone.
+# Behind a proxy on the same host every request comes from 127.0.0.1, so don't list it there.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+TEST_RUNNER = 'awash.tests.runner.AwashTestRunner'
+METRICS_PUBLIC = False
+INTERNAL_IPS = [ip for ip in os.environ.get('INTERNAL_IPS', '').split(',') if ip]
+
+# awash.middleware.ProfilerMiddleware: staff requests carrying ?profile=1 or an
+# X-Profile header are profiled into DIR (the newest KEEP are kept, listed at
+# /profiles/). 'DIR': None turns the switch off.
+PROFILING = {
+    'DIR': os.environ.get('PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'awash-profiles')),
+    'QUERY_PARAM': 'profile',
+    'HEADER': 'X-Profile',
+    'SAMPLE_INTERVAL_MS': 1,
+    'KEEP': 50,
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'json_line': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'request_log': {'class': 'logging.StreamHandler', 'formatter': 'json_line'},
+    },
+    'loggers': {
+        'awash.requests': {'handlers': ['request_log'], 'level': 'INFO', 'propagate': False},
+    },
+}
+
 ROOT_URLCONF = 'job_application.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates plus render timing for RequestTimingMiddleware
+        'BACKEND': 'awash.template_backends.TimedDjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -81,6 +146,29 @@ DATABASES = {
     }
 }
 
+# DB_PROFILE=production tunes SQLite for concurrent writers (many applications
+# near a deadline): WAL lets readers run alongside the single writer, write
+# transactions take the lock up front (BEGIN IMMEDIATE) so they queue on the
+# busy timeout instead of failing with "database is locked", and connections
+# are kept open between requests. The PRAGMAs are applied per connection by
+# awash.utils.db.configure_sqlite (connection_created).
+DB_PROFILE = os.environ.get('DB_PROFILE', 'development')
+SQLITE_PRAGMAS = {}
+
+if DB_PROFILE == 'production':
+    DATABASES['default'].update({
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {'transaction_mode': 'IMMEDIATE'},
+    })
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',  # durable across app crashes; only an OS crash can lose the last commits
+        'busy_timeout': 20000,  # ms
+        'mmap_size': 256 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -16,11 +16,10 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from django.conf.urls.static import static
-
-from django.conf import settings
 
+# MEDIA_ROOT is not served directly: letters go through awash.views.download_letter,
+# which checks who is asking before handing the file over.
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('awash.urls')),
-]+ static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+]
\ No newline at end of file